@@ -6,6 +6,7 @@ and processing calendar events through the sync engine.
 """
 
 import logging
+import os
 from typing import Dict, Any, cast, List
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -14,7 +15,7 @@ from backend.core.security import validate_api_key
 from backend.services.google_calendar.config_loader import load_multi_account_config
 from backend.services.google_calendar.account_manager import AccountManager
 from backend.services.google_calendar.sync_engine import CalendarSyncEngine
-from backend.services.google_calendar.webhook_handler import GoogleCalendarWebhookHandler
+from backend.services.google_calendar.webhook_handler import GoogleCalendarWebhookHandler, WEBHOOK_DEBOUNCE_SECONDS
 from backend.services.google_calendar.polling_scheduler import CalendarPollingScheduler
 from backend.models.calendar import WebhookProcessingResult
 
@@ -36,10 +37,19 @@ def get_calendar_services():
     
     if config is None:
         # Initialize services
+        from backend.core.config import settings
+        
         config = load_multi_account_config()
-        account_manager = AccountManager(config)
+        token_cache_path = settings.google_token_cache_path
+        account_manager = AccountManager(
+            config,
+            token_cache_path=os.path.expanduser(token_cache_path) if token_cache_path else None
+        )
         sync_engine = CalendarSyncEngine(config, account_manager)
-        webhook_handler = GoogleCalendarWebhookHandler(config, account_manager, sync_engine)
+        # Batch notification bursts; close_calendar_services syncs what is still queued
+        webhook_handler = GoogleCalendarWebhookHandler(
+            config, account_manager, sync_engine, debounce_seconds=WEBHOOK_DEBOUNCE_SECONDS
+        )
         polling_scheduler = CalendarPollingScheduler(config, account_manager, sync_engine)
         
         # Start polling scheduler
@@ -56,6 +66,13 @@ def get_calendar_services():
     }
 
 
+def close_calendar_services() -> None:
+    """Sync webhook notifications still queued, if calendar services were initialized."""
+    if webhook_handler is not None:
+        webhook_handler.close()
+        logger.info("Flushed queued webhook syncs")
+
+
 @router.post("/google-calendar")
 async def handle_google_calendar_webhook(
     request: Request,
@@ -78,7 +95,7 @@ async def handle_google_calendar_webhook(
         logger.info(f"Received Google Calendar webhook: {webhook_data}")
         
         # Process webhook
-        result = handler.handle_webhook(webhook_data)  # type: ignore
+        result = await handler.handle_webhook_async(webhook_data)  # type: ignore
         
         # Return the result directly
         return result  # type: ignore
@@ -348,44 +365,31 @@ async def setup_webhook_subscriptions(
         success_count = 0
         error_count = 0
         
-        for calendar_info in monitored_calendars:
-            try:
-                # Create webhook subscription for each calendar
-                result = webhook_handler.create_webhook_subscription(  # type: ignore
-                    calendar_id=calendar_info.calendar_id,
-                    account_id=calendar_info.account_id,
-                    callback_url=webhook_url,
-                    channel_token=None  # Optional security token
-                )
-                
-                if result.success:
-                    success_count += 1
-                    logger.info(f"Created webhook subscription for calendar {calendar_info.calendar_id}")
-                else:
-                    error_count += 1
-                    logger.error(f"Failed to create webhook subscription for calendar {calendar_info.calendar_id}: {result.error}")
-                
-                results.append({
-                    "calendar_id": calendar_info.calendar_id,
-                    "flow_name": calendar_info.flow_name,
-                    "account_id": calendar_info.account_id,
-                    "success": result.success,
-                    "channel_id": result.channel_id if result.success else None,
-                    "resource_id": result.resource_id if result.success else None,
-                    "expiration": result.expiration if result.success else None,
-                    "error": result.error if not result.success else None
-                })
-                
-            except Exception as e:
+        # Create webhook subscriptions for all calendars, batched per account
+        subscription_results = webhook_handler.create_webhook_subscriptions(
+            monitored_calendars,
+            callback_url=webhook_url,
+            channel_token=None  # Optional security token
+        )
+        
+        for calendar_info, result in zip(monitored_calendars, subscription_results):
+            if result.success:
+                success_count += 1
+                logger.info(f"Created webhook subscription for calendar {calendar_info.calendar_id}")
+            else:
                 error_count += 1
-                logger.error(f"Exception creating webhook subscription for calendar {calendar_info.calendar_id}: {e}")
-                results.append({
-                    "calendar_id": calendar_info.calendar_id,
-                    "flow_name": calendar_info.flow_name,
-                    "account_id": calendar_info.account_id,
-                    "success": False,
-                    "error": str(e)
-                })
+                logger.error(f"Failed to create webhook subscription for calendar {calendar_info.calendar_id}: {result.error}")
+            
+            results.append({
+                "calendar_id": calendar_info.calendar_id,
+                "flow_name": calendar_info.flow_name,
+                "account_id": calendar_info.account_id,
+                "success": result.success,
+                "channel_id": result.channel_id if result.success else None,
+                "resource_id": result.resource_id if result.success else None,
+                "expiration": result.expiration if result.success else None,
+                "error": result.error if not result.success else None
+            })
         
         return {
             "message": f"Webhook setup completed: {success_count} successful, {error_count} failed",
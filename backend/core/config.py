@@ -81,6 +81,9 @@ class Settings(BaseSettings):
     max_google_accounts: int = Field(default=10, description="Maximum accounts to scan")
     max_sync_flows: int = Field(default=50, description="Maximum sync flows to scan")
     
+    # Google OAuth2 access token persistence (disabled when unset)
+    google_token_cache_path: Optional[str] = Field(None, description="JSON file to persist Google access tokens across restarts (e.g., ~/.cache/personal-automation-hub/gcal_tokens.json)")
+    
     # OpenRouter LLM settings
     openrouter_api_key: Optional[str] = Field(None, description="OpenRouter API key")
     openrouter_categorization_model: str = Field(default=DEFAULT_CATEGORIZATION_MODEL, description="Model for email categorization")
@@ -3,7 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.api.v1.webhooks.notion import router as notion_router
-from backend.api.v1.webhooks.google_calendar import router as google_calendar_router, get_calendar_services
+from backend.api.v1.webhooks.google_calendar import router as google_calendar_router, get_calendar_services, close_calendar_services
 from backend.api.v1.webhooks.gmail import router as gmail_router
 
 
@@ -22,8 +22,13 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Shutdown (if needed)
+    # Shutdown
     print("📴 Application shutting down")
+    try:
+        # Sync calendars whose webhook notifications are still batched
+        close_calendar_services()
+    except Exception as e:
+        print(f"❌ Failed to flush queued calendar syncs: {e}")
 
 
 app = FastAPI(title="Personal Automation Hub", lifespan=lifespan)
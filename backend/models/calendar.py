@@ -4,16 +4,23 @@ Pydantic models for Google Calendar sync configuration and operations.
 This module defines:
 - SyncFlow: Configuration for calendar synchronization flows (one source → one target)
 - CalendarEvent: Event data structure
+- BusyBlockKey: Lightweight identity of a busy block used for lookups
 - BusyBlockSearchCriteria: Search criteria for finding busy blocks
 - MultiAccountConfig: Complete configuration for all accounts and sync flows
 """
 
-from datetime import datetime
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field, model_validator
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Dict, Sequence, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from backend.models.google_account import GoogleAccount
 
+# Resource states Google Calendar sends in push notifications
+WEBHOOK_RESOURCE_STATES: frozenset[str] = frozenset({'sync', 'exists', 'not_exists'})
+
+# The only channel type Google Calendar supports for push notifications
+WEB_HOOK_CHANNEL_TYPE = 'web_hook'
+
 
 class SyncFlow(BaseModel):
     """Configuration for a calendar synchronization flow (one source → one target)."""
@@ -45,6 +52,31 @@ class SyncFlow(BaseModel):
             raise ValueError('target_account_id must be positive')
         
         return self
+    
+    def busy_block_key(self, event: 'CalendarEvent') -> 'BusyBlockKey':
+        """Calculate the busy block this flow needs for an event.
+        
+        Args:
+            event: Source calendar event
+            
+        Returns:
+            BusyBlockKey with target calendar and calculated timing
+        """
+        start_time = event.start_time.replace(second=0, microsecond=0)
+        end_time = event.end_time.replace(second=0, microsecond=0)
+        
+        # For all-day events, don't apply offsets - keep original timing
+        if not event.all_day:
+            # Apply offsets only for regular events (start_offset is negative, end_offset is positive)
+            start_time = start_time + timedelta(minutes=self.start_offset)
+            end_time = end_time + timedelta(minutes=self.end_offset)
+        
+        return BusyBlockKey(
+            target_account_id=self.target_account_id,
+            target_calendar_id=self.target_calendar_id,
+            start_time=start_time,
+            end_time=end_time
+        )
 
 
 class CalendarEvent(BaseModel):
@@ -98,6 +130,20 @@ class CalendarEvent(BaseModel):
         return self.all_day
 
 
+class BusyBlockKey(NamedTuple):
+    """Identity of a busy block: where it lives and when it runs.
+    
+    Used instead of a full BusyBlock model when the sync engine only needs to
+    look up or compare busy blocks.
+    """
+    
+    target_account_id: int
+    target_calendar_id: str
+    start_time: datetime
+    end_time: datetime
+    title: str = "Busy"
+
+
 class BusyBlockSearchCriteria(BaseModel):
     """Search criteria for finding existing busy blocks."""
     
@@ -141,27 +187,26 @@ class BusyBlock(BaseModel):
         Returns:
             BusyBlock instance with calculated timing
         """
-        # Calculate busy block timing
-        start_time = event.start_time.replace(second=0, microsecond=0)
-        end_time = event.end_time.replace(second=0, microsecond=0)
-        
-        # For all-day events, don't apply offsets - keep original timing
-        if event.is_all_day():
-            busy_start = start_time
-            busy_end = end_time
-        else:
-            # Apply offsets only for regular events (start_offset is negative, end_offset is positive)
-            from datetime import timedelta
-            busy_start = start_time + timedelta(minutes=flow.start_offset)
-            busy_end = end_time + timedelta(minutes=flow.end_offset)
+        return cls.from_key(event, flow.busy_block_key(event))
+    
+    @classmethod
+    def from_key(cls, event: CalendarEvent, key: BusyBlockKey) -> 'BusyBlock':
+        """Create a BusyBlock from an already calculated busy block key.
         
+        Args:
+            event: Source calendar event
+            key: Busy block key calculated by SyncFlow.busy_block_key
+            
+        Returns:
+            BusyBlock instance
+        """
         return cls(
             source_event=event,
-            target_account_id=flow.target_account_id,
-            target_calendar_id=flow.target_calendar_id,
-            start_time=busy_start,
-            end_time=busy_end,
-            title="Busy"
+            target_account_id=key.target_account_id,
+            target_calendar_id=key.target_calendar_id,
+            start_time=key.start_time,
+            end_time=key.end_time,
+            title=key.title
         )
 
 
@@ -344,9 +389,8 @@ class GoogleCalendarWebhookData(BaseModel):
     
     @model_validator(mode='after')
     def validate_resource_state(self) -> 'GoogleCalendarWebhookData':
-        valid_states = ['sync', 'exists', 'not_exists']
-        if self.resource_state not in valid_states:
-            raise ValueError(f'resource_state must be one of: {valid_states}')
+        if self.resource_state not in WEBHOOK_RESOURCE_STATES:
+            raise ValueError(f'resource_state must be one of: {sorted(WEBHOOK_RESOURCE_STATES)}')
         return self
 
 
@@ -399,7 +443,7 @@ class PushNotificationChannel(BaseModel):
     """Google Calendar push notification channel configuration."""
     
     id: str = Field(..., description="Unique channel identifier")
-    type: str = Field(default="web_hook", description="Channel type")
+    type: str = Field(default=WEB_HOOK_CHANNEL_TYPE, description="Channel type")
     address: str = Field(..., description="Webhook URL to receive notifications")
     token: Optional[str] = Field(None, description="Verification token")
     expiration: Optional[int] = Field(None, description="Expiration time as Unix timestamp")
@@ -407,7 +451,7 @@ class PushNotificationChannel(BaseModel):
     
     @model_validator(mode='after')
     def validate_type(self) -> 'PushNotificationChannel':
-        if self.type != "web_hook":
+        if self.type != WEB_HOOK_CHANNEL_TYPE:
             raise ValueError('type must be "web_hook" for Google Calendar webhooks')
         return self
 
@@ -436,10 +480,15 @@ class SystemHealthStatus(BaseModel):
 class MultiAccountConfig(BaseModel):
     """Complete calendar synchronization configuration for multiple accounts."""
     
-    accounts: List[GoogleAccount] = Field(..., description="List of Google accounts")
-    sync_flows: List[SyncFlow] = Field(..., description="List of sync flows")
+    accounts: Sequence[GoogleAccount] = Field(..., description="List of Google accounts")
+    sync_flows: Sequence[SyncFlow] = Field(..., description="List of sync flows")
     sync_interval_minutes: int = Field(default=60, description="Sync interval in minutes (default: hourly)")
     
+    # Account ID index, rebuilt whenever the accounts it was built from change
+    _account_index: Dict[int, GoogleAccount] = PrivateAttr(default_factory=dict)
+    # Snapshot of the indexed accounts
+    _indexed_accounts: Tuple[GoogleAccount, ...] = PrivateAttr(default=())
+    
     @model_validator(mode='after')
     def validate_fields(self) -> 'MultiAccountConfig':
         # Validate sync_interval_minutes
@@ -473,10 +522,20 @@ class MultiAccountConfig(BaseModel):
     
     def get_account_by_id(self, account_id: int) -> Optional[GoogleAccount]:
         """Get account by ID."""
-        for account in self.accounts:
-            if account.account_id == account_id:
-                return account
-        return None
+        accounts = self.accounts
+        indexed = self._indexed_accounts
+        # An indexed tuple can't change; other sequences are compared account by account,
+        # since an account may have been replaced in place
+        if accounts is not indexed and (
+            len(accounts) != len(indexed) or any(account is not old for account, old in zip(accounts, indexed))
+        ):
+            account_index: Dict[int, GoogleAccount] = {}
+            for account in accounts:
+                # First account wins, matching a linear scan
+                account_index.setdefault(account.account_id, account)
+            self._account_index = account_index
+            self._indexed_accounts = tuple(accounts)
+        return self._account_index.get(account_id)
     
     def get_flows_for_source_account(self, account_id: int) -> List[SyncFlow]:
         """Get all sync flows that use the specified account as source."""
@@ -7,59 +7,188 @@ This module provides:
 - Account validation and testing
 """
 
+import atexit
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from backend.models.google_account import GoogleAccount
 from backend.models.calendar import MultiAccountConfig
-from backend.services.google_calendar.client import GoogleCalendarClient, GoogleCalendarError
+from backend.services.google_calendar.client import (
+    GoogleCalendarClient,
+    GoogleCalendarError,
+    get_cached_access_token
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-account API calls
+MAX_ACCOUNT_WORKERS = 8
+
+# Credential fields every account must have
+REQUIRED_CREDENTIAL_FIELDS = ('client_id', 'client_secret', 'refresh_token')
+
+# Default upper bound on cached clients per AccountManager
+DEFAULT_MAX_CLIENTS = 64
+
+# How long get_account_summary reuses a per-account summary
+SUMMARY_CACHE_TTL_SECONDS = 30.0
+
+# Process-wide HTTP session for OAuth2 token requests, shared by all clients so
+# token refreshes reuse pooled connections instead of opening new TLS sessions
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount(
+    'https://',
+    HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.3))
+)
+
+
+# Managers with a token cache, saved once at exit; weak so exit registration doesn't keep them alive
+_TOKEN_CACHE_MANAGERS: "weakref.WeakSet[AccountManager]" = weakref.WeakSet()
+
+
+def _save_token_caches() -> None:
+    """Save the token cache of every live AccountManager that has one."""
+    for account_manager in list(_TOKEN_CACHE_MANAGERS):
+        account_manager._save_token_cache()
+
+
+atexit.register(_save_token_caches)
+
 
 class AccountManagerError(Exception):
     """Exception raised when account management operations fail."""
     pass
 
 
+def _credential_fingerprint(account: GoogleAccount) -> int:
+    """Fingerprint the credentials a client was created with.
+    
+    Args:
+        account: Account to fingerprint
+        
+    Returns:
+        Hash of the account's OAuth2 credentials
+    """
+    return hash((account.client_id, account.client_secret, account.refresh_token))
+
+
+def _token_owner_digest(account: GoogleAccount) -> str:
+    """Stable digest of the credentials an access token was issued for.
+    
+    Stored next to persisted tokens so a changed refresh token invalidates them,
+    without writing the credentials themselves to disk.
+    
+    Args:
+        account: Account the token belongs to
+        
+    Returns:
+        SHA-256 hex digest of the account's client ID and refresh token
+    """
+    return hashlib.sha256(f"{account.client_id}:{account.refresh_token}".encode()).hexdigest()
+
+
 class AccountManager:
     """Manages multiple Google Calendar accounts and their clients."""
     
-    def __init__(self, config: MultiAccountConfig) -> None:
+    __slots__ = (
+        'config',
+        'max_clients',
+        '_clients',
+        '_client_fingerprints',
+        '_accounts',
+        '_summary_cache',
+        '_clients_lock',
+        '_inflight',
+        '_token_cache_path',
+        '_token_cache_lock',
+        '_persisted_tokens',
+        '__weakref__',
+    )
+    
+    def __init__(self, config: MultiAccountConfig, token_cache_path: Optional[str] = None,
+                 max_clients: int = DEFAULT_MAX_CLIENTS) -> None:
         """Initialize AccountManager with configuration.
         
         Args:
             config: Multi-account configuration containing all accounts and sync flows
+            token_cache_path: JSON file to persist access tokens across restarts (optional)
+            max_clients: Maximum number of cached clients; least recently used are evicted
         """
+        if max_clients < 1:
+            raise AccountManagerError("max_clients must be at least 1")
+        
         self.config = config
-        self._clients: Dict[int, GoogleCalendarClient] = {}
+        self.max_clients = max_clients
+        # Least recently used client first
+        self._clients: OrderedDict[int, GoogleCalendarClient] = OrderedDict()
+        self._client_fingerprints: Dict[int, int] = {}
+        self._accounts: Tuple[GoogleAccount, ...] = ()
+        self._summary_cache: Dict[int, tuple[float, Dict[str, Any]]] = {}
+        # Guards the client cache, the in-flight client creations and the summary cache
+        self._clients_lock = threading.Lock()
+        self._inflight: Dict[int, Future[GoogleCalendarClient]] = {}
+        self._token_cache_path = token_cache_path
+        # Serializes token cache writes from concurrent client creations
+        self._token_cache_lock = threading.Lock()
+        self._persisted_tokens: Dict[int, Tuple[str, datetime]] = {}
         
         # Validate all accounts on initialization
         self._validate_accounts()
+        
+        # Reuse access tokens persisted by a previous process
+        if self._token_cache_path:
+            self._load_token_cache()
+            _TOKEN_CACHE_MANAGERS.add(self)
     
     def _validate_accounts(self) -> None:
-        """Validate that all accounts have unique IDs and required credentials."""
-        account_ids: set[int] = set()
+        """Validate that all accounts have unique IDs and required credentials.
         
-        for account in self.config.accounts:
-            if account.account_id in account_ids:
-                raise AccountManagerError(f"Duplicate account ID: {account.account_id}")
-            account_ids.add(account.account_id)
-            
-            # Validate account has all required fields
-            if not account.client_id.strip():
-                raise AccountManagerError(f"Account {account.account_id} missing client_id")
-            if not account.client_secret.strip():
-                raise AccountManagerError(f"Account {account.account_id} missing client_secret")
-            if not account.refresh_token.strip():
-                raise AccountManagerError(f"Account {account.account_id} missing refresh_token")
-        
-        logger.info(f"Validated {len(self.config.accounts)} accounts")
+        Also caches the accounts tuple returned by list_accounts.
+        """
+        accounts = self.config.accounts
+        if len({account.account_id for account in accounts}) != len(accounts):
+            duplicate_ids = [
+                account_id
+                for account_id, count in Counter(account.account_id for account in accounts).items()
+                if count > 1
+            ]
+            raise AccountManagerError(f"Duplicate account ID: {', '.join(map(str, duplicate_ids))}")
+        
+        # Validate accounts have all required fields
+        missing = [
+            (account.account_id, field)
+            for account in accounts
+            for field in REQUIRED_CREDENTIAL_FIELDS
+            if not getattr(account, field).strip()
+        ]
+        if missing:
+            account_id, field = missing[0]
+            raise AccountManagerError(f"Account {account_id} missing {field}")
+        
+        self._accounts = tuple(self.config.accounts)
+        logger.info("Validated %d accounts", len(self.config.accounts))
     
-    def get_client(self, account_id: int) -> GoogleCalendarClient:
+    def get_client(self, account_id: int, verify: bool = False) -> GoogleCalendarClient:
         """Get or create a Google Calendar client for the specified account.
         
+        Client creation is cheap: credentials are refreshed and the API service
+        is built on the first real API call, which also surfaces auth errors.
+        
         Args:
             account_id: Account ID to get client for
+            verify: Test the connection when the client is first created
             
         Returns:
             GoogleCalendarClient instance for the account
@@ -67,30 +196,85 @@ class AccountManager:
         Raises:
             AccountManagerError: If account not found or client creation fails
         """
-        # Check if client already exists
-        if account_id in self._clients:
-            return self._clients[account_id]
+        with self._clients_lock:
+            # Check if client already exists
+            client = self._clients.get(account_id)
+            if client is not None:
+                self._clients.move_to_end(account_id)
+                return client
+            
+            # Coalesce concurrent creations: the first caller builds, the rest wait for its result
+            
+            future = self._inflight.get(account_id)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[account_id] = future
         
+        if not is_owner:
+            return future.result()
+        
+        try:
+            client = self._create_client(account_id, verify)
+            future.set_result(client)
+            return client
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._clients_lock:
+                self._inflight.pop(account_id, None)
+    
+    def _create_client(self, account_id: int, verify: bool) -> GoogleCalendarClient:
+        """Create and cache a client for an account.
+        
+        Must only be called by the caller that owns the account's in-flight creation.
+        
+        Args:
+            account_id: Account ID to create client for
+            verify: Test the connection before caching the client
+            
+        Returns:
+            Newly created GoogleCalendarClient
+            
+        Raises:
+            AccountManagerError: If account not found or client creation fails
+        """
         # Find the account
-        account = self.config.get_account_by_id(account_id)
+        account = self.get_account(account_id)
         if account is None:
             raise AccountManagerError(f"Account {account_id} not found")
         
         # Create new client
         try:
+            access_token, token_expiry = self._persisted_tokens.get(account_id, (None, None))
             client = GoogleCalendarClient(
                 client_id=account.client_id,
                 client_secret=account.client_secret,
-                refresh_token=account.refresh_token
+                refresh_token=account.refresh_token,
+                session=_SHARED_SESSION,
+                access_token=access_token,
+                token_expiry=token_expiry
             )
             
-            # Test the client connection
-            if not client.test_connection():
+            # Test the client connection only when explicitly requested
+            if verify and not client.test_connection():
                 raise AccountManagerError(f"Failed to connect to Google Calendar for account {account_id}")
             
-            # Cache the client
-            self._clients[account_id] = client
-            logger.info(f"Created and cached client for account {account_id} ({account.email})")
+            # Cache the client, evicting the least recently used one if full
+            with self._clients_lock:
+                while len(self._clients) >= self.max_clients:
+                    evicted_id, evicted_client = self._clients.popitem(last=False)
+                    evicted_client.close()
+                    self._client_fingerprints.pop(evicted_id, None)
+                    self._summary_cache.pop(evicted_id, None)
+                    logger.debug("Evicted cached client for account %d", evicted_id)
+                self._clients[account_id] = client
+                self._client_fingerprints[account_id] = _credential_fingerprint(account)
+            logger.info("Created and cached client for account %d (%s)", account_id, account.email)
+            
+            if self._token_cache_path:
+                self._save_token_cache()
             
             return client
             
@@ -99,6 +283,67 @@ class AccountManager:
         except Exception as e:
             raise AccountManagerError(f"Unexpected error creating client for account {account_id}: {e}")
     
+    def _load_token_cache(self) -> None:
+        """Load still-valid access tokens from the on-disk token cache."""
+        try:
+            with open(self._token_cache_path, 'r', encoding='utf-8') as f:  # type: ignore
+                entries: Dict[str, Dict[str, str]] = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable token cache %s: %s", self._token_cache_path, e)
+            return
+        if not isinstance(entries, dict):
+            logger.warning("Ignoring malformed token cache %s", self._token_cache_path)
+            return
+        
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for account in self._accounts:
+            account_id = account.account_id
+            entry = entries.get(str(account_id))
+            if not isinstance(entry, dict) or entry.get('owner') != _token_owner_digest(account):
+                continue
+            try:
+                expiry = datetime.fromisoformat(entry['expiry'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if expiry > now and isinstance(entry.get('access_token'), str):
+                self._persisted_tokens[account_id] = (entry['access_token'], expiry)
+        
+        logger.info("Loaded %d access tokens from %s", len(self._persisted_tokens), self._token_cache_path)
+    
+    def _save_token_cache(self) -> None:
+        """Write current access tokens to the on-disk token cache (mode 0600)."""
+        entries: Dict[str, Dict[str, str]] = {}
+        
+        for account in self._accounts:
+            account_id = account.account_id
+            cached = get_cached_access_token(account.client_id, account.refresh_token)
+            token, expiry = cached if cached else self._persisted_tokens.get(account_id, (None, None))
+            if token is None or expiry is None:
+                continue
+            entries[str(account_id)] = {
+                'access_token': token,
+                'expiry': expiry.isoformat(),
+                'owner': _token_owner_digest(account)
+            }
+        
+        path: str = self._token_cache_path  # type: ignore
+        directory = os.path.dirname(path) or '.'
+        with self._token_cache_lock:
+            tmp_path = None
+            try:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+                # A unique temp file (created 0600) per save, so concurrent saves never share one
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Failed to write token cache %s: %s", path, e)
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+    
     def get_account(self, account_id: int) -> Optional[GoogleAccount]:
         """Get account configuration by ID.
         
@@ -110,13 +355,13 @@ class AccountManager:
         """
         return self.config.get_account_by_id(account_id)
     
-    def list_accounts(self) -> List[GoogleAccount]:
-        """Get list of all configured accounts.
+    def list_accounts(self) -> Sequence[GoogleAccount]:
+        """Get all configured accounts.
         
         Returns:
-            List of all GoogleAccount instances
+            Read-only sequence of all GoogleAccount instances
         """
-        return self.config.accounts.copy()
+        return self._accounts
     
     def test_account_connection(self, account_id: int) -> bool:
         """Test if an account can connect to Google Calendar API.
@@ -131,7 +376,7 @@ class AccountManager:
             client = self.get_client(account_id)
             return client.test_connection()
         except Exception as e:
-            logger.error(f"Connection test failed for account {account_id}: {e}")
+            logger.error("Connection test failed for account %d: %s", account_id, e)
             return False
     
     def test_all_accounts(self) -> Dict[int, bool]:
@@ -140,10 +385,13 @@ class AccountManager:
         Returns:
             Dictionary mapping account_id to connection test result
         """
-        results: Dict[int, bool] = {}
+        account_ids = [account.account_id for account in self.config.accounts]
+        if not account_ids:
+            return {}
         
-        for account in self.config.accounts:
-            results[account.account_id] = self.test_account_connection(account.account_id)
+        # Each test is an independent network round-trip, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(account_ids), MAX_ACCOUNT_WORKERS)) as executor:
+            results: Dict[int, bool] = dict(zip(account_ids, executor.map(self.test_account_connection, account_ids)))
         
         return results
     
@@ -159,19 +407,19 @@ class AccountManager:
         Raises:
             AccountManagerError: If account not found or API call fails
         """
+        account = self.config.get_account_by_id(account_id)
+        if account is None:
+            raise AccountManagerError(f"Account {account_id} not found")
+        
         try:
             client = self.get_client(account_id)
             calendars = client.list_calendars()
             
             # Add account info to each calendar
-            account = self.get_account(account_id)
-            account_email = account.email if account else 'Unknown'
-            
-            for calendar in calendars:
-                calendar['account_id'] = account_id
-                calendar['account_email'] = account_email
-            
-            return calendars
+            return [
+                {**calendar, 'account_id': account_id, 'account_email': account.email}
+                for calendar in calendars
+            ]
             
         except GoogleCalendarError as e:
             raise AccountManagerError(f"Failed to list calendars for account {account_id}: {e}")
@@ -184,18 +432,30 @@ class AccountManager:
         Returns:
             Dictionary mapping account_id to list of calendars
         """
+        accounts = self.config.accounts
+        if not accounts:
+            return {}
+        
         all_calendars: Dict[int, List[Dict[str, Any]]] = {}
         
-        for account in self.config.accounts:
-            try:
-                calendars = self.list_calendars_for_account(account.account_id)
-                all_calendars[account.account_id] = calendars
-                logger.info(f"Listed {len(calendars)} calendars for account {account.account_id} ({account.email})")
-            except Exception as e:
-                logger.error(f"Failed to list calendars for account {account.account_id}: {e}")
-                all_calendars[account.account_id] = []
+        with ThreadPoolExecutor(max_workers=min(len(accounts), MAX_ACCOUNT_WORKERS)) as executor:
+            futures = {
+                executor.submit(self.list_calendars_for_account, account.account_id): account
+                for account in accounts
+            }
+            
+            for future in as_completed(futures):
+                account = futures[future]
+                try:
+                    calendars = future.result()
+                    all_calendars[account.account_id] = calendars
+                    logger.info("Listed %d calendars for account %d (%s)", len(calendars), account.account_id, account.email)
+                except Exception as e:
+                    logger.error("Failed to list calendars for account %d: %s", account.account_id, e)
+                    all_calendars[account.account_id] = []
         
-        return all_calendars
+        # Keep the result ordered like the configuration
+        return {account.account_id: all_calendars[account.account_id] for account in accounts}
     
     def get_account_summary(self) -> List[Dict[str, Any]]:
         """Get summary information for all accounts.
@@ -203,44 +463,63 @@ class AccountManager:
         Returns:
             List of account summaries with connection status and calendar count
         """
-        summaries: List[Dict[str, Any]] = []
+        accounts = self.config.accounts
+        if not accounts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(accounts), MAX_ACCOUNT_WORKERS)) as executor:
+            return list(executor.map(self._summarize_account, accounts))
+    
+    def _summarize_account(self, account: GoogleAccount) -> Dict[str, Any]:
+        """Build the summary for a single account.
+        
+        Args:
+            account: Account to summarize
+            
+        Returns:
+            Account summary with connection status and calendar count
+        """
+        now = time.monotonic()
+        
+        # Reuse a recent summary instead of hitting the API again; whether the client
+        # is cached changes with every client creation or eviction, so it is never reused
+        with self._clients_lock:
+            cached = self._summary_cache.get(account.account_id)
+            if cached is not None and now - cached[0] < SUMMARY_CACHE_TTL_SECONDS:
+                return {**cached[1], 'client_cached': account.account_id in self._clients}
         
-        for account in self.config.accounts:
+        try:
+            # A successful calendar listing also proves the connection works
             try:
-                # Test connection
-                connection_ok = self.test_account_connection(account.account_id)
-                
-                # Count calendars if connection is OK
-                calendar_count = 0
-                if connection_ok:
-                    try:
-                        calendars = self.list_calendars_for_account(account.account_id)
-                        calendar_count = len(calendars)
-                    except Exception:
-                        calendar_count = 0
-                
-                summary = {
-                    'account_id': account.account_id,
-                    'email': account.email,
-                    'connection_ok': connection_ok,
-                    'calendar_count': calendar_count,
-                    'client_cached': account.account_id in self._clients
-                }
-                
-                summaries.append(summary)
-                
+                calendars = self.list_calendars_for_account(account.account_id)
+                connection_ok = True
+                calendar_count = len(calendars)
             except Exception as e:
-                logger.error(f"Error creating summary for account {account.account_id}: {e}")
-                summaries.append({
-                    'account_id': account.account_id,
-                    'email': account.email,
-                    'connection_ok': False,
-                    'calendar_count': 0,
-                    'client_cached': False,
-                    'error': str(e)
-                })
-        
-        return summaries
+                logger.error("Connection test failed for account %d: %s", account.account_id, e)
+                connection_ok = False
+                calendar_count = 0
+            
+            summary = {
+                'account_id': account.account_id,
+                'email': account.email,
+                'connection_ok': connection_ok,
+                'calendar_count': calendar_count
+            }
+            
+            with self._clients_lock:
+                self._summary_cache[account.account_id] = (now, summary)
+                return {**summary, 'client_cached': account.account_id in self._clients}
+            
+        except Exception as e:
+            logger.error("Error creating summary for account %d: %s", account.account_id, e)
+            return {
+                'account_id': account.account_id,
+                'email': account.email,
+                'connection_ok': False,
+                'calendar_count': 0,
+                'client_cached': False,
+                'error': str(e)
+            }
     
     def clear_client_cache(self, account_id: Optional[int] = None) -> None:
         """Clear cached clients.
@@ -249,11 +528,22 @@ class AccountManager:
             account_id: Specific account to clear cache for, or None to clear all
         """
         if account_id is not None:
-            if account_id in self._clients:
-                del self._clients[account_id]
-                logger.info(f"Cleared cached client for account {account_id}")
+            with self._clients_lock:
+                client = self._clients.pop(account_id, None)
+                self._client_fingerprints.pop(account_id, None)
+                if client is not None:
+                    self._summary_cache.pop(account_id, None)
+            if client is not None:
+                client.close()
+                logger.info("Cleared cached client for account %d", account_id)
         else:
-            self._clients.clear()
+            with self._clients_lock:
+                clients = list(self._clients.values())
+                self._clients.clear()
+                self._client_fingerprints.clear()
+                self._summary_cache.clear()
+            for client in clients:
+                client.close()
             logger.info("Cleared all cached clients")
     
     def reload_config(self, new_config: MultiAccountConfig) -> None:
@@ -262,8 +552,24 @@ class AccountManager:
         Args:
             new_config: New multi-account configuration
         """
-        # Clear existing clients since accounts may have changed
-        self.clear_client_cache()
+        # Only drop clients whose account was removed or whose credentials changed
+        new_fingerprints = {
+            account.account_id: _credential_fingerprint(account)
+            for account in new_config.accounts
+        }
+        for account_id, fingerprint in list(self._client_fingerprints.items()):
+            if new_fingerprints.get(account_id) != fingerprint:
+                self.clear_client_cache(account_id)
+        
+        # Persisted tokens only stay valid for accounts with unchanged credentials
+        for account_id in list(self._persisted_tokens):
+            old_account = self.config.get_account_by_id(account_id)
+            if old_account is None or new_fingerprints.get(account_id) != _credential_fingerprint(old_account):
+                del self._persisted_tokens[account_id]
+        
+        # Drop cached summaries since accounts may have been added or removed
+        with self._clients_lock:
+            self._summary_cache.clear()
         
         # Update config
         self.config = new_config
@@ -271,4 +577,8 @@ class AccountManager:
         # Validate new accounts
         self._validate_accounts()
         
-        logger.info(f"Reloaded configuration with {len(self.config.accounts)} accounts and {len(self.config.sync_flows)} sync flows") 
\ No newline at end of file
+        logger.info(
+            "Reloaded configuration with %d accounts and %d sync flows",
+            len(self.config.accounts),
+            len(self.config.sync_flows)
+        ) 
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Asynchronous Google Calendar API client.
+
+Talks to the Calendar REST endpoints directly over httpx, so calls for many
+calendars can run concurrently on one pooled connection set:
+    
+    async with AsyncGoogleCalendarClient(client_id, client_secret, refresh_token) as client:
+        results = await asyncio.gather(*[
+            client.get_events(calendar_id, start_time, end_time) for calendar_id in calendar_ids
+        ])
+
+OAuth2 token handling is shared with GoogleCalendarClient, including the
+process-wide access token cache.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+from urllib.parse import quote
+import httpx
+import requests
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+from backend.services.google_calendar.client import (
+    CALENDAR_LIST_FIELDS,
+    CALENDAR_LIST_PAGE_SIZE,
+    EVENT_FIELDS,
+    EVENT_LIST_FIELDS,
+    EVENT_LIST_PAGE_SIZE,
+    HTTP_TIMEOUT_SECONDS,
+    GoogleCalendarError,
+    ParsedEvent,
+    _OAuth2Token,
+    _build_event_body,
+    _error_reasons,
+    _is_retryable_status,
+    _parse_event,
+    _to_rfc3339_utc,
+)
+
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Base URL of the Calendar REST API
+CALENDAR_API_BASE_URL = 'https://www.googleapis.com/calendar/v3'
+
+# Connection pool limits for concurrent calls; HTTP/2 (when h2 is installed) multiplexes them further
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+def _is_transient_error(exception: BaseException) -> bool:
+    """Check whether a failed API request is worth retrying."""
+    if isinstance(exception, httpx.HTTPStatusError):
+        return _is_retryable_status(exception.response.status_code, _error_reasons(exception.response.content))
+    return isinstance(exception, httpx.TransportError)
+
+
+def _event_path(calendar_id: str, event_id: Optional[str] = None) -> str:
+    """Build the URL path of a calendar's events collection or of a single event."""
+    path = f"/calendars/{quote(calendar_id, safe='')}/events"
+    if event_id is not None:
+        path = f"{path}/{quote(event_id, safe='')}"
+    return path
+
+
+class AsyncGoogleCalendarClient:
+    """Asynchronous Google Calendar API client with OAuth2 refresh token authentication."""
+    
+    def __init__(self, client_id: str, client_secret: str, refresh_token: str,
+                 http_client: Optional[httpx.AsyncClient] = None,
+                 session: Optional[requests.Session] = None,
+                 access_token: Optional[str] = None,
+                 token_expiry: Optional[datetime] = None) -> None:
+        """Initialize asynchronous Google Calendar client.
+        
+        Args:
+            client_id: Google OAuth2 client ID
+            client_secret: Google OAuth2 client secret
+            refresh_token: OAuth2 refresh token for authentication
+            http_client: Shared httpx client to send API requests through (optional);
+                when given, the caller owns it and is responsible for closing it
+            session: Shared HTTP session for OAuth2 token requests (optional)
+            access_token: Previously issued access token to start with (optional)
+            token_expiry: Expiry of access_token as naive UTC datetime (optional)
+        """
+        # Refreshed on demand (off the event loop) rather than on a background timer
+        self._token = _OAuth2Token(
+            client_id, client_secret, refresh_token,
+            session=session, access_token=access_token, token_expiry=token_expiry,
+            background_refresh=False
+        )
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT_SECONDS
+        )
+    
+    async def __aenter__(self) -> "AsyncGoogleCalendarClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this client created it."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+    
+    async def _get_access_token(self) -> str:
+        """Get a valid access token, refreshing it off the event loop when needed."""
+        credentials = self._token.fresh_credentials()
+        if credentials is None:
+            credentials = await asyncio.to_thread(self._token.get_credentials)
+        return credentials.token  # type: ignore
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=0.5),
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True
+    )
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an authorized API request, retrying transient failures.
+        
+        Args:
+            method: HTTP method
+            path: URL path relative to CALENDAR_API_BASE_URL
+            **kwargs: Extra arguments for httpx.AsyncClient.request
+            
+        Returns:
+            Successful response
+        """
+        access_token = await self._get_access_token()
+        response = await self._http_client.request(
+            method, CALENDAR_API_BASE_URL + path,
+            headers={'Authorization': f"Bearer {access_token}"},
+            **kwargs
+        )
+        response.raise_for_status()
+        return response
+    
+    async def list_calendars(self) -> List[Dict[str, Any]]:
+        """List all accessible calendars.
+        
+        Returns:
+            List of calendar dictionaries with id, summary, and access role
+        """
+        try:
+            calendars: List[Dict[str, Any]] = []
+            params: Dict[str, Any] = {'maxResults': CALENDAR_LIST_PAGE_SIZE, 'fields': CALENDAR_LIST_FIELDS}
+            
+            while True:
+                calendars_result = (await self._request('GET', '/users/me/calendarList', params=params)).json()
+                calendars.extend(calendars_result.get('items', []))
+                page_token = calendars_result.get('nextPageToken')
+                if not page_token:
+                    break
+                params['pageToken'] = page_token
+            
+            # Return simplified calendar info
+            return [
+                {
+                    'id': cal['id'],
+                    'summary': cal.get('summary', 'Unknown'),
+                    'access_role': cal.get('accessRole', 'unknown'),
+                    'primary': cal.get('primary', False)
+                }
+                for cal in calendars
+            ]
+        
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error listing calendars: {e}")
+            raise GoogleCalendarError(f"Failed to list calendars: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error listing calendars: {e}")
+            raise GoogleCalendarError(f"Unexpected error: {e}")
+    
+    async def get_events(self, calendar_id: str, start_time: datetime, end_time: datetime,
+                         fields: str = EVENT_LIST_FIELDS) -> List[ParsedEvent]:
+        """Get events from a calendar within a time range.
+        
+        Args:
+            calendar_id: Calendar ID to query
+            start_time: Start of time range (inclusive)
+            end_time: End of time range (exclusive)
+            fields: Partial response mask; fields left out get _parse_event defaults
+            
+        Returns:
+            List of event dictionaries
+        """
+        try:
+            params: Dict[str, Any] = {
+                'timeMin': _to_rfc3339_utc(start_time),
+                'timeMax': _to_rfc3339_utc(end_time),
+                'singleEvents': 'true',
+                'orderBy': 'startTime',
+                'maxResults': EVENT_LIST_PAGE_SIZE,
+                'fields': fields
+            }
+            
+            parsed_events: List[ParsedEvent] = []
+            while True:
+                events_result = (await self._request('GET', _event_path(calendar_id), params=params)).json()
+                for event in events_result.get('items', []):
+                    parsed_events.append(_parse_event(event))
+                
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
+                params['pageToken'] = page_token
+            
+            return parsed_events
+        
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error getting events for calendar {calendar_id}: {e}")
+            raise GoogleCalendarError(f"Failed to get events: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error getting events for calendar {calendar_id}: {e}")
+            raise GoogleCalendarError(f"Unexpected error: {e}")
+    
+    async def create_event(self, calendar_id: str, title: str, start_time: datetime, end_time: datetime,
+                           description: str = "", participants: Optional[List[str]] = None,
+                           all_day: bool = False) -> ParsedEvent:
+        """Create a new event in the specified calendar.
+        
+        Args:
+            calendar_id: Calendar ID where to create the event
+            title: Event title
+            start_time: Event start time
+            end_time: Event end time
+            description: Event description (optional)
+            participants: List of participant email addresses (optional)
+            all_day: Whether this is an all-day event (optional)
+            
+        Returns:
+            Created event dictionary
+        """
+        try:
+            event = _build_event_body(title, start_time, end_time, description, participants, all_day)
+            
+            response = await self._request(
+                'POST', _event_path(calendar_id), params={'fields': EVENT_FIELDS}, json=event
+            )
+            logger.info(f"Created {'all-day' if all_day else 'regular'} event '{title}' in calendar {calendar_id}")
+            
+            return _parse_event(response.json())
+        
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error creating event in calendar {calendar_id}: {e}")
+            raise GoogleCalendarError(f"Failed to create event: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error creating event in calendar {calendar_id}: {e}")
+            raise GoogleCalendarError(f"Unexpected error: {e}")
+    
+    async def delete_event(self, calendar_id: str, event_id: str) -> bool:
+        """Delete an event from the specified calendar.
+        
+        Args:
+            calendar_id: Calendar ID containing the event
+            event_id: Event ID to delete
+            
+        Returns:
+            True if deleted successfully, False if event not found
+        """
+        try:
+            await self._request('DELETE', _event_path(calendar_id, event_id))
+            logger.info(f"Deleted event {event_id} from calendar {calendar_id}")
+            return True
+        
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Event {event_id} not found in calendar {calendar_id}")
+                return False
+            else:
+                logger.error(f"HTTP error deleting event {event_id}: {e}")
+                raise GoogleCalendarError(f"Failed to delete event: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error deleting event {event_id}: {e}")
+            raise GoogleCalendarError(f"Unexpected error: {e}")
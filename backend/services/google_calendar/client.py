@@ -8,171 +8,740 @@ This client handles:
 - Automatic token refresh
 """
 
+import functools
+import inspect
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple, TypedDict, TypeVar, Union
 from datetime import datetime, timedelta, timezone
+import httplib2  # type: ignore
+import requests
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp  # type: ignore
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build  # type: ignore
+from googleapiclient.discovery import build, build_from_document  # type: ignore
+from googleapiclient.discovery_cache import get_static_doc  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from googleapiclient.model import JsonModel  # type: ignore
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Largest page size accepted by calendarList.list
+CALENDAR_LIST_PAGE_SIZE = 250
+
+# Only the calendar list fields used by list_calendars
+CALENDAR_LIST_FIELDS = 'nextPageToken,items(id,summary,accessRole,primary)'
+
+# Event fields read by _parse_event
+EVENT_FIELDS = 'id,summary,description,start,end,attendees/email,status,creator/email,organizer/email,transparency'
+
+# Partial response mask for events.list
+EVENT_LIST_FIELDS = f'nextPageToken,items({EVENT_FIELDS})'
+
+# Partial response mask for incremental (sync token) events.list requests
+EVENT_SYNC_FIELDS = f'nextPageToken,nextSyncToken,items({EVENT_FIELDS})'
+
+# Largest page size accepted by events.list
+EVENT_LIST_PAGE_SIZE = 2500
+
+# Busy block lookups (find_events_by_time_and_title, sync engine) only need identity, title and timing
+FIND_EVENTS_FIELDS = 'nextPageToken,items(id,summary,start,end)'
+
+# Search window around an exact busy block time; only overlapping events are returned
+FIND_EVENTS_WINDOW = timedelta(minutes=1)
+
+# Maximum number of sub-requests Google accepts in one batch request
+BATCH_SIZE_LIMIT = 50
+
+# Socket timeout for Calendar API requests, in seconds
+HTTP_TIMEOUT_SECONDS = 60
+
+# Refresh access tokens this long before they expire, so API calls never wait on a refresh.
+# Must exceed google-auth's own 3m45s expiry threshold, or google-auth refreshes inline first.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Background refresh fires this long before the token enters TOKEN_REFRESH_MARGIN,
+# so foreground calls keep taking the lock-free fast path
+BACKGROUND_REFRESH_LEAD = timedelta(minutes=1)
+
+# Never schedule background refreshes closer together than this, even for short-lived tokens
+MIN_BACKGROUND_REFRESH_DELAY_SECONDS = 30.0
+
+# Access tokens shared by all clients in the process, keyed by (client_id, refresh_token),
+# so re-created clients reuse a still-valid token instead of refreshing again
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, Optional[datetime]]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_access_token(client_id: str, refresh_token: str) -> Optional[Tuple[str, Optional[datetime]]]:
+    """Get the most recent access token issued for a set of credentials.
+    
+    Args:
+        client_id: Google OAuth2 client ID
+        refresh_token: OAuth2 refresh token
+        
+    Returns:
+        Tuple of (access_token, expiry) or None if no token has been issued yet
+    """
+    with _TOKEN_CACHE_LOCK:
+        return _TOKEN_CACHE.get((client_id, refresh_token))
+
+
+def _utcnow() -> datetime:
+    """Current time as naive UTC datetime, matching google-auth expiry values."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Shared read-only defaults for missing nested event fields
+_EMPTY_DICT: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+
+# C-implemented RFC3339 parser used for every event time. Handles both 'Z' and
+# '+HH:MM' suffixes without string rewriting, and is much faster than strptime
+# or slicing the string into int() calls.
+_fromisoformat = datetime.fromisoformat
+
+# HTTP statuses worth retrying: rate limiting and server-side failures.
+# Everything else (400, 401, 404, 410, ...) fails the same way on every attempt.
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 403 error reasons Google uses for rate limiting; other 403s are permission errors
+RATE_LIMIT_ERROR_REASONS = frozenset({'rateLimitExceeded', 'userRateLimitExceeded'})
+
+
+def _is_retryable_status(status: int, error_reasons: Iterable[str]) -> bool:
+    """Check whether an API error response is worth retrying.
+    
+    Args:
+        status: HTTP status code
+        error_reasons: 'reason' values from the error response body
+        
+    Returns:
+        True for rate limiting and server errors
+    """
+    if status in RETRYABLE_HTTP_STATUSES:
+        return True
+    return status == 403 and not RATE_LIMIT_ERROR_REASONS.isdisjoint(error_reasons)
+
+
+def _error_reasons(content: bytes) -> List[str]:
+    """Extract the 'reason' values from a Google API error response body."""
+    try:
+        errors = json.loads(content)['error']['errors']
+    except (ValueError, KeyError, TypeError):
+        return []
+    return [error.get('reason', '') for error in errors if isinstance(error, dict)]
+
+
+def _is_transient_error(exception: BaseException) -> bool:
+    """Check whether a failed API request is worth retrying."""
+    if isinstance(exception, HttpError):
+        return _is_retryable_status(exception.resp.status, _error_reasons(exception.content))  # type: ignore
+    return isinstance(exception, (ConnectionError, TimeoutError))
+
+
+# Jittered backoff keeps concurrent callers that failed together from retrying in lockstep
+_api_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=30, jitter=0.5),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True
+)
+
+
+@_api_retry
+def _execute_request(request: Any) -> Any:
+    """Execute a single API request, retrying transient failures.
+    
+    Args:
+        request: Unexecuted HttpRequest
+        
+    Returns:
+        Parsed API response
+    """
+    return request.execute()
+
+
+def _to_rfc3339_utc(value: datetime) -> str:
+    """Format a datetime as an RFC3339 UTC timestamp for API query parameters.
+    
+    Naive datetimes are assumed to already be in UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _to_epoch_minute(value: datetime) -> int:
+    """Convert a datetime to whole minutes since the Unix epoch.
+    
+    Naive datetimes are assumed to already be in UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() // 60)
+
+
+def _background_refresh(token_ref: "weakref.ReferenceType[_OAuth2Token]") -> None:
+    """Timer callback refreshing a client's token ahead of expiry.
+    
+    Holds only a weak reference, so a pending timer never keeps a discarded client alive.
+    """
+    token = token_ref()
+    if token is None:
+        return
+    with token._lock:
+        if token._closed:
+            return
+        try:
+            token._refresh()
+        except GoogleCalendarError:
+            # Already logged; the next API call retries the refresh inline
+            pass
+
+
+class _OrjsonModel(JsonModel):  # type: ignore
+    """JsonModel that decodes response bodies with orjson."""
+    
+    def deserialize(self, content: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the stock model handle non-JSON bodies the way it always has
+            return super().deserialize(content)
+
+
+# Response model for Calendar services; None keeps googleapiclient's stdlib json decoding
+_RESPONSE_MODEL = _OrjsonModel() if orjson is not None else None
+
+
+@functools.lru_cache(maxsize=1)
+def _calendar_discovery_document() -> Optional[str]:
+    """Load the Calendar v3 discovery document bundled with googleapiclient.
+    
+    Read once per process, so building a service for another client or thread
+    does not re-read the ~130KB document from disk. Kept as JSON text: each
+    build_from_document call parses its own copy, since it mutates the dict.
+    
+    Returns:
+        Discovery document JSON, or None if googleapiclient does not bundle it
+    """
+    return get_static_doc('calendar', 'v3') or None
+
+
+class ParsedEvent(TypedDict):
+    """Simplified event returned by GoogleCalendarClient event methods.
+    
+    A plain dict at runtime: the constant-key dict literal in _parse_event is
+    cheaper to build than a slotted object, and events are short-lived.
+    """
+    id: str
+    title: str
+    description: str
+    start_time: datetime
+    end_time: datetime
+    all_day: bool
+    participants: List[str]
+    participant_count: int
+    status: str
+    creator: str
+    organizer: str
+    transparency: str
+
+
+def _parse_event(event: Dict[str, Any]) -> ParsedEvent:
+    """Parse Google Calendar API event into simplified format.
+    
+    Args:
+        event: Raw event from Google Calendar API
+        
+    Returns:
+        Simplified event dictionary
+    """
+    get = event.get
+    
+    # Determine if this is an all-day event
+    start = get('start') or _EMPTY_DICT
+    end = get('end') or _EMPTY_DICT
+    is_all_day = 'date' in start and 'date' in end
+    
+    # Parse start/end time (dateTime for timed events, date for all-day events);
+    # fromisoformat accepts the 'Z' suffix on Python 3.11+
+    start_time = _fromisoformat(start.get('dateTime') or start.get('date', ''))
+    end_time = _fromisoformat(end.get('dateTime') or end.get('date', ''))
+    
+    # Parse attendees
+    participants = [attendee.get('email', '') for attendee in get('attendees', _EMPTY_LIST)]
+    
+    return {
+        'id': get('id', ''),
+        'title': get('summary', ''),
+        'description': get('description', ''),
+        'start_time': start_time,
+        'end_time': end_time,
+        'all_day': is_all_day,
+        'participants': participants,
+        'participant_count': len(participants),
+        'status': get('status', 'unknown'),
+        'creator': get('creator', _EMPTY_DICT).get('email', ''),
+        'organizer': get('organizer', _EMPTY_DICT).get('email', ''),
+        'transparency': get('transparency', 'opaque')  # opaque = busy, transparent = free
+    }
+
+
+def _build_event_body(title: str, start_time: datetime, end_time: datetime,
+                      description: str = "", participants: Optional[List[str]] = None,
+                      all_day: bool = False) -> Dict[str, Any]:
+    """Build the API request body for a new event.
+    
+    Args:
+        title: Event title
+        start_time: Event start time
+        end_time: Event end time
+        description: Event description
+        participants: List of participant email addresses
+        all_day: Whether this is an all-day event
+        
+    Returns:
+        Event resource dictionary
+    """
+    event: Dict[str, Any] = {
+        'summary': title,
+        'description': description,
+    }
+    
+    # Set start and end times based on all_day flag
+    if all_day:
+        # For all-day events, use date format without time
+        event['start'] = {
+            'date': start_time.strftime('%Y-%m-%d'),
+        }
+        event['end'] = {
+            'date': end_time.strftime('%Y-%m-%d'),
+        }
+    else:
+        # For regular events, use dateTime format
+        event['start'] = {
+            'dateTime': start_time.isoformat(),
+            'timeZone': 'UTC',
+        }
+        event['end'] = {
+            'dateTime': end_time.isoformat(),
+            'timeZone': 'UTC',
+        }
+    
+    # Add attendees if participants are provided
+    if participants:
+        event['attendees'] = [{'email': email} for email in participants]
+    
+    return event
+
+
 class GoogleCalendarError(Exception):
     """Base exception for Google Calendar API errors."""
     pass
 
+
+_Method = TypeVar('_Method', bound=Callable[..., Any])
+
+
+def _calendar_op(action: str, failure: str) -> Callable[[_Method], _Method]:
+    """Wrap a client method so any failure surfaces as GoogleCalendarError.
+    
+    Args:
+        action: What the method does, for log messages; may reference the
+            method's arguments, e.g. 'deleting event {event_id}'
+        failure: Error message prefix for API (HTTP) errors
+        
+    Returns:
+        Decorator for GoogleCalendarClient methods
+    """
+    def decorator(method: _Method) -> _Method:
+        signature = inspect.signature(method)
+        
+        def describe(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+            # Only evaluated on the error path
+            return action.format(**signature.bind(*args, **kwargs).arguments)
+        
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return method(*args, **kwargs)
+            except GoogleCalendarError:
+                raise
+            except HttpError as e:
+                logger.error(f"HTTP error {describe(args, kwargs)}: {e}")
+                raise GoogleCalendarError(f"{failure}: {e}") from e
+            except Exception as e:
+                logger.error(f"Unexpected error {describe(args, kwargs)}: {e}")
+                raise GoogleCalendarError(f"Unexpected error: {e}") from e
+        
+        return wrapper  # type: ignore
+    
+    return decorator
+
+
+class _OAuth2Token:
+    """OAuth2 access token for one set of credentials, refreshed shortly before it expires.
+    
+    Shared by GoogleCalendarClient and AsyncGoogleCalendarClient. Issued tokens
+    go to the process-wide token cache, so re-created clients reuse them.
+    """
+    
+    def __init__(self, client_id: str, client_secret: str, refresh_token: str,
+                 session: Optional[requests.Session] = None,
+                 access_token: Optional[str] = None,
+                 token_expiry: Optional[datetime] = None,
+                 background_refresh: bool = True) -> None:
+        """Initialize the token; nothing is fetched until credentials are first needed.
+        
+        Args:
+            client_id: Google OAuth2 client ID
+            client_secret: Google OAuth2 client secret
+            refresh_token: OAuth2 refresh token
+            session: Shared HTTP session for OAuth2 token requests (optional)
+            access_token: Previously issued access token to start with (optional)
+            token_expiry: Expiry of access_token as naive UTC datetime (optional)
+            background_refresh: Renew the token on a timer ahead of expiry, so
+                callers never wait on a refresh
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self._session = session
+        self._initial_token = (access_token, token_expiry) if access_token else (None, None)
+        self._credentials: Optional[Credentials] = None
+        # Refresh deadline of the current access token (naive UTC), None until first refresh
+        self._token_expiry: Optional[datetime] = None
+        self._lock = threading.Lock()
+        # Timer refreshing the token in the background before API calls would have to
+        self._refresh_timer: Optional[threading.Timer] = None
+        # Closed tokens are only refreshed inline, when credentials are requested
+        self._closed = not background_refresh
+    
+    def close(self) -> None:
+        """Stop background refreshes; the token is then refreshed inline when needed."""
+        with self._lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+    
+    def fresh_credentials(self) -> Optional[Credentials]:
+        """Get the credentials if their access token can be used without a refresh.
+        
+        Lock-free, so it never waits on a refresh in progress.
+        
+        Returns:
+            Current credentials, or None if the token is missing or about to expire
+        """
+        credentials = self._credentials
+        token_expiry = self._token_expiry
+        if credentials is not None and token_expiry is not None and _utcnow() < token_expiry - TOKEN_REFRESH_MARGIN:
+            return credentials
+        return None
+    
+    def get_credentials(self) -> Credentials:
+        """Get OAuth2 credentials, refreshing the access token shortly before it expires.
+        
+        Returns:
+            Credentials with a valid access token
+            
+        Raises:
+            GoogleCalendarError: If the token refresh fails
+        """
+        # Fast path: token is comfortably valid, no locking needed
+        credentials = self.fresh_credentials()
+        if credentials is not None:
+            return credentials
+        
+        with self._lock:
+            token_cache_key = (self.client_id, self.refresh_token)
+            
+            if self._credentials is None:
+                with _TOKEN_CACHE_LOCK:
+                    cached_token, cached_expiry = _TOKEN_CACHE.get(token_cache_key, self._initial_token)
+                
+                self._credentials = Credentials(
+                    token=cached_token,
+                    refresh_token=self.refresh_token,
+                    token_uri='https://oauth2.googleapis.com/token',
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    expiry=cached_expiry
+                )
+            
+            # Refresh token if missing or about to expire (another thread may have just refreshed it)
+            expiry = self._credentials.expiry
+            if self._credentials.token is None or expiry is None or _utcnow() >= expiry - TOKEN_REFRESH_MARGIN:
+                self._refresh()
+            else:
+                self._schedule_background_refresh()
+            
+            return self._credentials
+    
+    def _refresh(self) -> None:
+        """Refresh the access token and schedule the next background refresh.
+        
+        Must be called with _lock held.
+        """
+        try:
+            self._credentials.refresh(Request(session=self._session))  # type: ignore
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[(self.client_id, self.refresh_token)] = (self._credentials.token, self._credentials.expiry)  # type: ignore
+            logger.info("OAuth2 token refreshed successfully")
+        except Exception as e:
+            logger.error(f"Failed to refresh OAuth2 token: {e}")
+            raise GoogleCalendarError(f"Authentication failed: {e}")
+        
+        self._schedule_background_refresh()
+    
+    def _schedule_background_refresh(self) -> None:
+        """Record the current token's expiry and (re)start the background refresh timer.
+        
+        Must be called with _lock held.
+        """
+        expiry = self._credentials.expiry  # type: ignore
+        # Tokens without an expiry never need a proactive refresh
+        self._token_expiry = expiry or datetime.max
+        
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if expiry is None or self._closed:
+            return
+        
+        delay = (expiry - TOKEN_REFRESH_MARGIN - BACKGROUND_REFRESH_LEAD - _utcnow()).total_seconds()
+        self._refresh_timer = threading.Timer(
+            max(delay, MIN_BACKGROUND_REFRESH_DELAY_SECONDS), _background_refresh, args=(weakref.ref(self),)
+        )
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+
 class GoogleCalendarClient:
     """Google Calendar API client with OAuth2 refresh token authentication."""
     
-    def __init__(self, client_id: str, client_secret: str, refresh_token: str) -> None:
+    def __init__(self, client_id: str, client_secret: str, refresh_token: str,
+                 session: Optional[requests.Session] = None,
+                 access_token: Optional[str] = None,
+                 token_expiry: Optional[datetime] = None) -> None:
         """Initialize Google Calendar client.
         
         Args:
             client_id: Google OAuth2 client ID
             client_secret: Google OAuth2 client secret
             refresh_token: OAuth2 refresh token for authentication
+            session: Shared HTTP session for OAuth2 token requests (optional)
+            access_token: Previously issued access token to start with (optional)
+            token_expiry: Expiry of access_token as naive UTC datetime (optional)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
-        self._service = None  # type: ignore
-        self._credentials: Optional[Credentials] = None
+        self._token = _OAuth2Token(
+            client_id, client_secret, refresh_token,
+            session=session, access_token=access_token, token_expiry=token_expiry
+        )
+        # httplib2 is not thread-safe, so each thread gets its own service and keep-alive connection
+        self._local = threading.local()
+        # Latest events.list sync token per calendar, for get_events_incremental
+        self._sync_tokens: Dict[str, str] = {}
         
-    def _get_credentials(self) -> Credentials:
-        """Get or refresh OAuth2 credentials."""
-        if self._credentials is None:
-            self._credentials = Credentials(
-                token=None,
-                refresh_token=self.refresh_token,
-                token_uri='https://oauth2.googleapis.com/token',
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-        
-        # Refresh token if needed
-        if not self._credentials.valid:
-            try:
-                self._credentials.refresh(Request())  # type: ignore
-                logger.info("OAuth2 token refreshed successfully")
-            except Exception as e:
-                logger.error(f"Failed to refresh OAuth2 token: {e}")
-                raise GoogleCalendarError(f"Authentication failed: {e}")
+    def close(self) -> None:
+        """Stop background token refreshes.
         
-        return self._credentials
+        The client stays usable; tokens are then refreshed inline when needed.
+        """
+        self._token.close()
+    
+    def _get_credentials(self) -> Credentials:
+        """Get OAuth2 credentials, refreshing the access token shortly before it expires."""
+        return self._token.get_credentials()
     
     def _get_service(self):  # type: ignore
-        """Get or create Google Calendar service."""
-        if self._service is None:  # type: ignore
-            credentials = self._get_credentials()
-            self._service = build('calendar', 'v3', credentials=credentials)  # type: ignore
-        return self._service  # type: ignore
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
+        """Get or create this thread's Google Calendar service with a fresh access token."""
+        credentials = self._get_credentials()
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            # One persistent httplib2.Http per thread keeps the TLS connection alive between calls
+            http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+            discovery_document = _calendar_discovery_document()
+            if discovery_document is not None:
+                service = build_from_document(discovery_document, http=http, model=_RESPONSE_MODEL)  # type: ignore
+            else:
+                # Never fall back to fetching the discovery document over HTTP or from a disk cache
+                service = build(  # type: ignore
+                    'calendar', 'v3', http=http, model=_RESPONSE_MODEL,
+                    static_discovery=True, cache_discovery=False
+                )
+            self._local.service = service
+        return service  # type: ignore
+    
+    @_calendar_op('listing calendars', 'Failed to list calendars')
     def list_calendars(self) -> List[Dict[str, Any]]:
         """List all accessible calendars.
         
         Returns:
             List of calendar dictionaries with id, summary, and access role
         """
-        try:
-            service = self._get_service()  # type: ignore
-            calendars_result = service.calendarList().list().execute()  # type: ignore
-            calendars = calendars_result.get('items', [])  # type: ignore
-            
-            # Return simplified calendar info
-            return [
-                {
-                    'id': cal['id'],
-                    'summary': cal.get('summary', 'Unknown'),  # type: ignore
-                    'access_role': cal.get('accessRole', 'unknown'),  # type: ignore
-                    'primary': cal.get('primary', False)  # type: ignore
-                }
-                for cal in calendars  # type: ignore
-            ]
-            
-        except HttpError as e:
-            logger.error(f"HTTP error listing calendars: {e}")
-            raise GoogleCalendarError(f"Failed to list calendars: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error listing calendars: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}")
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
-    def get_events(self, calendar_id: str, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        service = self._get_service()  # type: ignore
+        calendars: List[Dict[str, Any]] = []
+        page_token: Optional[str] = None
+        
+        # Fetch the whole list in as few round-trips as possible
+        while True:
+            calendars_result = _execute_request(service.calendarList().list(  # type: ignore
+                maxResults=CALENDAR_LIST_PAGE_SIZE,
+                fields=CALENDAR_LIST_FIELDS,
+                pageToken=page_token
+            ))
+            calendars.extend(calendars_result.get('items', []))  # type: ignore
+            page_token = calendars_result.get('nextPageToken')  # type: ignore
+            if not page_token:
+                break
+        
+        # Return simplified calendar info
+        return [
+            {
+                'id': cal['id'],
+                'summary': cal.get('summary', 'Unknown'),  # type: ignore
+                'access_role': cal.get('accessRole', 'unknown'),  # type: ignore
+                'primary': cal.get('primary', False)  # type: ignore
+            }
+            for cal in calendars  # type: ignore
+        ]
+    
+    @_calendar_op('getting events for calendar {calendar_id}', 'Failed to get events')
+    def get_events(self, calendar_id: str, start_time: datetime, end_time: datetime,
+                   fields: str = EVENT_LIST_FIELDS) -> List[ParsedEvent]:
         """Get events from a calendar within a time range.
         
         Args:
             calendar_id: Calendar ID to query
             start_time: Start of time range (inclusive)
             end_time: End of time range (exclusive)
+            fields: Partial response mask; fields left out get _parse_event defaults
             
         Returns:
             List of event dictionaries
         """
-        try:
-            service = self._get_service()  # type: ignore
-            
-            # Format times for API - convert to UTC and use proper ISO format
-            if start_time.tzinfo is not None:
-                # Convert timezone-aware datetime to UTC
-                start_utc = start_time.astimezone(timezone.utc).replace(tzinfo=None)
-                time_min = start_utc.isoformat() + 'Z'
-            else:
-                # Assume naive datetime is already UTC
-                time_min = start_time.isoformat() + 'Z'
-                
-            if end_time.tzinfo is not None:
-                # Convert timezone-aware datetime to UTC
-                end_utc = end_time.astimezone(timezone.utc).replace(tzinfo=None)
-                time_max = end_utc.isoformat() + 'Z'
-            else:
-                # Assume naive datetime is already UTC
-                time_max = end_time.isoformat() + 'Z'
-            
-            events_result = service.events().list(  # type: ignore
-                calendarId=calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()  # type: ignore
-            
-            events = events_result.get('items', [])  # type: ignore
+        service = self._get_service()  # type: ignore
+        
+        # Format times for API - convert to UTC and use proper ISO format
+        time_min = _to_rfc3339_utc(start_time)
+        time_max = _to_rfc3339_utc(end_time)
+        
+        # Parse events into simplified format, following pagination
+        parsed_events: List[ParsedEvent] = []
+        page_token: Optional[str] = None
+        while True:
+            events_result = _execute_request(self._events_list_request(  # type: ignore
+                service, calendar_id, time_min, time_max, fields=fields, page_token=page_token
+            ))
             
-            # Parse events into simplified format
-            parsed_events = []
-            for event in events:  # type: ignore
-                parsed_events.append(self._parse_event(event))  # type: ignore
+            for event in events_result.get('items', []):  # type: ignore
+                parsed_events.append(_parse_event(event))  # type: ignore
             
-            return parsed_events  # type: ignore
+            page_token = events_result.get('nextPageToken')  # type: ignore
+            if not page_token:
+                break
+        
+        return parsed_events
+    
+    @_calendar_op('getting event changes for calendar {calendar_id}', 'Failed to get event changes')
+    def get_events_incremental(self, calendar_id: str, start_time: Optional[datetime] = None,
+                               full_listing: bool = False) -> Tuple[List[ParsedEvent], List[str], str, bool]:
+        """Get events changed in a calendar since the previous call for it.
+        
+        The first call lists all events (from start_time, if given) and stores the
+        returned sync token; later calls only return what changed since then. A
+        full listing is also done when no token is stored (e.g. on a new client)
+        or Google expires the token (410 Gone); deletions made in the meantime are
+        then not reported, so callers should treat known events missing from the
+        listing as deleted.
+        
+        Args:
+            calendar_id: Calendar ID to query
+            start_time: Earliest event time for a full listing (optional)
+            full_listing: Ignore the stored sync token and list all events again
             
+        Returns:
+            Tuple of (changed or new events, IDs of cancelled events, next sync token,
+            whether this was a full listing)
+        """
+        service = self._get_service()  # type: ignore
+        sync_token = None if full_listing else self._sync_tokens.get(calendar_id)
+        listed_all = sync_token is None
+        
+        try:
+            items, next_sync_token = self._list_event_changes(service, calendar_id, sync_token, start_time)
         except HttpError as e:
-            logger.error(f"HTTP error getting events for calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Failed to get events: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error getting events for calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}")
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
+            if sync_token is None or e.resp.status != 410:  # type: ignore
+                raise
+            logger.info(f"Sync token for calendar {calendar_id} expired, listing all events again")
+            self._sync_tokens.pop(calendar_id, None)
+            items, next_sync_token = self._list_event_changes(service, calendar_id, None, start_time)
+            listed_all = True
+        
+        # Deleted events come back as cancelled, usually without start and end times
+        events: List[ParsedEvent] = []
+        cancelled_event_ids: List[str] = []
+        for item in items:
+            if item.get('status') == 'cancelled':
+                cancelled_event_ids.append(item['id'])
+            else:
+                events.append(_parse_event(item))
+        
+        self._sync_tokens[calendar_id] = next_sync_token
+        return events, cancelled_event_ids, next_sync_token, listed_all
+    
+    def _list_event_changes(self, service: Any, calendar_id: str, sync_token: Optional[str],
+                            start_time: Optional[datetime]) -> Tuple[List[Dict[str, Any]], str]:
+        """Fetch all pages of an events.list sync request.
+        
+        Args:
+            service: Google Calendar service
+            calendar_id: Calendar ID to query
+            sync_token: Token from the previous sync, or None for a full listing
+            start_time: Earliest event time for a full listing (optional)
+            
+        Returns:
+            Tuple of (raw events, next sync token)
+        """
+        params: Dict[str, Any] = {
+            'calendarId': calendar_id,
+            'singleEvents': True,
+            'maxResults': EVENT_LIST_PAGE_SIZE,
+            'fields': EVENT_SYNC_FIELDS
+        }
+        # Sync requests may not repeat the time restrictions of the initial listing
+        if sync_token is not None:
+            params['syncToken'] = sync_token
+        elif start_time is not None:
+            params['timeMin'] = _to_rfc3339_utc(start_time)
+        
+        items: List[Dict[str, Any]] = []
+        while True:
+            events_result = _execute_request(service.events().list(**params))  # type: ignore
+            items.extend(events_result.get('items', []))  # type: ignore
+            page_token = events_result.get('nextPageToken')  # type: ignore
+            if not page_token:
+                # The sync token only comes with the last page
+                return items, events_result['nextSyncToken']  # type: ignore
+            params['pageToken'] = page_token
+    
+    @_calendar_op('creating event in calendar {calendar_id}', 'Failed to create event')
     def create_event(self, calendar_id: str, title: str, start_time: datetime, end_time: datetime, 
-                    description: str = "", participants: Optional[List[str]] = None, all_day: bool = False) -> Dict[str, Any]:
+                    description: str = "", participants: Optional[List[str]] = None, all_day: bool = False) -> ParsedEvent:
         """Create a new event in the specified calendar.
         
         Args:
@@ -187,56 +756,18 @@ class GoogleCalendarClient:
         Returns:
             Created event dictionary
         """
-        try:
-            service = self._get_service()  # type: ignore
-            
-            event: Dict[str, Any] = {
-                'summary': title,
-                'description': description,
-            }
-            
-            # Set start and end times based on all_day flag
-            if all_day:
-                # For all-day events, use date format without time
-                event['start'] = {
-                    'date': start_time.strftime('%Y-%m-%d'),
-                }
-                event['end'] = {
-                    'date': end_time.strftime('%Y-%m-%d'),
-                }
-            else:
-                # For regular events, use dateTime format
-                event['start'] = {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': 'UTC',
-                }
-                event['end'] = {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': 'UTC',
-                }
-            
-            # Add attendees if participants are provided
-            if participants:
-                event['attendees'] = [{'email': email} for email in participants]
-            
-            event_result = service.events().insert(calendarId=calendar_id, body=event).execute()  # type: ignore
-            logger.info(f"Created {'all-day' if all_day else 'regular'} event '{title}' in calendar {calendar_id}")
-            
-            return self._parse_event(event_result)  # type: ignore
-            
-        except HttpError as e:
-            logger.error(f"HTTP error creating event in calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Failed to create event: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error creating event in calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}")
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
+        service = self._get_service()  # type: ignore
+        
+        event = _build_event_body(title, start_time, end_time, description, participants, all_day)
+        
+        event_result = _execute_request(service.events().insert(  # type: ignore
+            calendarId=calendar_id, body=event, fields=EVENT_FIELDS
+        ))
+        logger.info(f"Created {'all-day' if all_day else 'regular'} event '{title}' in calendar {calendar_id}")
+        
+        return _parse_event(event_result)  # type: ignore
+    
+    @_calendar_op('deleting event {event_id}', 'Failed to delete event')
     def delete_event(self, calendar_id: str, event_id: str) -> bool:
         """Delete an event from the specified calendar.
         
@@ -249,23 +780,186 @@ class GoogleCalendarClient:
         """
         try:
             service = self._get_service()  # type: ignore
-            service.events().delete(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore
+            _execute_request(service.events().delete(calendarId=calendar_id, eventId=event_id))  # type: ignore
             logger.info(f"Deleted event {event_id} from calendar {calendar_id}")
             return True
             
         except HttpError as e:
-            if e.resp.status == 404:  # type: ignore
-                logger.warning(f"Event {event_id} not found in calendar {calendar_id}")
-                return False
+            if e.resp.status != 404:  # type: ignore
+                raise
+            logger.warning(f"Event {event_id} not found in calendar {calendar_id}")
+            return False
+    
+    def _events_list_request(self, service: Any, calendar_id: str, time_min: str, time_max: str,
+                             fields: str = EVENT_LIST_FIELDS, page_token: Optional[str] = None) -> Any:
+        """Build an events.list request for one page of a time range.
+        
+        Args:
+            service: Google Calendar service
+            calendar_id: Calendar ID to query
+            time_min: RFC3339 start of time range
+            time_max: RFC3339 end of time range
+            fields: Partial response mask
+            page_token: Token of the page to fetch (optional)
+            
+        Returns:
+            Unexecuted HttpRequest
+        """
+        return service.events().list(  # type: ignore
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy='startTime',
+            maxResults=EVENT_LIST_PAGE_SIZE,
+            fields=fields,
+            pageToken=page_token
+        )
+    
+    def _execute_batch(self, batch_requests: List[Any]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """Execute API requests as batch requests of up to BATCH_SIZE_LIMIT each.
+        
+        Args:
+            batch_requests: Unexecuted HttpRequest objects
+            
+        Returns:
+            (response, exception) pair for every request, in request order
+        """
+        service = self._get_service()  # type: ignore
+        results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(batch_requests)
+        
+        def callback(request_id: str, response: Optional[Dict[str, Any]], exception: Optional[Exception]) -> None:
+            results[int(request_id)] = (response, exception)
+        
+        for chunk_start in range(0, len(batch_requests), BATCH_SIZE_LIMIT):
+            batch = service.new_batch_http_request(callback=callback)  # type: ignore
+            for index in range(chunk_start, min(chunk_start + BATCH_SIZE_LIMIT, len(batch_requests))):
+                batch.add(batch_requests[index], request_id=str(index))  # type: ignore
+            # Not retried: re-sending a partially applied batch would repeat its inserts
+            batch.execute()  # type: ignore
+        
+        return results
+    
+    def batch_get_events(self, ranges: List[Tuple[str, datetime, datetime]]) -> List[Union[List[ParsedEvent], GoogleCalendarError]]:
+        """Get events for several calendars or time ranges in batch requests.
+        
+        Args:
+            ranges: (calendar_id, start_time, end_time) tuples, as for get_events
+            
+        Returns:
+            For every range, in order: list of event dictionaries, or the GoogleCalendarError it failed with
+        """
+        if not ranges:
+            return []
+        
+        try:
+            service = self._get_service()  # type: ignore
+            batch_requests = [
+                self._events_list_request(
+                    service, calendar_id,
+                    _to_rfc3339_utc(start_time), _to_rfc3339_utc(end_time)
+                )
+                for calendar_id, start_time, end_time in ranges
+            ]
+            responses = self._execute_batch(batch_requests)
+        except Exception as e:
+            logger.error(f"Batch error getting events for {len(ranges)} ranges: {e}")
+            raise GoogleCalendarError(f"Failed to get events: {e}")
+        
+        results: List[Union[List[ParsedEvent], GoogleCalendarError]] = []
+        for (calendar_id, start_time, end_time), (response, exception) in zip(ranges, responses):
+            if exception is not None:
+                logger.error(f"HTTP error getting events for calendar {calendar_id}: {exception}")
+                results.append(GoogleCalendarError(f"Failed to get events: {exception}"))
+            elif response.get('nextPageToken'):  # type: ignore
+                # Batch responses carry one page only; fetch long ranges the regular way
+                try:
+                    results.append(self.get_events(calendar_id, start_time, end_time))
+                except GoogleCalendarError as e:
+                    results.append(e)
             else:
-                logger.error(f"HTTP error deleting event {event_id}: {e}")
-                raise GoogleCalendarError(f"Failed to delete event: {e}")
+                results.append([_parse_event(event) for event in response.get('items', [])])  # type: ignore
+        
+        return results
+    
+    def batch_create_events(self, calendar_id: str, events: List[Dict[str, Any]]) -> List[Union[ParsedEvent, GoogleCalendarError]]:
+        """Create several events in one calendar using batch requests.
+        
+        Args:
+            calendar_id: Calendar ID where to create the events
+            events: Keyword arguments for each event, as accepted by create_event
+                (title, start_time, end_time, description, participants, all_day)
+            
+        Returns:
+            For every event, in order: created event dictionary, or the GoogleCalendarError it failed with
+        """
+        if not events:
+            return []
+        
+        try:
+            service = self._get_service()  # type: ignore
+            batch_requests = [
+                service.events().insert(  # type: ignore
+                    calendarId=calendar_id, body=_build_event_body(**event), fields=EVENT_FIELDS
+                )
+                for event in events
+            ]
+            responses = self._execute_batch(batch_requests)
         except Exception as e:
-            logger.error(f"Unexpected error deleting event {event_id}: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}")
+            logger.error(f"Batch error creating {len(events)} events in calendar {calendar_id}: {e}")
+            raise GoogleCalendarError(f"Failed to create events: {e}")
+        
+        results: List[Union[ParsedEvent, GoogleCalendarError]] = []
+        for event, (response, exception) in zip(events, responses):
+            if exception is not None:
+                logger.error(f"HTTP error creating event '{event.get('title')}' in calendar {calendar_id}: {exception}")
+                results.append(GoogleCalendarError(f"Failed to create event: {exception}"))
+            else:
+                results.append(_parse_event(response))  # type: ignore
+        
+        logger.info(f"Created {sum(1 for r in results if isinstance(r, dict))} of {len(events)} events in calendar {calendar_id}")
+        return results
+    
+    def batch_delete_events(self, events: List[Tuple[str, str]]) -> List[Union[bool, GoogleCalendarError]]:
+        """Delete several events using batch requests.
+        
+        Args:
+            events: (calendar_id, event_id) pairs to delete
+            
+        Returns:
+            For every event, in order: True if deleted, False if not found,
+            or the GoogleCalendarError it failed with
+        """
+        if not events:
+            return []
+        
+        try:
+            service = self._get_service()  # type: ignore
+            batch_requests = [
+                service.events().delete(calendarId=calendar_id, eventId=event_id)  # type: ignore
+                for calendar_id, event_id in events
+            ]
+            responses = self._execute_batch(batch_requests)
+        except Exception as e:
+            logger.error(f"Batch error deleting {len(events)} events: {e}")
+            raise GoogleCalendarError(f"Failed to delete events: {e}")
+        
+        results: List[Union[bool, GoogleCalendarError]] = []
+        for (calendar_id, event_id), (_, exception) in zip(events, responses):
+            if exception is None:
+                results.append(True)
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:  # type: ignore
+                logger.warning(f"Event {event_id} not found in calendar {calendar_id}")
+                results.append(False)
+            else:
+                logger.error(f"HTTP error deleting event {event_id}: {exception}")
+                results.append(GoogleCalendarError(f"Failed to delete event: {exception}"))
+        
+        logger.info(f"Deleted {sum(1 for r in results if r is True)} of {len(events)} events")
+        return results
     
     def find_events_by_time_and_title(self, calendar_id: str, start_time: datetime, 
-                                     end_time: datetime, title: str) -> List[Dict[str, Any]]:
+                                     end_time: datetime, title: str) -> List[ParsedEvent]:
         """Find events matching exact start time, end time, and title.
         
         Args:
@@ -275,43 +969,34 @@ class GoogleCalendarClient:
             title: Exact title to match
             
         Returns:
-            List of matching events
+            List of matching events (only id, title and timing are populated)
         """
+        # Not cached: busy blocks may be deleted or moved outside this client at any
+        # time, and bulk syncs answer these lookups from a target calendar snapshot
+        # Compare times as epoch minutes, ignoring seconds/microseconds
+        # (naive search and event times are treated as UTC)
+        target_start = _to_epoch_minute(start_time)
+        target_end = _to_epoch_minute(end_time)
+        target_title = title.lower()
+        
         try:
-            # Get events in a wider time range to ensure we capture the event
-            search_start = start_time - timedelta(hours=1)
-            search_end = end_time + timedelta(hours=1)
+            # events.list returns every event overlapping the window, so a narrow window
+            # around the exact times is enough; only fetch the fields needed to match.
+            # No q= search: Google's search index lags behind writes, so a just-created
+            # busy block could be missed and duplicated.
+            search_start = start_time - FIND_EVENTS_WINDOW
+            search_end = end_time + FIND_EVENTS_WINDOW
             
-            events = self.get_events(calendar_id, search_start, search_end)
-            
-            # Normalize the comparison times (remove seconds, microseconds)
-            # Handle timezone conversion: if search times are naive, treat them as UTC
-            # and convert event times to UTC for comparison
-            if start_time.tzinfo is None:
-                # Search times are naive, treat as UTC and convert event times to UTC
-                normalized_start = start_time.replace(second=0, microsecond=0)
-                normalized_end = end_time.replace(second=0, microsecond=0)
-            else:
-                # Search times have timezone, convert to UTC naive
-                normalized_start = start_time.astimezone(timezone.utc).replace(second=0, microsecond=0, tzinfo=None)
-                normalized_end = end_time.astimezone(timezone.utc).replace(second=0, microsecond=0, tzinfo=None)
+            events = self.get_events(calendar_id, search_start, search_end, fields=FIND_EVENTS_FIELDS)
             
             # Filter by exact match with normalized times
-            matching_events = []
-            for event in events:
-                # Convert event times to UTC naive for comparison
-                if event['start_time'].tzinfo is not None:
-                    event_start = event['start_time'].astimezone(timezone.utc).replace(second=0, microsecond=0, tzinfo=None)
-                    event_end = event['end_time'].astimezone(timezone.utc).replace(second=0, microsecond=0, tzinfo=None)
-                else:
-                    event_start = event['start_time'].replace(second=0, microsecond=0)
-                    event_end = event['end_time'].replace(second=0, microsecond=0)
-                
-                # Case-insensitive title comparison to handle Google Calendar auto-capitalization
-                if (event['title'].lower() == title.lower() and 
-                    event_start == normalized_start and 
-                    event_end == normalized_end):
-                    matching_events.append(event)  # type: ignore
+            # Case-insensitive title comparison to handle Google Calendar auto-capitalization
+            matching_events = [
+                event for event in events
+                if (event['title'].lower() == target_title and
+                    _to_epoch_minute(event['start_time']) == target_start and
+                    _to_epoch_minute(event['end_time']) == target_end)
+            ]
             
             return matching_events  # type: ignore
             
@@ -319,53 +1004,6 @@ class GoogleCalendarClient:
             logger.error(f"Error finding events by time and title: {e}")
             raise GoogleCalendarError(f"Failed to find events: {e}")
     
-    def _parse_event(self, event: Dict[str, Any]) -> Dict[str, Any]:  # type: ignore
-        """Parse Google Calendar API event into simplified format.
-        
-        Args:
-            event: Raw event from Google Calendar API
-            
-        Returns:
-            Simplified event dictionary
-        """
-        # Determine if this is an all-day event
-        start = event.get('start', {})
-        end = event.get('end', {})
-        is_all_day = 'date' in start and 'date' in end
-        
-        # Parse start time
-        if 'dateTime' in start:
-            start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
-        else:
-            # All-day event
-            start_time = datetime.fromisoformat(start.get('date', ''))
-        
-        # Parse end time
-        if 'dateTime' in end:
-            end_time = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
-        else:
-            # All-day event
-            end_time = datetime.fromisoformat(end.get('date', ''))
-        
-        # Parse attendees
-        attendees = event.get('attendees', [])
-        participants = [attendee.get('email', '') for attendee in attendees]
-        
-        return {
-            'id': event.get('id', ''),
-            'title': event.get('summary', ''),
-            'description': event.get('description', ''),
-            'start_time': start_time,
-            'end_time': end_time,
-            'all_day': is_all_day,
-            'participants': participants,
-            'participant_count': len(participants),
-            'status': event.get('status', 'unknown'),
-            'creator': event.get('creator', {}).get('email', ''),
-            'organizer': event.get('organizer', {}).get('email', ''),
-            'transparency': event.get('transparency', 'opaque')  # opaque = busy, transparent = free
-        }
-    
     def test_connection(self) -> bool:
         """Test if the client can connect to Google Calendar API.
         
@@ -380,12 +1018,7 @@ class GoogleCalendarClient:
             logger.error(f"Connection test failed: {e}")
             return False
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
+    @_calendar_op('creating push notification channel for calendar {calendar_id}', 'Failed to create webhook subscription')
     def create_push_notification_channel(self, calendar_id: str, webhook_url: str, 
                                        channel_id: str, channel_token: Optional[str] = None) -> Dict[str, Any]:
         """Create a push notification channel for calendar events.
@@ -399,49 +1032,139 @@ class GoogleCalendarClient:
         Returns:
             Channel information from Google Calendar API
         """
-        try:
-            service = self._get_service()  # type: ignore
-            
-            # Prepare channel configuration
-            channel_body = {
-                'id': channel_id,
-                'type': 'web_hook',
-                'address': webhook_url
-            }
-            
-            if channel_token:
-                channel_body['token'] = channel_token
+        service = self._get_service()  # type: ignore
+        
+        # Create the watch request
+        result = _execute_request(service.events().watch(  # type: ignore
+            calendarId=calendar_id,
+            body=self._build_channel_body(webhook_url, channel_id, channel_token)
+        ))
+        
+        logger.info(f"Created push notification channel {channel_id} for calendar {calendar_id}")
+        
+        return self._format_channel_result(result, calendar_id)  # type: ignore
+    
+    def _build_channel_body(self, webhook_url: str, channel_id: str,
+                            channel_token: Optional[str] = None) -> Dict[str, Any]:
+        """Build the API request body for a new push notification channel.
+        
+        Args:
+            webhook_url: URL to receive webhook notifications
+            channel_id: Unique channel identifier
+            channel_token: Optional verification token
             
-            # Create the watch request
-            result = service.events().watch(  # type: ignore
-                calendarId=calendar_id,
-                body=channel_body
-            ).execute()  # type: ignore
+        Returns:
+            Channel resource dictionary
+        """
+        channel_body = {
+            'id': channel_id,
+            'type': 'web_hook',
+            'address': webhook_url
+        }
+        
+        if channel_token:
+            channel_body['token'] = channel_token
+        
+        return channel_body
+    
+    def _format_channel_result(self, result: Dict[str, Any], calendar_id: str) -> Dict[str, Any]:
+        """Convert an events.watch response into channel information.
+        
+        Args:
+            result: Channel resource returned by the API
+            calendar_id: Calendar ID the channel watches
             
-            logger.info(f"Created push notification channel {channel_id} for calendar {calendar_id}")
+        Returns:
+            Channel information dictionary
+        """
+        return {
+            'channel_id': result.get('id', ''),
+            'resource_id': result.get('resourceId', ''),
+            'resource_uri': result.get('resourceUri', ''),
+            'expiration': result.get('expiration'),
+            'kind': result.get('kind', ''),
+            'calendar_id': calendar_id
+        }
+    
+    def batch_create_push_notification_channels(self, channels: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], GoogleCalendarError]]:
+        """Create several push notification channels using batch requests.
+        
+        Args:
+            channels: Keyword arguments for each channel, as accepted by
+                create_push_notification_channel (calendar_id, webhook_url, channel_id, channel_token)
             
-            return {
-                'channel_id': result.get('id', ''),  # type: ignore
-                'resource_id': result.get('resourceId', ''),  # type: ignore
-                'resource_uri': result.get('resourceUri', ''),  # type: ignore
-                'expiration': result.get('expiration'),  # type: ignore
-                'kind': result.get('kind', ''),  # type: ignore
-                'calendar_id': calendar_id
-            }
+        Returns:
+            For every channel, in order: channel information, or the GoogleCalendarError it failed with
+        """
+        if not channels:
+            return []
+        
+        try:
+            service = self._get_service()  # type: ignore
+            batch_requests = [
+                service.events().watch(  # type: ignore
+                    calendarId=channel['calendar_id'],
+                    body=self._build_channel_body(
+                        channel['webhook_url'], channel['channel_id'], channel.get('channel_token')
+                    )
+                )
+                for channel in channels
+            ]
+            responses = self._execute_batch(batch_requests)
+        except Exception as e:
+            logger.error(f"Batch error creating {len(channels)} push notification channels: {e}")
+            raise GoogleCalendarError(f"Failed to create webhook subscriptions: {e}")
+        
+        results: List[Union[Dict[str, Any], GoogleCalendarError]] = []
+        for channel, (response, exception) in zip(channels, responses):
+            if exception is not None:
+                logger.error(f"HTTP error creating push notification channel for calendar {channel['calendar_id']}: {exception}")
+                results.append(GoogleCalendarError(f"Failed to create webhook subscription: {exception}"))
+            else:
+                results.append(self._format_channel_result(response, channel['calendar_id']))  # type: ignore
+        
+        logger.info(f"Created {sum(1 for r in results if isinstance(r, dict))} of {len(channels)} push notification channels")
+        return results
+    
+    def batch_stop_push_notification_channels(self, channels: List[Tuple[str, str]]) -> List[Union[bool, GoogleCalendarError]]:
+        """Stop several push notification channels using batch requests.
+        
+        Args:
+            channels: (channel_id, resource_id) pairs to stop
             
-        except HttpError as e:
-            logger.error(f"HTTP error creating push notification channel for calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Failed to create webhook subscription: {e}")
+        Returns:
+            For every channel, in order: True if stopped, False if not found,
+            or the GoogleCalendarError it failed with
+        """
+        if not channels:
+            return []
+        
+        try:
+            service = self._get_service()  # type: ignore
+            batch_requests = [
+                service.channels().stop(body={'id': channel_id, 'resourceId': resource_id})  # type: ignore
+                for channel_id, resource_id in channels
+            ]
+            responses = self._execute_batch(batch_requests)
         except Exception as e:
-            logger.error(f"Unexpected error creating push notification channel for calendar {calendar_id}: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}")
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((HttpError, ConnectionError, TimeoutError)),
-        reraise=True
-    )
+            logger.error(f"Batch error stopping {len(channels)} push notification channels: {e}")
+            raise GoogleCalendarError(f"Failed to stop webhook subscriptions: {e}")
+        
+        results: List[Union[bool, GoogleCalendarError]] = []
+        for (channel_id, _), (_, exception) in zip(channels, responses):
+            if exception is None:
+                results.append(True)
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:  # type: ignore
+                logger.warning(f"Channel {channel_id} not found or already expired")
+                results.append(False)
+            else:
+                logger.error(f"HTTP error stopping push notification channel {channel_id}: {exception}")
+                results.append(GoogleCalendarError(f"Failed to stop webhook subscription: {exception}"))
+        
+        logger.info(f"Stopped {sum(1 for r in results if r is True)} of {len(channels)} push notification channels")
+        return results
+    
+    @_calendar_op('stopping push notification channel {channel_id}', 'Failed to stop webhook subscription')
     def stop_push_notification_channel(self, channel_id: str, resource_id: str) -> bool:
         """Stop a push notification channel.
         
@@ -456,23 +1179,18 @@ class GoogleCalendarClient:
             service = self._get_service()  # type: ignore
             
             # Stop the channel
-            service.channels().stop(  # type: ignore
+            _execute_request(service.channels().stop(  # type: ignore
                 body={
                     'id': channel_id,
                     'resourceId': resource_id
                 }
-            ).execute()  # type: ignore
+            ))
             
             logger.info(f"Stopped push notification channel {channel_id}")
             return True
             
         except HttpError as e:
-            if e.resp.status == 404:  # type: ignore
-                logger.warning(f"Channel {channel_id} not found or already expired")
-                return False
-            else:
-                logger.error(f"HTTP error stopping push notification channel {channel_id}: {e}")
-                raise GoogleCalendarError(f"Failed to stop webhook subscription: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error stopping push notification channel {channel_id}: {e}")
-            raise GoogleCalendarError(f"Unexpected error: {e}") 
\ No newline at end of file
+            if e.resp.status != 404:  # type: ignore
+                raise
+            logger.warning(f"Channel {channel_id} not found or already expired")
+            return False
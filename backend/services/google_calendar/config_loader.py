@@ -6,8 +6,11 @@ MultiAccountConfig instances for managing multiple Google accounts and sync flow
 """
 
 import os
+import re
 import logging
-from typing import Dict, List, Any
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
 
 from backend.models.google_account import GoogleAccount
 from backend.models.calendar import (
@@ -18,181 +21,337 @@ from backend.models.calendar import (
 logger = logging.getLogger(__name__)
 
 
+# Matches indexed configuration variables such as GOOGLE_ACCOUNT_1_EMAIL or SYNC_FLOW_2_NAME
+_INDEXED_ENV_KEY = re.compile(r'^(GOOGLE_ACCOUNT|SYNC_FLOW)_([1-9]\d*)_(.+)$')
+
+# Required GOOGLE_ACCOUNT_N_* suffixes, in the order missing ones are reported
+ACCOUNT_ENV_SUFFIXES = ("EMAIL", "CLIENT_ID", "CLIENT_SECRET", "REFRESH_TOKEN")
+
+# Required SYNC_FLOW_N_* suffixes, in the order missing ones are reported
+FLOW_ENV_SUFFIXES = (
+    "NAME", "SOURCE_ACCOUNT_ID", "SOURCE_CALENDAR_ID",
+    "TARGET_ACCOUNT_ID", "TARGET_CALENDAR_ID", "START_OFFSET", "END_OFFSET"
+)
+
+# Last parsed configuration together with the configuration variables it was parsed from
+_config_cache: Optional[Tuple[Tuple[Dict[str, Dict[int, Dict[str, str]]], str], "_EnvConfig"]] = None
+_config_cache_lock = threading.Lock()
+
+
 class ConfigurationError(Exception):
     """Exception raised when configuration loading fails."""
     pass
 
 
-def load_google_accounts_from_env() -> List[GoogleAccount]:
-    """Load Google accounts from environment variables.
+@dataclass(slots=True)
+class AccountSummary:
+    """Unvalidated summary of one GOOGLE_ACCOUNT_N_* group."""
+    account_id: int
+    email: str
+    has_client_id: bool
+    has_client_secret: bool
+    has_refresh_token: bool
+
+
+@dataclass(slots=True)
+class FlowSummary:
+    """Unvalidated summary of one SYNC_FLOW_N_* group, with raw string values."""
+    flow_id: int
+    name: str
+    source_account_id: str
+    source_calendar_id: str
+    target_account_id: str
+    target_calendar_id: str
+    start_offset: str
+    end_offset: str
+
+
+class _EnvConfig(NamedTuple):
+    """Configuration and summary parsed from one pass over the environment."""
+    config: Optional[MultiAccountConfig]
+    error: Optional[str]
+    accounts: List[AccountSummary]
+    sync_flows: List[FlowSummary]
+    polling_settings: Dict[str, str]
+
+
+def _scan_env() -> Dict[str, Dict[int, Dict[str, str]]]:
+    """Group indexed configuration variables in a single pass over os.environ.
     
-    Expected environment variables:
-    - GOOGLE_ACCOUNT_N_EMAIL: Email address for account N
-    - GOOGLE_ACCOUNT_N_CLIENT_ID: OAuth2 client ID for account N
-    - GOOGLE_ACCOUNT_N_CLIENT_SECRET: OAuth2 client secret for account N
-    - GOOGLE_ACCOUNT_N_REFRESH_TOKEN: OAuth2 refresh token for account N
+    Returns:
+        Mapping of prefix (GOOGLE_ACCOUNT or SYNC_FLOW) to {index: {suffix: value}}
+    """
+    groups: Dict[str, Dict[int, Dict[str, str]]] = {"GOOGLE_ACCOUNT": {}, "SYNC_FLOW": {}}
+    match = _INDEXED_ENV_KEY.match
+    for key, value in os.environ.items():
+        key_match = match(key)
+        if key_match:
+            prefix, index, suffix = key_match.groups()
+            groups[prefix].setdefault(int(index), {})[suffix] = value
+    return groups
+
+
+def _indexed_entries(entries: Dict[int, Dict[str, str]], first_suffix: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield grouped entries numbered contiguously from 1.
     
-    Where N is a positive integer (1, 2, 3, ...)
+    Args:
+        entries: Variables by index and suffix, as grouped by _scan_env
+        first_suffix: Suffix whose absence ends the list (EMAIL or NAME), as
+            accounts and flows are numbered without gaps
+        
+    Returns:
+        Iterator of (index, {suffix: value}) pairs
+    """
+    index = 1
+    while first_suffix in entries.get(index, {}):
+        yield index, entries[index]
+        index += 1
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached configuration so the next load re-parses the environment."""
+    global _config_cache
+    with _config_cache_lock:
+        _config_cache = None
+
+
+def _load_accounts(account_vars: Dict[int, Dict[str, str]]) -> Tuple[GoogleAccount, ...]:
+    """Build GoogleAccount instances from grouped GOOGLE_ACCOUNT_N_* variables.
     
+    Args:
+        account_vars: Account variables by index and suffix, as grouped by _scan_env
+        
     Returns:
-        List of GoogleAccount instances
+        Tuple of GoogleAccount instances
         
     Raises:
         ConfigurationError: If required environment variables are missing
     """
     accounts: List[GoogleAccount] = []
-    account_id = 1
     
-    while True:
-        # Check for account configuration
-        email_key = f"GOOGLE_ACCOUNT_{account_id}_EMAIL"
-        client_id_key = f"GOOGLE_ACCOUNT_{account_id}_CLIENT_ID"
-        client_secret_key = f"GOOGLE_ACCOUNT_{account_id}_CLIENT_SECRET"
-        refresh_token_key = f"GOOGLE_ACCOUNT_{account_id}_REFRESH_TOKEN"
-        
-        # If the first key doesn't exist, stop looking
-        if email_key not in os.environ:
-            break
-        
-        # Validate all required keys exist
-        missing_keys: List[str] = []
-        for key in [email_key, client_id_key, client_secret_key, refresh_token_key]:
-            if key not in os.environ or not os.environ[key].strip():
-                missing_keys.append(key)
+    for account_id, env in _indexed_entries(account_vars, "EMAIL"):
+        # Strip each value once and validate all required keys exist
+        vals = {suffix: env.get(suffix, "").strip() for suffix in ACCOUNT_ENV_SUFFIXES}
+        missing_keys = [suffix for suffix, value in vals.items() if not value]
         
         if missing_keys:
-            raise ConfigurationError(f"Missing or empty environment variables for account {account_id}: {', '.join(missing_keys)}")
+            prefix = "GOOGLE_ACCOUNT_" + str(account_id) + "_"
+            raise ConfigurationError(f"Missing or empty environment variables for account {account_id}: {', '.join(prefix + suffix for suffix in missing_keys)}")
         
         # Create account
         account = GoogleAccount(
             account_id=account_id,
-            email=os.environ[email_key].strip(),
-            client_id=os.environ[client_id_key].strip(),
-            client_secret=os.environ[client_secret_key].strip(),
-            refresh_token=os.environ[refresh_token_key].strip()
+            email=vals["EMAIL"],
+            client_id=vals["CLIENT_ID"],
+            client_secret=vals["CLIENT_SECRET"],
+            refresh_token=vals["REFRESH_TOKEN"]
         )
         
         accounts.append(account)
         logger.info(f"Loaded account {account_id}: {account.email}")
-        
-        account_id += 1
     
     if not accounts:
         raise ConfigurationError("No Google accounts configured. Please set GOOGLE_ACCOUNT_1_* environment variables.")
     
-    return accounts
+    # Accounts are read-only once loaded
+    return tuple(accounts)
 
 
-def load_sync_flows_from_env() -> List[SyncFlow]:
-    """Load sync flows from environment variables.
+def load_google_accounts_from_env() -> Tuple[GoogleAccount, ...]:
+    """Load Google accounts from environment variables.
     
     Expected environment variables:
-    - SYNC_FLOW_N_NAME: Human-readable name for sync flow N
-    - SYNC_FLOW_N_SOURCE_ACCOUNT_ID: Source account ID for sync flow N
-    - SYNC_FLOW_N_SOURCE_CALENDAR_ID: Source calendar ID for sync flow N
-    - SYNC_FLOW_N_TARGET_ACCOUNT_ID: Target account ID for sync flow N
-    - SYNC_FLOW_N_TARGET_CALENDAR_ID: Target calendar ID for sync flow N
-    - SYNC_FLOW_N_START_OFFSET: Start offset in minutes for sync flow N
-    - SYNC_FLOW_N_END_OFFSET: End offset in minutes for sync flow N
+    - GOOGLE_ACCOUNT_N_EMAIL: Email address for account N
+    - GOOGLE_ACCOUNT_N_CLIENT_ID: OAuth2 client ID for account N
+    - GOOGLE_ACCOUNT_N_CLIENT_SECRET: OAuth2 client secret for account N
+    - GOOGLE_ACCOUNT_N_REFRESH_TOKEN: OAuth2 refresh token for account N
     
     Where N is a positive integer (1, 2, 3, ...)
     
     Returns:
-        List of SyncFlow instances
+        Tuple of GoogleAccount instances
         
     Raises:
-        ConfigurationError: If required environment variables are missing or invalid
+        ConfigurationError: If required environment variables are missing
     """
-    flows: List[SyncFlow] = []
-    flow_id = 1
+    return _load_accounts(_scan_env()["GOOGLE_ACCOUNT"])
+
+
+def _parse_int(vals: Dict[str, str], suffix: str, flow_id: int) -> int:
+    """Parse a stripped numeric sync flow value.
+    
+    Args:
+        vals: Stripped flow values by suffix
+        suffix: Suffix of the value to parse
+        flow_id: Sync flow index, for the error message
+        
+    Returns:
+        Parsed integer
+        
+    Raises:
+        ConfigurationError: If the value is not an integer, naming the offending variable
+    """
+    try:
+        return int(vals[suffix])
+    except ValueError:
+        raise ConfigurationError(
+            f"Invalid numeric value in sync flow {flow_id}: SYNC_FLOW_{flow_id}_{suffix}={vals[suffix]!r}"
+        ) from None
+
+
+def _load_sync_flows(flow_vars: Dict[int, Dict[str, str]]) -> Tuple[SyncFlow, ...]:
+    """Build SyncFlow instances from grouped SYNC_FLOW_N_* variables.
     
-    while True:
-        # Check for flow configuration
-        name_key = f"SYNC_FLOW_{flow_id}_NAME"
-        source_account_key = f"SYNC_FLOW_{flow_id}_SOURCE_ACCOUNT_ID"
-        source_calendar_key = f"SYNC_FLOW_{flow_id}_SOURCE_CALENDAR_ID"
-        target_account_key = f"SYNC_FLOW_{flow_id}_TARGET_ACCOUNT_ID"
-        target_calendar_key = f"SYNC_FLOW_{flow_id}_TARGET_CALENDAR_ID"
-        start_offset_key = f"SYNC_FLOW_{flow_id}_START_OFFSET"
-        end_offset_key = f"SYNC_FLOW_{flow_id}_END_OFFSET"
+    Args:
+        flow_vars: Flow variables by index and suffix, as grouped by _scan_env
         
-        # If the first key doesn't exist, stop looking
-        if name_key not in os.environ:
-            break
+    Returns:
+        Tuple of SyncFlow instances
         
-        # Validate all required keys exist
-        missing_keys: List[str] = []
-        for key in [name_key, source_account_key, source_calendar_key, 
-                   target_account_key, target_calendar_key, start_offset_key, end_offset_key]:
-            if key not in os.environ or not os.environ[key].strip():
-                missing_keys.append(key)
+    Raises:
+        ConfigurationError: If required environment variables are missing or invalid
+    """
+    flows: List[SyncFlow] = []
+    
+    for flow_id, env in _indexed_entries(flow_vars, "NAME"):
+        # Strip each value once and validate all required keys exist
+        vals = {suffix: env.get(suffix, "").strip() for suffix in FLOW_ENV_SUFFIXES}
+        missing_keys = [suffix for suffix, value in vals.items() if not value]
         
         if missing_keys:
-            raise ConfigurationError(f"Missing or empty environment variables for sync flow {flow_id}: {', '.join(missing_keys)}")
-        
-        # Parse and validate numeric values
-        try:
-            source_account_id = int(os.environ[source_account_key].strip())
-            target_account_id = int(os.environ[target_account_key].strip())
-            start_offset = int(os.environ[start_offset_key].strip())
-            end_offset = int(os.environ[end_offset_key].strip())
-        except ValueError as e:
-            raise ConfigurationError(f"Invalid numeric value in sync flow {flow_id}: {e}")
+            prefix = "SYNC_FLOW_" + str(flow_id) + "_"
+            raise ConfigurationError(f"Missing or empty environment variables for sync flow {flow_id}: {', '.join(prefix + suffix for suffix in missing_keys)}")
         
-        # Create sync flow
+        # Create sync flow, parsing and validating numeric values
         flow = SyncFlow(
-            name=os.environ[name_key].strip(),
-            source_account_id=source_account_id,
-            source_calendar_id=os.environ[source_calendar_key].strip(),
-            target_account_id=target_account_id,
-            target_calendar_id=os.environ[target_calendar_key].strip(),
-            start_offset=start_offset,
-            end_offset=end_offset
+            name=vals["NAME"],
+            source_account_id=_parse_int(vals, "SOURCE_ACCOUNT_ID", flow_id),
+            source_calendar_id=vals["SOURCE_CALENDAR_ID"],
+            target_account_id=_parse_int(vals, "TARGET_ACCOUNT_ID", flow_id),
+            target_calendar_id=vals["TARGET_CALENDAR_ID"],
+            start_offset=_parse_int(vals, "START_OFFSET", flow_id),
+            end_offset=_parse_int(vals, "END_OFFSET", flow_id)
         )
         
         flows.append(flow)
         logger.info(f"Loaded sync flow {flow_id}: {flow.name}")
-        
-        flow_id += 1
     
     if not flows:
         raise ConfigurationError("No sync flows configured. Please set SYNC_FLOW_1_* environment variables.")
     
-    return flows
+    # Flows are read-only once loaded
+    return tuple(flows)
 
 
-def load_multi_account_config() -> MultiAccountConfig:
-    """Load complete multi-account configuration from environment variables.
+def load_sync_flows_from_env() -> Tuple[SyncFlow, ...]:
+    """Load sync flows from environment variables.
+    
+    Expected environment variables:
+    - SYNC_FLOW_N_NAME: Human-readable name for sync flow N
+    - SYNC_FLOW_N_SOURCE_ACCOUNT_ID: Source account ID for sync flow N
+    - SYNC_FLOW_N_SOURCE_CALENDAR_ID: Source calendar ID for sync flow N
+    - SYNC_FLOW_N_TARGET_ACCOUNT_ID: Target account ID for sync flow N
+    - SYNC_FLOW_N_TARGET_CALENDAR_ID: Target calendar ID for sync flow N
+    - SYNC_FLOW_N_START_OFFSET: Start offset in minutes for sync flow N
+    - SYNC_FLOW_N_END_OFFSET: End offset in minutes for sync flow N
+    
+    Where N is a positive integer (1, 2, 3, ...)
     
     Returns:
-        MultiAccountConfig instance with all accounts and sync flows
+        Tuple of SyncFlow instances
         
     Raises:
-        ConfigurationError: If configuration is invalid or incomplete
+        ConfigurationError: If required environment variables are missing or invalid
+    """
+    return _load_sync_flows(_scan_env()["SYNC_FLOW"])
+
+
+def _parse_env_config() -> _EnvConfig:
+    """Parse configuration and its summary in one pass over the environment.
+    
+    The result is cached and reused until any GOOGLE_ACCOUNT_N_*, SYNC_FLOW_N_*
+    or SYNC_INTERVAL_MINUTES variable changes or invalidate_config_cache() is called.
+    
+    Returns:
+        Parsed configuration, or the reason it is invalid, along with summary data
     """
+    global _config_cache
+    groups = _scan_env()
+    sync_interval = os.environ.get("SYNC_INTERVAL_MINUTES", "60")
+    env_key = (groups, sync_interval)
+    with _config_cache_lock:
+        if _config_cache is not None and _config_cache[0] == env_key:
+            return _config_cache[1]
+    
+    account_summaries = [
+        AccountSummary(
+            account_id=account_id,
+            email=env.get("EMAIL", ""),
+            has_client_id=bool(env.get("CLIENT_ID", "")),
+            has_client_secret=bool(env.get("CLIENT_SECRET", "")),
+            has_refresh_token=bool(env.get("REFRESH_TOKEN", ""))
+        )
+        for account_id, env in _indexed_entries(groups["GOOGLE_ACCOUNT"], "EMAIL")
+    ]
+    flow_summaries = [
+        FlowSummary(
+            flow_id=flow_id,
+            name=env.get("NAME", ""),
+            source_account_id=env.get("SOURCE_ACCOUNT_ID", ""),
+            source_calendar_id=env.get("SOURCE_CALENDAR_ID", ""),
+            target_account_id=env.get("TARGET_ACCOUNT_ID", ""),
+            target_calendar_id=env.get("TARGET_CALENDAR_ID", ""),
+            start_offset=env.get("START_OFFSET", ""),
+            end_offset=env.get("END_OFFSET", "")
+        )
+        for flow_id, env in _indexed_entries(groups["SYNC_FLOW"], "NAME")
+    ]
+    
+    config: Optional[MultiAccountConfig] = None
+    error: Optional[str] = None
     try:
-        # Load accounts
-        accounts = load_google_accounts_from_env()
-        
-        # Load sync flows
-        sync_flows = load_sync_flows_from_env()
-        
-        # Load polling settings
-        sync_interval_minutes = int(os.environ.get("SYNC_INTERVAL_MINUTES", "60"))
-        
-        # Create configuration
+        accounts = _load_accounts(groups["GOOGLE_ACCOUNT"])
+        sync_flows = _load_sync_flows(groups["SYNC_FLOW"])
         config = MultiAccountConfig(
             accounts=accounts,
             sync_flows=sync_flows,
-            sync_interval_minutes=sync_interval_minutes
+            sync_interval_minutes=int(sync_interval)
         )
-        
         logger.info(f"Loaded configuration: {len(accounts)} accounts, {len(sync_flows)} sync flows")
-        
-        return config
-        
     except Exception as e:
-        raise ConfigurationError(f"Failed to load multi-account configuration: {e}")
+        error = str(e)
+    
+    parsed = _EnvConfig(
+        config=config,
+        error=error,
+        accounts=account_summaries,
+        sync_flows=flow_summaries,
+        polling_settings={"sync_interval_minutes": sync_interval}
+    )
+    with _config_cache_lock:
+        _config_cache = (env_key, parsed)
+    return parsed
+
+
+def load_multi_account_config() -> MultiAccountConfig:
+    """Load complete multi-account configuration from environment variables.
+    
+    The parsed configuration is cached until any GOOGLE_ACCOUNT_*, SYNC_FLOW_*
+    or SYNC_INTERVAL_MINUTES variable changes or invalidate_config_cache() is
+    called. Each caller gets its own copy, so changing one (e.g. the polling
+    interval) doesn't change what later callers load; the account and flow
+    tuples are shared.
+    
+    Returns:
+        MultiAccountConfig instance with all accounts and sync flows
+        
+    Raises:
+        ConfigurationError: If configuration is invalid or incomplete
+    """
+    parsed = _parse_env_config()
+    if parsed.config is None:
+        raise ConfigurationError(f"Failed to load multi-account configuration: {parsed.error}")
+    return parsed.config.model_copy()
 
 
 def validate_environment_variables() -> Dict[str, str]:
@@ -204,36 +363,24 @@ def validate_environment_variables() -> Dict[str, str]:
     Raises:
         ConfigurationError: If critical environment variables are missing
     """
-    validation_results: Dict[str, str] = {}
+    parsed = _parse_env_config()
+    if parsed.config is None:
+        raise ConfigurationError(f"Environment validation failed: {parsed.error}")
     
-    try:
-        # Try to load accounts
-        accounts = load_google_accounts_from_env()
-        validation_results["accounts"] = f"Found {len(accounts)} accounts"
-        
-        # Try to load sync flows
-        sync_flows = load_sync_flows_from_env()
-        validation_results["sync_flows"] = f"Found {len(sync_flows)} sync flows"
-        
-        # Check polling settings
-        sync_interval_minutes = int(os.environ.get("SYNC_INTERVAL_MINUTES", "60"))
-        if not (1 <= sync_interval_minutes <= 1440):  # 1 minute to 24 hours
-            validation_results["sync_interval_minutes"] = "Invalid interval (must be 1-1440 minutes)"
-        else:
-            validation_results["sync_interval_minutes"] = f"Interval: {sync_interval_minutes} minutes"
-        
-        # Try to create full configuration to validate cross-references
-        MultiAccountConfig(
-            accounts=accounts,
-            sync_flows=sync_flows,
-            sync_interval_minutes=sync_interval_minutes
-        )
-        
-        validation_results["validation"] = "All validations passed"
-        
-    except Exception as e:
-        validation_results["error"] = str(e)
-        raise ConfigurationError(f"Environment validation failed: {e}")
+    config = parsed.config
+    validation_results: Dict[str, str] = {
+        "accounts": f"Found {len(config.accounts)} accounts",
+        "sync_flows": f"Found {len(config.sync_flows)} sync flows"
+    }
+    
+    # Check polling settings
+    sync_interval_minutes = config.sync_interval_minutes
+    if not (1 <= sync_interval_minutes <= 1440):  # 1 minute to 24 hours
+        validation_results["sync_interval_minutes"] = "Invalid interval (must be 1-1440 minutes)"
+    else:
+        validation_results["sync_interval_minutes"] = f"Interval: {sync_interval_minutes} minutes"
+    
+    validation_results["validation"] = "All validations passed"
     
     return validation_results
 
@@ -244,63 +391,15 @@ def get_configuration_summary() -> Dict[str, Any]:
     Returns:
         Dictionary with configuration summary
     """
-    summary: Dict[str, Any] = {
-        "accounts": [],
-        "sync_flows": [],
-        "polling_settings": {},
-        "validation_status": "unknown"
-    }
-    
-    # Check accounts
-    account_id = 1
-    while True:
-        email_key = f"GOOGLE_ACCOUNT_{account_id}_EMAIL"
-        if email_key not in os.environ:
-            break
-        
-        account_info = {
-            "account_id": account_id,
-            "email": os.environ.get(email_key, ""),
-            "has_client_id": bool(os.environ.get(f"GOOGLE_ACCOUNT_{account_id}_CLIENT_ID", "")),
-            "has_client_secret": bool(os.environ.get(f"GOOGLE_ACCOUNT_{account_id}_CLIENT_SECRET", "")),
-            "has_refresh_token": bool(os.environ.get(f"GOOGLE_ACCOUNT_{account_id}_REFRESH_TOKEN", ""))
-        }
-        summary["accounts"].append(account_info)  # type: ignore
-        account_id += 1
-    
-    # Check sync flows
-    flow_id = 1
-    while True:
-        name_key = f"SYNC_FLOW_{flow_id}_NAME"
-        if name_key not in os.environ:
-            break
-        
-        flow_info = {
-            "flow_id": flow_id,
-            "name": os.environ.get(name_key, ""),
-            "source_account_id": os.environ.get(f"SYNC_FLOW_{flow_id}_SOURCE_ACCOUNT_ID", ""),
-            "source_calendar_id": os.environ.get(f"SYNC_FLOW_{flow_id}_SOURCE_CALENDAR_ID", ""),
-            "target_account_id": os.environ.get(f"SYNC_FLOW_{flow_id}_TARGET_ACCOUNT_ID", ""),
-            "target_calendar_id": os.environ.get(f"SYNC_FLOW_{flow_id}_TARGET_CALENDAR_ID", ""),
-            "start_offset": os.environ.get(f"SYNC_FLOW_{flow_id}_START_OFFSET", ""),
-            "end_offset": os.environ.get(f"SYNC_FLOW_{flow_id}_END_OFFSET", "")
-        }
-        summary["sync_flows"].append(flow_info)  # type: ignore
-        flow_id += 1
+    parsed = _parse_env_config()
     
-    # Check polling settings
-    summary["polling_settings"] = {
-        "sync_interval_minutes": os.environ.get("SYNC_INTERVAL_MINUTES", "60")
+    # Convert the cached summaries to fresh dicts so callers can modify the result freely
+    return {
+        "accounts": [asdict(account_info) for account_info in parsed.accounts],
+        "sync_flows": [asdict(flow_info) for flow_info in parsed.sync_flows],
+        "polling_settings": dict(parsed.polling_settings),
+        "validation_status": (
+            "valid" if parsed.config is not None
+            else f"invalid: Environment validation failed: {parsed.error}"
+        )
     }
-    
-    # Try validation
-    try:
-        validate_environment_variables()
-        summary["validation_status"] = "valid"
-    except Exception as e:
-        summary["validation_status"] = f"invalid: {e}"
-    
-    return summary
-
-
- 
\ No newline at end of file
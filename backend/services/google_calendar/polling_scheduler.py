@@ -5,11 +5,12 @@ This module provides a backup polling system that runs daily to catch
 any events that might have been missed by the webhook system.
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
-from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
-from apscheduler.triggers.cron import CronTrigger  # type: ignore
 
 from backend.models.calendar import (
     MultiAccountConfig,
@@ -21,14 +22,37 @@ from backend.models.calendar import (
 from backend.services.google_calendar.sync_engine import CalendarSyncEngine
 from backend.services.google_calendar.account_manager import AccountManager
 
+# APScheduler is imported lazily in start(), so manual syncs don't pay for loading it
+if TYPE_CHECKING:
+    from apscheduler.job import Job  # type: ignore
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
+    from apscheduler.triggers.cron import CronTrigger  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# APScheduler job ID of the recurring sync job
+PERIODIC_SYNC_JOB_ID = 'periodic_calendar_sync'
+
+# Number of most recent job runs kept for get_job_history
+JOB_HISTORY_SIZE = 100
+
 
 class PollingSchedulerError(Exception):
     """Exception raised when polling scheduler operations fail."""
     pass
 
 
+@dataclass(slots=True)
+class _SchedulerStatsState:
+    """Mutable run counters, exported as SchedulerStats on demand."""
+    total_runs: int = 0
+    successful_runs: int = 0
+    failed_runs: int = 0
+    last_run_time: Optional[str] = None
+    last_run_success: bool = False
+    last_run_error: Optional[str] = None
+
+
 class CalendarPollingScheduler:
     """Daily polling scheduler for calendar synchronization backup."""
     
@@ -43,18 +67,19 @@ class CalendarPollingScheduler:
         self.config = config
         self.account_manager = account_manager
         self.sync_engine = sync_engine
-        self.scheduler: Optional[AsyncIOScheduler] = None
+        self.scheduler: Optional["AsyncIOScheduler"] = None
+        self._job: Optional["Job"] = None
+        self._trigger: Optional["CronTrigger"] = None
+        # Next run time with its ISO string, re-formatted only after the job fires
+        self._next_run_iso: Tuple[Optional[datetime], Optional[str]] = (None, None)
         self.is_running = False
         
         # Stats tracking
-        self.stats: Dict[str, Any] = {
-            'total_runs': 0,
-            'successful_runs': 0,
-            'failed_runs': 0,
-            'last_run_time': None,
-            'last_run_success': False,
-            'last_run_error': None
-        }
+        self._stats = _SchedulerStatsState()
+        # Read-only export of stats, rebuilt on every (rare) write for cheap reads
+        self._stats_snapshot = SchedulerStats(**asdict(self._stats))
+        self._history: deque[JobHistoryEntry] = deque(maxlen=JOB_HISTORY_SIZE)
+        self._run_lock = asyncio.Lock()
         
         logger.info(f"Initialized polling scheduler for {len(config.sync_flows)} sync flows")
     
@@ -65,21 +90,23 @@ class CalendarPollingScheduler:
             return
         
         try:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
+            
             # Create scheduler
             self.scheduler = AsyncIOScheduler()
             
             # Schedule periodic sync job
-            trigger = CronTrigger(
-                minute=f"*/{self.config.sync_interval_minutes}",
-                second=0
-            )
+            trigger = self._periodic_trigger()
             
-            self.scheduler.add_job(  # type: ignore
+            # Keep the job handle so next run lookups skip the job store
+            self._job = self.scheduler.add_job(  # type: ignore
                 self._run_periodic_sync,
                 trigger=trigger,
-                id='periodic_calendar_sync',
+                id=PERIODIC_SYNC_JOB_ID,
                 name='Periodic Calendar Sync',
-                replace_existing=True
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
             )
             
             # Start scheduler
@@ -92,6 +119,21 @@ class CalendarPollingScheduler:
             logger.error(f"Error starting polling scheduler: {e}")
             raise PollingSchedulerError(f"Failed to start polling scheduler: {e}")
     
+    def _periodic_trigger(self) -> "CronTrigger":
+        """Get the cron trigger for the configured sync interval.
+        
+        The trigger is built once and reused across restarts until
+        update_schedule changes the interval.
+        """
+        if self._trigger is None:
+            from apscheduler.triggers.cron import CronTrigger  # type: ignore
+            
+            self._trigger = CronTrigger(
+                minute=f"*/{self.config.sync_interval_minutes}",
+                second=0
+            )
+        return self._trigger
+    
     def stop(self) -> None:
         """Stop the polling scheduler."""
         if not self.is_running:
@@ -103,6 +145,7 @@ class CalendarPollingScheduler:
                 self.scheduler.shutdown(wait=False)  # type: ignore
                 self.scheduler = None
             
+            self._job = None
             self.is_running = False
             logger.info("Stopped polling scheduler")
             
@@ -112,48 +155,74 @@ class CalendarPollingScheduler:
     
     async def _run_periodic_sync(self) -> None:
         """Run periodic sync job."""
-        run_start_time = datetime.now()
-        
-        logger.info("Starting periodic calendar sync job")
+        # Skip instead of queueing when a previous run (e.g. a forced one) is still going
+        if self._run_lock.locked():
+            logger.warning("Skipping periodic calendar sync: previous run still in progress")
+            return
         
-        try:
-            # Update stats
-            self.stats['total_runs'] += 1
-            self.stats['last_run_time'] = run_start_time.isoformat()
-            
-            # Calculate sync date range
-            # Sync from 2 days ago to 14 days from now
-            start_date = run_start_time - timedelta(days=2)
-            end_date = run_start_time + timedelta(days=14)
-            
-            # Run sync
-            sync_results = self.sync_engine.sync_all_source_calendars(
-                start_date=start_date,
-                end_date=end_date,
-                sync_type="polling"
-            )
+        async with self._run_lock:
+            run_start_time = datetime.now()
+            run_time = run_start_time.isoformat()
             
-            # Update stats
-            self.stats['successful_runs'] += 1
-            self.stats['last_run_success'] = True
-            self.stats['last_run_error'] = None
+            logger.info("Starting periodic calendar sync job")
             
-            # Log results
-            run_duration = (datetime.now() - run_start_time).total_seconds()
-            logger.info(f"Daily sync completed successfully in {run_duration:.2f}s: "
-                       f"{sync_results.calendars_synced} calendars, "
-                       f"{sync_results.total_events_found} events found, "
-                       f"{sync_results.total_events_processed} events processed")
-            
-        except Exception as e:
-            # Update stats
-            self.stats['failed_runs'] += 1
-            self.stats['last_run_success'] = False
-            self.stats['last_run_error'] = str(e)
-            
-            logger.error(f"Daily sync failed: {e}")
-            
-            # Don't re-raise - we want the scheduler to continue
+            try:
+                # Update stats
+                self._stats.total_runs += 1
+                self._stats.last_run_time = run_time
+                self._refresh_stats_snapshot()
+                
+                # Calculate sync date range
+                # Sync from 2 days ago to 14 days from now
+                start_date = run_start_time - timedelta(days=2)
+                end_date = run_start_time + timedelta(days=14)
+                
+                # Run sync; periodic runs only process what changed since the previous run.
+                # The sync blocks on Google API calls, so it runs in a worker thread to keep
+                # the event loop serving requests and webhooks meanwhile
+                sync_results = await asyncio.to_thread(
+                    self.sync_engine.sync_all_source_calendars,
+                    start_date=start_date,
+                    end_date=end_date,
+                    sync_type="polling",
+                    incremental=True
+                )
+                
+                # Update stats
+                self._stats.successful_runs += 1
+                self._stats.last_run_success = True
+                self._stats.last_run_error = None
+                self._refresh_stats_snapshot()
+                self._history.append(JobHistoryEntry(
+                    run_time=run_time,
+                    success=True,
+                    type='periodic_sync'
+                ))
+                
+                # Log results
+                run_end_time = datetime.now()
+                run_duration = (run_end_time - run_start_time).total_seconds()
+                logger.info(f"Daily sync completed successfully in {run_duration:.2f}s: "
+                           f"{sync_results.calendars_synced} calendars, "
+                           f"{sync_results.total_events_found} events found, "
+                           f"{sync_results.total_events_processed} events processed")
+                
+            except Exception as e:
+                # Update stats
+                self._stats.failed_runs += 1
+                self._stats.last_run_success = False
+                self._stats.last_run_error = str(e)
+                self._refresh_stats_snapshot()
+                self._history.append(JobHistoryEntry(
+                    run_time=run_time,
+                    success=False,
+                    error=self._stats.last_run_error,
+                    type='periodic_sync'
+                ))
+                
+                logger.error(f"Daily sync failed: {e}")
+                
+                # Don't re-raise - we want the scheduler to continue
     
     def run_manual_sync(self, days_back: int = 2, days_forward: int = 14) -> CompleteSyncResult:
         """Run manual sync operation.
@@ -169,11 +238,23 @@ class CalendarPollingScheduler:
         
         logger.info(f"Starting manual sync: {days_back} days back, {days_forward} days forward")
         
+        # Calculate sync date range and the failed result up front; a failed
+        # sync only needs its duration filled in
+        start_date = sync_start_time - timedelta(days=days_back)
+        end_date = sync_start_time + timedelta(days=days_forward)
+        sync_start_iso = sync_start_time.isoformat()
+        result = CompleteSyncResult(
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            sync_type="manual",
+            calendars_synced=0,
+            total_events_found=0,
+            total_events_processed=0,
+            calendar_results=[],
+            sync_start_time=sync_start_iso
+        )
+        
         try:
-            # Calculate sync date range
-            start_date = sync_start_time - timedelta(days=days_back)
-            end_date = sync_start_time + timedelta(days=days_forward)
-            
             # Run sync
             sync_results = self.sync_engine.sync_all_source_calendars(
                 start_date=start_date,
@@ -182,9 +263,10 @@ class CalendarPollingScheduler:
             )
             
             # Add timing info
-            sync_duration = (datetime.now() - sync_start_time).total_seconds()
+            sync_end_time = datetime.now()
+            sync_duration = (sync_end_time - sync_start_time).total_seconds()
             sync_results.sync_duration_seconds = sync_duration
-            sync_results.sync_start_time = sync_start_time.isoformat()
+            sync_results.sync_start_time = sync_start_iso
             
             logger.info(f"Manual sync completed in {sync_duration:.2f}s: "
                        f"{sync_results.calendars_synced} calendars, "
@@ -195,22 +277,11 @@ class CalendarPollingScheduler:
             
         except Exception as e:
             logger.error(f"Manual sync failed: {e}")
-            # Calculate sync date range for error result
-            start_date = sync_start_time - timedelta(days=days_back)
-            end_date = sync_start_time + timedelta(days=days_forward)
+            sync_end_time = datetime.now()
             
-            # Return a failed sync result
-            return CompleteSyncResult(
-                start_date=start_date.isoformat(),
-                end_date=end_date.isoformat(),
-                sync_type="manual",
-                calendars_synced=0,
-                total_events_found=0,
-                total_events_processed=0,
-                calendar_results=[],
-                sync_duration_seconds=(datetime.now() - sync_start_time).total_seconds(),
-                sync_start_time=sync_start_time.isoformat()
-            )
+            # Return the prebuilt failed sync result
+            result.sync_duration_seconds = (sync_end_time - sync_start_time).total_seconds()
+            return result
     
     def get_next_run_time(self) -> Optional[datetime]:
         """Get the next scheduled run time.
@@ -218,17 +289,19 @@ class CalendarPollingScheduler:
         Returns:
             Next run time or None if scheduler is not running
         """
-        if not self.is_running or not self.scheduler:
+        if not self.is_running or not self._job:
             return None
         
-        try:
-            job = self.scheduler.get_job('daily_calendar_sync')  # type: ignore
-            if job and job.next_run_time:  # type: ignore
-                return job.next_run_time  # type: ignore
-        except Exception as e:
-            logger.error(f"Error getting next run time: {e}")
-        
-        return None
+        return self._job.next_run_time  # type: ignore
+    
+    def _refresh_stats_snapshot(self) -> None:
+        """Rebuild the exported stats after the counters change."""
+        self._stats_snapshot = SchedulerStats(**asdict(self._stats))
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the run counters by name."""
+        return asdict(self._stats)
     
     def get_schedule_info(self) -> SchedulerInfo:
         """Get scheduler information.
@@ -237,21 +310,19 @@ class CalendarPollingScheduler:
             Scheduler information
         """
         next_run = self.get_next_run_time()
-        
-        stats = SchedulerStats(
-            total_runs=self.stats['total_runs'],  # type: ignore
-            successful_runs=self.stats['successful_runs'],  # type: ignore
-            failed_runs=self.stats['failed_runs'],  # type: ignore
-            last_run_time=self.stats['last_run_time'],  # type: ignore
-            last_run_success=self.stats['last_run_success'],  # type: ignore
-            last_run_error=self.stats['last_run_error']  # type: ignore
-        )
+        if next_run is None:
+            next_run_iso = None
+        elif self._next_run_iso[0] == next_run:
+            next_run_iso = self._next_run_iso[1]
+        else:
+            next_run_iso = next_run.isoformat()
+            self._next_run_iso = (next_run, next_run_iso)
         
         return SchedulerInfo(
             is_running=self.is_running,
             sync_interval_minutes=self.config.sync_interval_minutes,
-            next_run_time=next_run.isoformat() if next_run else None,
-            stats=stats
+            next_run_time=next_run_iso,
+            stats=self._stats_snapshot
         )
     
     def get_stats(self) -> SchedulerInfo:
@@ -264,14 +335,9 @@ class CalendarPollingScheduler:
     
     def reset_stats(self) -> None:
         """Reset polling scheduler statistics."""
-        self.stats = {
-            'total_runs': 0,
-            'successful_runs': 0,
-            'failed_runs': 0,
-            'last_run_time': None,
-            'last_run_success': False,
-            'last_run_error': None
-        }
+        self._stats = _SchedulerStatsState()
+        self._refresh_stats_snapshot()
+        self._history.clear()
         logger.info("Reset polling scheduler statistics")
     
     def update_schedule(self, interval_minutes: int) -> None:
@@ -283,14 +349,18 @@ class CalendarPollingScheduler:
         if not (1 <= interval_minutes <= 1440):
             raise ValueError("Interval must be between 1 and 1440 minutes")
         
-        # Update config
+        # Update config and drop the trigger built for the old interval
+        if interval_minutes != self.config.sync_interval_minutes:
+            self._trigger = None
         self.config.sync_interval_minutes = interval_minutes
         
-        # Restart scheduler with new schedule if it's running
-        if self.is_running:
+        # Reschedule the running job in place rather than restarting the scheduler
+        if self.is_running and self.scheduler:
             logger.info(f"Updating schedule to every {interval_minutes} minutes")
-            self.stop()
-            self.start()
+            self._job = self.scheduler.reschedule_job(  # type: ignore
+                PERIODIC_SYNC_JOB_ID,
+                trigger=self._periodic_trigger()
+            )
         
         logger.info(f"Updated schedule to every {interval_minutes} minutes")
     
@@ -304,16 +374,19 @@ class CalendarPollingScheduler:
         
         try:
             # Add one-time job to run immediately
+            now = datetime.now()
             self.scheduler.add_job(  # type: ignore
                 self._run_periodic_sync,
                 trigger='date',
-                run_date=datetime.now(),
+                run_date=now,
                 id='manual_sync_now',
                 name='Manual Sync Now',
-                replace_existing=True
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
             )
             
-            logger.info("Scheduled immediate sync run")
+            logger.info(f"Scheduled immediate sync run at {now.isoformat()}")
             
         except Exception as e:
             logger.error(f"Error scheduling immediate sync: {e}")
@@ -325,16 +398,6 @@ class CalendarPollingScheduler:
         Returns:
             List of job execution information
         """
-        # This is a simple implementation - in production you might want
+        # Kept in memory only; in production you might want
         # to store job history in a database
-        history: List[JobHistoryEntry] = []
-        
-        if self.stats['last_run_time']:  # type: ignore
-            history.append(JobHistoryEntry(
-                run_time=self.stats['last_run_time'],  # type: ignore
-                success=self.stats['last_run_success'],  # type: ignore
-                error=self.stats['last_run_error'],  # type: ignore
-                type='periodic_sync'
-            ))
-        
-        return history 
\ No newline at end of file
+        return list(self._history)
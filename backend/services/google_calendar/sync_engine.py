@@ -6,13 +6,20 @@ and creating/deleting busy blocks across multiple sync flows.
 """
 
 import logging
-from typing import List, Tuple
-from datetime import datetime, timedelta
+import sys
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from pydantic import TypeAdapter, ValidationError
 
 from backend.models.calendar import (
     CalendarEvent, 
     SyncFlow, 
     BusyBlock, 
+    BusyBlockKey,
     MultiAccountConfig,
     EventProcessingResult,
     CalendarSyncResult,
@@ -20,15 +27,126 @@ from backend.models.calendar import (
     SyncEngineStats
 )
 from backend.services.google_calendar.account_manager import AccountManager
+from backend.services.google_calendar.client import FIND_EVENTS_FIELDS, GoogleCalendarClient, ParsedEvent, _to_epoch_minute
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of parsed API events in one pydantic-core call
+_CALENDAR_EVENT_LIST_ADAPTER: TypeAdapter[List[CalendarEvent]] = TypeAdapter(List[CalendarEvent])
+
+# How far around a busy block to look for existing blocks that cover it
+COVERING_SEARCH_MARGIN = timedelta(hours=4)
+COVERING_SEARCH_MARGIN_MINUTES = int(COVERING_SEARCH_MARGIN.total_seconds() // 60)
+
+# Upper bound on source calendars synced concurrently
+MAX_SYNC_WORKERS = 8
+
 
 class SyncEngineError(Exception):
     """Exception raised when sync engine operations fail."""
     pass
 
 
+class _TargetCalendarSnapshot:
+    """Events of one target calendar, fetched once per sync pass.
+    
+    Answers busy block lookups in memory instead of searching the target
+    calendar through the API for every source event. Blocks created or
+    deleted during the pass are recorded so later lookups see them.
+    """
+    
+    def __init__(self, events: List[ParsedEvent], window: Tuple[int, int]) -> None:
+        # Fetched time range as epoch minutes
+        self.window = window
+        # Events by (epoch start minute, epoch end minute, lowercased title), and by title alone
+        self._exact: Dict[Tuple[int, int, str], List[ParsedEvent]] = {}
+        self._by_title: Dict[str, List[ParsedEvent]] = {}
+        for event in events:
+            self.add(event)
+    
+    @staticmethod
+    def _match_key(start_time: datetime, end_time: datetime, title: str) -> Tuple[int, int, str]:
+        """Build the lookup key, matching find_events_by_time_and_title semantics."""
+        return (_to_epoch_minute(start_time), _to_epoch_minute(end_time), title.lower())
+    
+    def add(self, event: ParsedEvent) -> None:
+        """Record an event in the snapshot."""
+        key = self._match_key(event['start_time'], event['end_time'], event['title'])
+        self._exact.setdefault(key, []).append(event)
+        self._by_title.setdefault(key[2], []).append(event)
+    
+    def remove(self, event: ParsedEvent) -> None:
+        """Forget an event, e.g. after it was deleted."""
+        key = self._match_key(event['start_time'], event['end_time'], event['title'])
+        for events in (self._exact.get(key, []), self._by_title.get(key[2], [])):
+            events[:] = [existing for existing in events if existing is not event]
+    
+    def find(self, busy_block: BusyBlockKey) -> List[ParsedEvent]:
+        """Find events matching a busy block's times (to the minute) and title (case-insensitive)."""
+        key = self._match_key(busy_block.start_time, busy_block.end_time, busy_block.title)
+        return list(self._exact.get(key, ()))
+    
+    def titled(self, title: str) -> List[ParsedEvent]:
+        """Get all events with the given title (case-insensitive)."""
+        return self._by_title.get(title.lower(), [])
+    
+    def covers(self, window: Tuple[int, int]) -> bool:
+        """Check whether the snapshot was fetched for a range including the given one."""
+        return self.window[0] <= window[0] and window[1] <= self.window[1]
+
+
+@dataclass(slots=True)
+class _QueuedDeletion:
+    """Busy blocks of one event and sync flow, queued for a batch delete at the end of a sync pass."""
+    target_account_id: int
+    target_calendar_id: str
+    block_ids: List[str]
+    # Processing result to correct once the outcome is known
+    result: Optional[EventProcessingResult] = None
+    fallback_action: str = 'delete_attempted'
+
+
+@dataclass(slots=True)
+class _QueuedCreation:
+    """Busy block of one event and sync flow, queued for a batch create at the end of a sync pass."""
+    target_account_id: int
+    target_calendar_id: str
+    # create_event keyword arguments
+    event: Dict[str, Any]
+    # Stand-in for the block in the target calendar snapshot, given the real ID once created
+    snapshot_entry: Optional[ParsedEvent] = None
+    snapshot: Optional["_TargetCalendarSnapshot"] = None
+    # Processing result to correct if the create fails
+    result: Optional[EventProcessingResult] = None
+
+
+@dataclass(slots=True)
+class _PendingWrites:
+    """Busy block writes queued during a bulk sync, sent as batch requests at the end."""
+    deletions: List[_QueuedDeletion] = field(default_factory=list)
+    creations: List[_QueuedCreation] = field(default_factory=list)
+    # Queued busy blocks by (target account ID, target calendar ID, epoch start minute,
+    # epoch end minute, lowercased title), so an event mapping to an already queued
+    # block doesn't queue it again, even without a target calendar snapshot
+    creation_keys: set[Tuple[int, str, int, int, str]] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class _IncrementalSyncState:
+    """Known events of a source calendar as of its last incremental sync."""
+    events: Dict[str, ParsedEvent]
+    # Synced date range as epoch minutes, None before the first sync
+    window: Optional[Tuple[int, int]] = None
+    # Events whose processing failed, by ID, as they were processed (deleted events as
+    # cancelled copies); the sync token has moved past them, so the next sync retries them
+    retry: Dict[str, ParsedEvent] = field(default_factory=dict)
+
+
+def _overlaps(event: ParsedEvent, window: Tuple[int, int]) -> bool:
+    """Check whether an event overlaps a date range given as epoch minutes."""
+    return _to_epoch_minute(event['start_time']) < window[1] and _to_epoch_minute(event['end_time']) > window[0]
+
+
 class CalendarSyncEngine:
     """Core calendar synchronization engine for processing events and managing busy blocks."""
     
@@ -42,29 +160,60 @@ class CalendarSyncEngine:
         self.config = config
         self.account_manager = account_manager
         
-        # Stats tracking
-        self.stats = {
-            'events_processed': 0,
-            'busy_blocks_created': 0,
-            'busy_blocks_deleted': 0,
-            'errors': 0
-        }
+        # Sync flows by (source account, source calendar), rebuilt when the flow list changes
+        self._flow_index: Dict[Tuple[int, str], List[SyncFlow]] = {}
+        self._indexed_flows: Optional[Sequence[SyncFlow]] = None
+        self._indexed_flow_count = 0
+        self._rebuild_index()
+        
+        # Incremental sync state by (source account, source calendar)
+        self._incremental_state: Dict[Tuple[int, str], _IncrementalSyncState] = {}
+        
+        # One re-entrant lock per (account, calendar) a sync pass reads or writes, so passes
+        # started from different threads (polling, webhook flushes, manual syncs) never
+        # interleave on the same calendars
+        self._calendar_locks: Dict[Tuple[int, str], threading.RLock] = {}
+        self._calendar_locks_guard = threading.Lock()
+        
+        # Stats tracking (source calendars are synced from worker threads, so updates take the lock)
+        self._stats_lock = threading.Lock()
+        self._events_processed = 0
+        self._busy_blocks_created = 0
+        self._busy_blocks_deleted = 0
+        self._errors = 0
         
         logger.info(f"Initialized sync engine with {len(config.accounts)} accounts and {len(config.sync_flows)} sync flows")
     
-    def process_event(self, event: CalendarEvent, sync_type: str = "webhook") -> List[EventProcessingResult]:
+    def process_event(self, event: CalendarEvent, sync_type: str = "webhook",
+                      meets_criteria: Optional[bool] = None,
+                      existing_blocks_cache: Optional[Mapping[Tuple[int, str], _TargetCalendarSnapshot]] = None,
+                      pending_writes: Optional[_PendingWrites] = None,
+                      busy_block_keys: Optional[Mapping[int, BusyBlockKey]] = None
+                      ) -> List[EventProcessingResult]:
         """Process a calendar event through all applicable sync flows.
         
         Args:
             event: Calendar event to process
             sync_type: Type of sync operation ("webhook" or "polling")
+            meets_criteria: Precomputed result of the sync criteria check (computed if None)
+            existing_blocks_cache: Prefetched target calendars by (account ID, calendar ID);
+                target calendars missing from it are searched through the API
+            pending_writes: Queue for busy block creates and deletes, sent later by
+                _flush_pending_writes; busy blocks are written right away when not given
+            busy_block_keys: Precomputed busy block keys by id() of the sync flow
+                (calculated here for flows missing from it)
             
         Returns:
             List of processing results for each applicable sync flow
         """
         results: List[EventProcessingResult] = []
         
-        # Find all sync flows that apply to this event
+        # Every result of the event shares one sync_type string
+        sync_type = sys.intern(sync_type)
+        
+        # Find all sync flows that apply to this event (a dict lookup). Events failing the
+        # sync criteria must not be filtered out before this: they remove busy blocks
+        # left over from when they did meet them
         applicable_flows = self._find_applicable_flows(event)
         
         if not applicable_flows:
@@ -73,29 +222,51 @@ class CalendarSyncEngine:
         
         logger.info(f"Processing event '{event.title}' ({event.id}) through {len(applicable_flows)} sync flows (type: {sync_type})")
         
+        # Criteria don't depend on the flow, so evaluate them once per event
+        if meets_criteria is None:
+            meets_criteria = self._event_meets_criteria(event)
+        
         # Process through each applicable flow
         for flow in applicable_flows:
             try:
-                result = self._process_event_for_flow(event, flow, sync_type)
+                snapshot = existing_blocks_cache.get((flow.target_account_id, flow.target_calendar_id)) if existing_blocks_cache else None
+                busy_block_key = busy_block_keys.get(id(flow)) if busy_block_keys else None
+                result = self._process_event_for_flow(
+                    event, flow, sync_type, meets_criteria, snapshot, pending_writes, busy_block_key
+                )
                 results.append(result)
                 
             except Exception as e:
                 logger.error(f"Error processing event {event.id} for flow {flow.name}: {e}")
-                self.stats['errors'] += 1
-                results.append(EventProcessingResult(
-                    flow_name=flow.name,
-                    event_id=event.id,
-                    event_title=event.title,
-                    sync_type=sync_type,
-                    success=False,
-                    action='error',
-                    error=str(e),
-                    reason=None
-                ))
-        
-        self.stats['events_processed'] += 1
+                with self._stats_lock:
+                    self._errors += 1
+                results.append(self._event_result(flow.name, event, sync_type, 'error', success=False, error=str(e)))
+        
+        with self._stats_lock:
+            self._events_processed += 1
         return results
     
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the stats counters by name."""
+        with self._stats_lock:
+            return {
+                'events_processed': self._events_processed,
+                'busy_blocks_created': self._busy_blocks_created,
+                'busy_blocks_deleted': self._busy_blocks_deleted,
+                'errors': self._errors
+            }
+    
+    def _rebuild_index(self) -> None:
+        """Index the configured sync flows by the source calendar they monitor."""
+        flows = self.config.sync_flows
+        flow_index: Dict[Tuple[int, str], List[SyncFlow]] = {}
+        for flow in flows:
+            flow_index.setdefault((flow.source_account_id, flow.source_calendar_id), []).append(flow)
+        self._flow_index = flow_index
+        self._indexed_flows = flows
+        self._indexed_flow_count = len(flows)
+    
     def _find_applicable_flows(self, event: CalendarEvent) -> List[SyncFlow]:
         """Find all sync flows that apply to the given event.
         
@@ -103,111 +274,139 @@ class CalendarSyncEngine:
             event: Calendar event to check
             
         Returns:
-            List of applicable sync flows
+            List of applicable sync flows (shared with the index; do not modify)
         """
-        applicable_flows: List[SyncFlow] = []
+        return self._flows_for_source(event.account_id, event.calendar_id)
+    
+    def _flows_for_source(self, account_id: int, calendar_id: str) -> List[SyncFlow]:
+        """Get the sync flows monitoring a source calendar.
         
-        for flow in self.config.sync_flows:
-            # Check if this flow monitors the event's calendar
-            if (flow.source_account_id == event.account_id and 
-                flow.source_calendar_id == event.calendar_id):
-                applicable_flows.append(flow)
+        Args:
+            account_id: Source account ID
+            calendar_id: Source calendar ID
+            
+        Returns:
+            List of sync flows (shared with the index; do not modify)
+        """
+        flows = self.config.sync_flows
+        if flows is not self._indexed_flows or len(flows) != self._indexed_flow_count:
+            self._rebuild_index()
         
-        return applicable_flows
+        return self._flow_index.get((account_id, calendar_id), [])
     
-    def _process_event_for_flow(self, event: CalendarEvent, flow: SyncFlow, sync_type: str) -> EventProcessingResult:
+    def _process_event_for_flow(self, event: CalendarEvent, flow: SyncFlow, sync_type: str,
+                                meets_criteria: bool,
+                                snapshot: Optional[_TargetCalendarSnapshot] = None,
+                                pending_writes: Optional[_PendingWrites] = None,
+                                busy_block_key: Optional[BusyBlockKey] = None) -> EventProcessingResult:
         """Process an event for a specific sync flow.
         
         Args:
             event: Calendar event to process
             flow: Sync flow to apply
             sync_type: Type of sync operation
+            meets_criteria: Whether the event meets sync criteria
+            snapshot: Prefetched events of the flow's target calendar (optional)
+            pending_writes: Queue for busy block creates and deletes (optional)
+            busy_block_key: Precomputed flow.busy_block_key(event) (calculated if None)
             
         Returns:
             Processing result
         """
         try:
+            # For cancelled events, only check if they had multiple participants originally
+            if event.is_cancelled() and not event.has_multiple_participants():
+                return self._event_result(
+                    flow.name, event, sync_type, 'skipped',
+                    reason=f"Cancelled event doesn't meet criteria (participants: {event.participant_count})"
+                )
+            
+            # The busy block and target client are resolved once and shared by the create and delete
+            # paths; skipped events never need the client, so a failing target account can't fail them
+            if busy_block_key is None:
+                busy_block_key = flow.busy_block_key(event)
+            target_client = self.account_manager.get_client(flow.target_account_id)
+            
             # Handle cancelled events first (always process for deletion regardless of criteria)
             if event.is_cancelled():
-                # For cancelled events, only check if they had multiple participants originally
-                if not event.has_multiple_participants():
-                    return EventProcessingResult(
-                        flow_name=flow.name,
-                        event_id=event.id,
-                        event_title=event.title,
-                        sync_type=sync_type,
-                        success=True,
-                        action='skipped',
-                        error=None,
-                        reason=f"Cancelled event doesn't meet criteria (participants: {event.participant_count})"
-                    )
-                
                 # Handle cancelled event - remove busy block
-                deleted = self._delete_busy_block_for_event(event, flow)
+                deleted = self._delete_busy_block_for_event(event, flow, busy_block_key, target_client, snapshot, pending_writes)
                 action = 'deleted' if deleted else 'delete_attempted'
-                if deleted:
-                    self.stats['busy_blocks_deleted'] += 1
+                if deleted and pending_writes is None:
+                    with self._stats_lock:
+                        self._busy_blocks_deleted += 1
                 
-                return EventProcessingResult(
-                    flow_name=flow.name,
-                    event_id=event.id,
-                    event_title=event.title,
-                    sync_type=sync_type,
-                    success=True,
-                    action=action,
-                    error=None,
-                    reason=None
-                )
+                result = self._event_result(flow.name, event, sync_type, action)
+                if deleted and pending_writes is not None:
+                    self._track_queued_deletion(pending_writes, result, 'delete_attempted')
+                return result
             
             # For active events, check if they meet criteria (2+ participants, confirmed, busy)
-            if not self._event_meets_criteria(event):
+            if not meets_criteria:
                 # Event doesn't meet criteria - remove busy block if it exists
-                deleted = self._delete_busy_block_for_event(event, flow)
+                deleted = self._delete_busy_block_for_event(event, flow, busy_block_key, target_client, snapshot, pending_writes)
                 action = 'deleted' if deleted else 'skipped'
-                if deleted:
-                    self.stats['busy_blocks_deleted'] += 1
+                if deleted and pending_writes is None:
+                    with self._stats_lock:
+                        self._busy_blocks_deleted += 1
                 
-                return EventProcessingResult(
-                    flow_name=flow.name,
-                    event_id=event.id,
-                    event_title=event.title,
-                    sync_type=sync_type,
-                    success=True,
-                    action=action,
-                    error=None,
+                result = self._event_result(
+                    flow.name, event, sync_type, action,
                     reason=f"Event doesn't meet criteria (participants: {event.participant_count}, status: {event.status}, transparency: {event.transparency})"
                 )
+                if deleted and pending_writes is not None:
+                    self._track_queued_deletion(pending_writes, result, 'skipped')
+                return result
             
             # Handle active event that meets criteria - create busy block
-            created = self._create_busy_block_for_event(event, flow)
+            created = self._create_busy_block_for_event(event, flow, busy_block_key, target_client, snapshot, pending_writes)
             action = 'created' if created else 'existed'
-            if created:
-                self.stats['busy_blocks_created'] += 1
-            
-            return EventProcessingResult(
-                flow_name=flow.name,
-                event_id=event.id,
-                event_title=event.title,
-                sync_type=sync_type,
-                success=True,
-                action=action,
-                error=None,
-                reason=None
-            )
+            if created and pending_writes is None:
+                with self._stats_lock:
+                    self._busy_blocks_created += 1
+            
+            result = self._event_result(flow.name, event, sync_type, action)
+            if created and pending_writes is not None:
+                # Counted, or reported as failed, once the queued create is sent
+                pending_writes.creations[-1].result = result
+            return result
             
         except Exception as e:
             logger.error(f"Error processing event {event.id} for flow {flow.name}: {e}")
-            self.stats['errors'] += 1
-            return EventProcessingResult(
-                flow_name=flow.name,
-                event_id=event.id,
-                event_title=event.title,
-                sync_type=sync_type,
-                success=False,
-                action='error',
-                error=str(e),
-                reason=None
-            )
+            with self._stats_lock:
+                self._errors += 1
+            return self._event_result(flow.name, event, sync_type, 'error', success=False, error=str(e))
+    
+    def _event_result(self, flow_name: str, event: CalendarEvent, sync_type: str, action: str,
+                      success: bool = True, error: Optional[str] = None,
+                      reason: Optional[str] = None) -> EventProcessingResult:
+        """Build the result of processing an event through a sync flow.
+        
+        Every value already has the right type, so validation is skipped; bulk syncs
+        build one result per event and flow.
+        
+        Args:
+            flow_name: Name of the sync flow
+            event: Processed event
+            sync_type: Type of sync operation
+            action: Action taken
+            success: Whether processing was successful
+            error: Error message if processing failed
+            reason: Reason for action taken
+            
+        Returns:
+            Processing result
+        """
+        return EventProcessingResult.model_construct(
+            flow_name=flow_name,
+            event_id=event.id,
+            event_title=event.title,
+            sync_type=sync_type,
+            success=success,
+            action=action,
+            error=error,
+            reason=reason
+        )
     
     def _event_meets_criteria(self, event: CalendarEvent) -> bool:
         """Check if event meets sync criteria.
@@ -232,133 +431,321 @@ class CalendarSyncEngine:
         
         return True
     
-    def _create_busy_block_for_event(self, event: CalendarEvent, flow: SyncFlow) -> bool:
+    def _create_busy_block_for_event(self, event: CalendarEvent, flow: SyncFlow, busy_block_key: BusyBlockKey,
+                                     target_client: GoogleCalendarClient,
+                                     snapshot: Optional[_TargetCalendarSnapshot] = None,
+                                     pending_writes: Optional[_PendingWrites] = None) -> bool:
         """Create a busy block for an event in the target calendar.
         
         Args:
             event: Source calendar event
             flow: Sync flow configuration
+            busy_block_key: Busy block the flow needs for the event
+            target_client: Client of the flow's target account
+            snapshot: Prefetched events of the target calendar (optional)
+            pending_writes: Queue to add the creation to instead of creating right away (optional)
             
         Returns:
-            True if busy block was created, False if it already existed
+            True if busy block was created (or queued for creation), False if it already existed
         """
-        # Create busy block configuration
-        busy_block = BusyBlock.from_event_and_flow(event, flow)
-        
-        # Check if busy block already exists
-        if self._busy_block_exists(busy_block):
+        # Check if busy block is already queued for creation in this pass, or already exists
+        creation_key: Optional[Tuple[int, str, int, int, str]] = None
+        if pending_writes is not None:
+            creation_key = (
+                busy_block_key.target_account_id, busy_block_key.target_calendar_id,
+                *_TargetCalendarSnapshot._match_key(busy_block_key.start_time, busy_block_key.end_time, busy_block_key.title)
+            )
+            if creation_key in pending_writes.creation_keys:
+                logger.debug(f"Busy block for event {event.id} in flow {flow.name} is already queued for creation")
+                return False
+        if self._busy_block_exists(busy_block_key, event.id, target_client, snapshot):
             logger.debug(f"Busy block already exists for event {event.id} in flow {flow.name}")
             return False
         
+        # Build the validated busy block only when we are about to write it
+        busy_block = BusyBlock.from_key(event, busy_block_key)
+        
+        block_event: Dict[str, Any] = {
+            'title': busy_block.title,
+            'start_time': busy_block.start_time,
+            'end_time': busy_block.end_time,
+            'description': f"Busy block for: {event.title}",
+            'all_day': event.is_all_day()
+        }
+        
+        # Let later events in this pass see the new block (its ID is known once created)
+        snapshot_entry: Optional[ParsedEvent] = None
+        if snapshot is not None:
+            snapshot_entry = {
+                'id': '',
+                'title': busy_block.title,
+                'start_time': busy_block.start_time,
+                'end_time': busy_block.end_time,
+                'all_day': event.is_all_day()
+            }  # type: ignore
+            snapshot.add(snapshot_entry)  # type: ignore
+        
+        if pending_writes is not None:
+            pending_writes.creation_keys.add(creation_key)  # type: ignore
+            pending_writes.creations.append(_QueuedCreation(
+                flow.target_account_id, flow.target_calendar_id, block_event, snapshot_entry, snapshot
+            ))
+            return True
+        
         # Create the busy block
-        target_client = self.account_manager.get_client(flow.target_account_id)
-        
-        target_client.create_event(
-            calendar_id=flow.target_calendar_id,
-            title=busy_block.title,
-            start_time=busy_block.start_time,
-            end_time=busy_block.end_time,
-            description=f"Busy block for: {event.title}",
-            all_day=event.is_all_day()
-        )
+        created_event = target_client.create_event(calendar_id=flow.target_calendar_id, **block_event)
+        if snapshot_entry is not None:
+            snapshot_entry['id'] = created_event.get('id', '')
         
         logger.info(f"Created busy block '{busy_block.title}' for event '{event.title}' in flow {flow.name}")
         return True
     
-    def _delete_busy_block_for_event(self, event: CalendarEvent, flow: SyncFlow) -> bool:
+    def _delete_busy_block_for_event(self, event: CalendarEvent, flow: SyncFlow, busy_block_key: BusyBlockKey,
+                                     target_client: GoogleCalendarClient,
+                                     snapshot: Optional[_TargetCalendarSnapshot] = None,
+                                     pending_writes: Optional[_PendingWrites] = None) -> bool:
         """Delete busy block for a cancelled event.
         
         Args:
             event: Source calendar event (cancelled)
             flow: Sync flow configuration
+            busy_block_key: Busy block the flow would have created for the event
+            target_client: Client of the flow's target account
+            snapshot: Prefetched events of the target calendar (optional)
+            pending_writes: Queue to add the deletion to instead of deleting right away (optional)
             
         Returns:
-            True if busy block was deleted, False if not found
+            True if busy block was deleted (or queued for deletion), False if not found
         """
-        # Calculate what the busy block would be for this event
-        busy_block = BusyBlock.from_event_and_flow(event, flow)
-        
         # Search for existing busy block
-        target_client = self.account_manager.get_client(flow.target_account_id)
-        
-        existing_blocks = target_client.find_events_by_time_and_title(
-            calendar_id=flow.target_calendar_id,
-            start_time=busy_block.start_time,
-            end_time=busy_block.end_time,
-            title=busy_block.title
-        )
+        if snapshot is not None:
+            existing_blocks = snapshot.find(busy_block_key)
+        else:
+            existing_blocks = target_client.find_events_by_time_and_title(
+                calendar_id=flow.target_calendar_id,
+                start_time=busy_block_key.start_time,
+                end_time=busy_block_key.end_time,
+                title=busy_block_key.title
+            )
         
         if not existing_blocks:
             logger.debug(f"No busy block found to delete for cancelled event {event.id} in flow {flow.name}")
             return False
         
-        # Delete all matching busy blocks
-        deleted_count = 0
-        for block in existing_blocks:
-            if target_client.delete_event(flow.target_calendar_id, block['id']):
-                deleted_count += 1
+        if snapshot is not None:
+            for block in existing_blocks:
+                snapshot.remove(block)
+        
+        # Blocks queued for creation in this pass have no ID yet, and dropping them from
+        # the snapshot is not enough to cancel them; they are left to the next sync
+        block_ids = [block['id'] for block in existing_blocks if block['id']]
+        if not block_ids:
+            logger.debug(f"Busy block for event {event.id} in flow {flow.name} is not created yet, nothing to delete")
+            return False
+        
+        if pending_writes is not None:
+            pending_writes.deletions.append(_QueuedDeletion(flow.target_account_id, flow.target_calendar_id, block_ids))
+            return True
+        
+        # Delete all matching busy blocks, in one batch request if there are several
+        if len(block_ids) == 1:
+            deleted_count = int(target_client.delete_event(flow.target_calendar_id, block_ids[0]))
+        else:
+            outcomes = target_client.batch_delete_events([(flow.target_calendar_id, block_id) for block_id in block_ids])
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+            deleted_count = sum(1 for outcome in outcomes if outcome is True)
         
         if deleted_count > 0:
             logger.info(f"Deleted {deleted_count} busy block(s) for cancelled event '{event.title}' in flow {flow.name}")
         
         return deleted_count > 0
     
-    def _busy_block_exists(self, busy_block: BusyBlock) -> bool:
+    def _track_queued_deletion(self, pending_writes: _PendingWrites,
+                               result: EventProcessingResult, fallback_action: str) -> None:
+        """Attach a processing result to the deletion _delete_busy_block_for_event just queued.
+        
+        Args:
+            pending_writes: Write queue
+            result: Result reporting the deletion
+            fallback_action: Action to report instead if no busy block ends up deleted
+        """
+        pending_writes.deletions[-1].result = result
+        pending_writes.deletions[-1].fallback_action = fallback_action
+    
+    def _flush_pending_writes(self, pending_writes: _PendingWrites) -> None:
+        """Send the busy block deletions, then creations, queued during a sync pass.
+        
+        Args:
+            pending_writes: Write queue filled during a sync pass
+        """
+        self._flush_pending_deletes(pending_writes.deletions)
+        self._flush_pending_creates(pending_writes.creations)
+    
+    def _flush_pending_creates(self, pending_creates: List[_QueuedCreation]) -> None:
+        """Send queued busy block creations as batch requests, one per target calendar.
+        
+        Updates stats, gives snapshot entries their created IDs, and reports failed
+        creates in the queued processing results.
+        
+        Args:
+            pending_creates: Creation queue filled during a sync pass
+        """
+        by_calendar: Dict[Tuple[int, str], List[_QueuedCreation]] = {}
+        for queued in pending_creates:
+            by_calendar.setdefault((queued.target_account_id, queued.target_calendar_id), []).append(queued)
+        
+        for (target_account_id, target_calendar_id), queued_creations in by_calendar.items():
+            try:
+                outcomes: List[Union[ParsedEvent, Exception]] = list(
+                    self.account_manager.get_client(target_account_id).batch_create_events(
+                        target_calendar_id, [queued.event for queued in queued_creations]
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Error creating {len(queued_creations)} busy blocks in calendar {target_calendar_id}: {e}")
+                outcomes = [e] * len(queued_creations)
+            
+            for queued, outcome in zip(queued_creations, outcomes):
+                if isinstance(outcome, Exception):
+                    with self._stats_lock:
+                        self._errors += 1
+                    # Not created after all, so later calendars of the pass may try again
+                    if queued.snapshot is not None and queued.snapshot_entry is not None:
+                        queued.snapshot.remove(queued.snapshot_entry)
+                    if queued.result is not None:
+                        queued.result.success = False
+                        queued.result.action = 'error'
+                        queued.result.error = str(outcome)
+                else:
+                    with self._stats_lock:
+                        self._busy_blocks_created += 1
+                    if queued.snapshot_entry is not None:
+                        queued.snapshot_entry['id'] = outcome.get('id', '')
+        
+        if pending_creates:
+            logger.info(f"Sent {len(pending_creates)} queued busy block creation(s) for {len(by_calendar)} calendar(s)")
+    
+    def _flush_pending_deletes(self, pending_deletes: List[_QueuedDeletion]) -> None:
+        """Send queued busy block deletions as one batch request per target account.
+        
+        Updates stats and corrects the queued processing results to the actual outcome.
+        
+        Args:
+            pending_deletes: Deletion queue filled during a sync pass
+        """
+        by_account: Dict[int, List[_QueuedDeletion]] = {}
+        for queued in pending_deletes:
+            by_account.setdefault(queued.target_account_id, []).append(queued)
+        
+        for target_account_id, queued_deletions in by_account.items():
+            pairs = [
+                (queued.target_calendar_id, block_id)
+                for queued in queued_deletions
+                for block_id in queued.block_ids
+            ]
+            try:
+                outcomes: List[Union[bool, Exception]] = list(
+                    self.account_manager.get_client(target_account_id).batch_delete_events(pairs)
+                )
+            except Exception as e:
+                logger.error(f"Error deleting {len(pairs)} busy blocks for account {target_account_id}: {e}")
+                outcomes = [e] * len(pairs)
+            
+            position = 0
+            for queued in queued_deletions:
+                block_outcomes = outcomes[position:position + len(queued.block_ids)]
+                position += len(queued.block_ids)
+                errors = [outcome for outcome in block_outcomes if isinstance(outcome, Exception)]
+                
+                if errors:
+                    with self._stats_lock:
+                        self._errors += 1
+                    if queued.result is not None:
+                        queued.result.success = False
+                        queued.result.action = 'error'
+                        queued.result.error = str(errors[0])
+                elif any(outcome is True for outcome in block_outcomes):
+                    with self._stats_lock:
+                        self._busy_blocks_deleted += 1
+                elif queued.result is not None:
+                    queued.result.action = queued.fallback_action
+        
+        if pending_deletes:
+            logger.info(f"Sent {len(pending_deletes)} queued busy block deletion(s) for {len(by_account)} account(s)")
+    
+    def _busy_block_exists(self, busy_block: BusyBlockKey, source_event_id: str,
+                           target_client: GoogleCalendarClient,
+                           snapshot: Optional[_TargetCalendarSnapshot] = None) -> bool:
         """Check if a busy block already exists.
         
         Args:
-            busy_block: Busy block to check for
+            busy_block: Key of the busy block to check for
+            source_event_id: ID of the source event (for logging)
+            target_client: Client of the busy block's target account
+            snapshot: Prefetched events of the target calendar; searched
+                through the API when not given
             
         Returns:
             True if busy block exists, False otherwise
         """
         try:
-            target_client = self.account_manager.get_client(busy_block.target_account_id)
-            
             # First check for exact match (original logic)
-            existing_blocks = target_client.find_events_by_time_and_title(
-                calendar_id=busy_block.target_calendar_id,
-                start_time=busy_block.start_time,
-                end_time=busy_block.end_time,
-                title=busy_block.title
-            )
+            if snapshot is not None:
+                existing_blocks = snapshot.find(busy_block)
+            else:
+                existing_blocks = target_client.find_events_by_time_and_title(
+                    calendar_id=busy_block.target_calendar_id,
+                    start_time=busy_block.start_time,
+                    end_time=busy_block.end_time,
+                    title=busy_block.title
+                )
             
             if len(existing_blocks) > 0:
-                logger.debug(f"Found exact match busy block for event {busy_block.source_event.id}")
+                logger.debug(f"Found exact match busy block for event {source_event_id}")
                 return True
             
             # Check for covering busy blocks
-            return self._covering_busy_block_exists(busy_block)
+            return self._covering_busy_block_exists(busy_block, source_event_id, target_client, snapshot)
             
         except Exception as e:
             logger.error(f"Error checking if busy block exists: {e}")
             return False
 
-    def _covering_busy_block_exists(self, busy_block: BusyBlock) -> bool:
+    def _covering_busy_block_exists(self, busy_block: BusyBlockKey, source_event_id: str,
+                                    target_client: GoogleCalendarClient,
+                                    snapshot: Optional[_TargetCalendarSnapshot] = None) -> bool:
         """Check if a busy block exists that fully covers the required period.
         
         This method checks if there's already a busy block that starts at or before
         the required start time and ends at or after the required end time.
         
         Args:
-            busy_block: Busy block to check coverage for
+            busy_block: Key of the busy block to check coverage for
+            source_event_id: ID of the source event (for logging)
+            target_client: Client of the busy block's target account
+            snapshot: Prefetched events of the target calendar; searched
+                through the API when not given
             
         Returns:
             True if a covering busy block exists, False otherwise
         """
         try:
-            target_client = self.account_manager.get_client(busy_block.target_account_id)
-            
-            # Get events in a wider time range to find potentially covering blocks
-            # Search from 4 hours before to 4 hours after to catch longer existing blocks
-            search_start = busy_block.start_time - timedelta(hours=4)
-            search_end = busy_block.end_time + timedelta(hours=4)
-            
-            existing_events = target_client.get_events(
-                calendar_id=busy_block.target_calendar_id,
-                start_time=search_start,
-                end_time=search_end
-            )
+            if snapshot is not None:
+                existing_events = snapshot.titled(busy_block.title)
+            else:
+                # Get events in a wider time range to find potentially covering blocks
+                # Search from 4 hours before to 4 hours after to catch longer existing blocks
+                search_start = busy_block.start_time - COVERING_SEARCH_MARGIN
+                search_end = busy_block.end_time + COVERING_SEARCH_MARGIN
+                
+                existing_events = target_client.get_events(
+                    calendar_id=busy_block.target_calendar_id,
+                    start_time=search_start,
+                    end_time=search_end,
+                    fields=FIND_EVENTS_FIELDS
+                )
             
             # Check each existing event to see if it covers our required period
             for event in existing_events:
@@ -368,19 +755,19 @@ class CalendarSyncEngine:
                 
                 # Skip all-day events - they should not prevent creation of regular busy blocks
                 if event.get('all_day', False):
-                    logger.debug(f"Skipping all-day busy block when checking coverage for event {busy_block.source_event.id}")
+                    logger.debug(f"Skipping all-day busy block when checking coverage for event {source_event_id}")
                     continue
                 
                 # Check if this event fully covers our required period
                 # Event must start at or before our start time and end at or after our end time
                 if (event['start_time'] <= busy_block.start_time and 
                     event['end_time'] >= busy_block.end_time):
-                    logger.debug(f"Found covering busy block for event {busy_block.source_event.id}: "
+                    logger.debug(f"Found covering busy block for event {source_event_id}: "
                                f"existing block ({event['start_time']} to {event['end_time']}) "
                                f"covers required period ({busy_block.start_time} to {busy_block.end_time})")
                     return True
             
-            logger.debug(f"No covering busy block found for event {busy_block.source_event.id}")
+            logger.debug(f"No covering busy block found for event {source_event_id}")
             return False
             
         except Exception as e:
@@ -389,7 +776,9 @@ class CalendarSyncEngine:
     
     def sync_calendar_events(self, calendar_id: str, account_id: int, 
                            start_date: datetime, end_date: datetime,
-                           sync_type: str = "polling") -> CalendarSyncResult:
+                           sync_type: str = "polling", incremental: bool = False,
+                           existing_blocks_cache: Optional[Dict[Tuple[int, str], _TargetCalendarSnapshot]] = None
+                           ) -> CalendarSyncResult:
         """Sync events from a specific calendar within a date range.
         
         Args:
@@ -398,6 +787,10 @@ class CalendarSyncEngine:
             start_date: Start date for sync range
             end_date: End date for sync range
             sync_type: Type of sync operation ("webhook" or "polling")
+            incremental: Only process events that changed (or entered the date range)
+                since the previous incremental sync of this calendar
+            existing_blocks_cache: Target calendar snapshots to share with other calendars
+                synced in the same pass (updated in place)
             
         Returns:
             Sync results
@@ -414,74 +807,365 @@ class CalendarSyncEngine:
             error=None
         )
         
+        # Passes touching the same source or target calendars run one at a time
+        events: List[ParsedEvent] = []
+        with self._calendar_locks_held(self._calendars_of_source(account_id, calendar_id)):
+            try:
+                # Get calendar client
+                client = self.account_manager.get_client(account_id)
+                
+                # Get events in date range
+                if incremental:
+                    events = self._fetch_event_changes(client, account_id, calendar_id, start_date, end_date)
+                else:
+                    events = client.get_events(calendar_id, start_date, end_date)
+                result.events_found = len(events)
+                
+                logger.info(f"Found {len(events)} events in calendar {calendar_id} from {start_date.date()} to {end_date.date()}")
+                
+                # No flow reads this calendar, so no event can need processing
+                if not self._flows_for_source(account_id, calendar_id):
+                    logger.debug(f"No sync flows for calendar {calendar_id}, skipping {len(events)} events")
+                    return result
+                
+                # Convert to CalendarEvent models in a single batch validation
+                calendar_events = self._build_calendar_events(events, calendar_id, account_id)
+                criteria_mask = self._criteria_mask(calendar_events)
+                
+                # Fetch each target calendar once instead of searching it for every event
+                busy_block_keys = self._calculate_busy_block_keys(account_id, calendar_id, calendar_events)
+                existing_blocks_cache = self._prefetch_target_calendars(busy_block_keys, existing_blocks_cache)
+                pending_writes = _PendingWrites()
+                
+                # Process each event
+                for event_data, event, meets_criteria, event_keys in zip(events, calendar_events, criteria_mask, busy_block_keys):
+                    try:
+                        if isinstance(event, ValidationError):
+                            raise event
+                        
+                        # Process event through sync flows
+                        event_results = self.process_event(
+                            event, sync_type, meets_criteria, existing_blocks_cache, pending_writes, event_keys
+                        )
+                        result.results.extend(event_results)
+                        
+                        if event_results:
+                            result.events_processed += 1
+                            
+                    except Exception as e:
+                        logger.error(f"Error processing event {event_data.get('id', 'unknown')}: {e}")
+                        result.results.append(EventProcessingResult(
+                            flow_name='unknown',
+                            event_id=event_data.get('id', 'unknown'),
+                            event_title=event_data.get('title', 'unknown'),
+                            sync_type=sync_type,
+                            success=False,
+                            action='error',
+                            error=str(e),
+                            reason=None
+                        ))
+                
+                # Writes queued above go out as batch requests
+                self._flush_pending_writes(pending_writes)
+                
+                logger.info(f"Processed {result.events_processed} events from calendar {calendar_id}")
+                failed_event_ids = {r.event_id for r in result.results if not r.success}
+                
+            except Exception as e:
+                logger.error(f"Error syncing calendar {calendar_id}: {e}")
+                result.error = str(e)
+                with self._stats_lock:
+                    self._errors += 1
+                # Whatever was fetched before the failure may not have been processed
+                failed_event_ids = {event['id'] for event in events}
+            
+            if incremental and failed_event_ids:
+                self._retry_incremental_events(account_id, calendar_id, events, failed_event_ids)
+        
+        return result
+    
+    def _calendars_of_source(self, account_id: int, calendar_id: str) -> List[Tuple[int, str]]:
+        """List the calendars a sync pass of a source calendar reads or writes.
+        
+        Args:
+            account_id: Source account ID
+            calendar_id: Source calendar ID
+            
+        Returns:
+            The source calendar and the target calendars of its flows
+        """
+        return [(account_id, calendar_id)] + [
+            (flow.target_account_id, flow.target_calendar_id)
+            for flow in self._flows_for_source(account_id, calendar_id)
+        ]
+    
+    @contextmanager
+    def _calendar_locks_held(self, calendars: Iterable[Tuple[int, str]]) -> Iterator[None]:
+        """Hold the locks of the given calendars.
+        
+        Locks are always taken in sorted order, so passes over overlapping
+        calendar sets can't deadlock; nested calls may only re-take held locks.
+        
+        Args:
+            calendars: (account ID, calendar ID) of each calendar to lock
+        """
+        with self._calendar_locks_guard:
+            locks = [
+                self._calendar_locks.setdefault(calendar, threading.RLock())
+                for calendar in sorted(set(calendars))
+            ]
+        
+        for lock in locks:
+            lock.acquire()
         try:
-            # Get calendar client
-            client = self.account_manager.get_client(account_id)
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+    
+    def _fetch_event_changes(self, client: GoogleCalendarClient, account_id: int, calendar_id: str,
+                             start_date: datetime, end_date: datetime) -> List[ParsedEvent]:
+        """Get the events of a calendar that need processing since its last incremental sync.
+        
+        Every known event of the calendar is kept between syncs, so events deleted
+        since then can still be matched to their busy blocks, and unchanged events
+        that only now moved into the date range are processed too.
+        
+        Args:
+            client: Google Calendar client of the source account
+            account_id: Source account ID
+            calendar_id: Source calendar ID
+            start_date: Start date for sync range
+            end_date: End date for sync range
             
-            # Get events in date range
-            events = client.get_events(calendar_id, start_date, end_date)
-            result.events_found = len(events)
+        Returns:
+            Changed events in the date range, events that entered the date range,
+            and cancelled copies of events deleted since the last sync
+        """
+        state = self._incremental_state.get((account_id, calendar_id))
+        
+        # Without a previous state every event is new, so list them all
+        changed, cancelled_ids, _, listed_all = client.get_events_incremental(
+            calendar_id, start_date, full_listing=state is None
+        )
+        if state is None:
+            state = self._incremental_state[(account_id, calendar_id)] = _IncrementalSyncState({})
+        
+        window = (_to_epoch_minute(start_date), _to_epoch_minute(end_date))
+        known = state.events
+        pending: List[ParsedEvent] = []
+        changed_ids = {event['id'] for event in changed}
+        
+        # A full listing (expired token, or a new client without one) reports no
+        # deletions, so known events missing from it were deleted in the meantime
+        if listed_all:
+            cancelled_ids = list(cancelled_ids) + [event_id for event_id in known if event_id not in changed_ids]
+        
+        for event in changed:
+            known[event['id']] = event
+            if _overlaps(event, window):
+                pending.append(event)
+        
+        for event_id in cancelled_ids:
+            deleted_event = known.pop(event_id, None)
+            if deleted_event is not None and _overlaps(deleted_event, window):
+                pending.append({**deleted_event, 'status': 'cancelled'})
+        
+        # Unchanged events that slid into the date range since the last sync
+        if state.window is not None:
+            pending.extend(
+                event for event_id, event in known.items()
+                if event_id not in changed_ids and _overlaps(event, window) and not _overlaps(event, state.window)
+            )
+        
+        # Events that failed last time, unless a newer version is already pending
+        # (or the event was deleted since, which only its cancelled copy still needs)
+        pending_ids = {event['id'] for event in pending}
+        deleted_ids = set(cancelled_ids)
+        pending.extend(
+            event for event_id, event in state.retry.items()
+            if event_id not in pending_ids and _overlaps(event, window)
+            and (event_id not in deleted_ids or event['status'] == 'cancelled')
+        )
+        state.retry = {}
+        
+        # Events that ended before the date range can never need processing again
+        for event_id in [event_id for event_id, event in known.items() if _to_epoch_minute(event['end_time']) <= window[0]]:
+            del known[event_id]
+        
+        state.window = window
+        return pending
+    
+    def _retry_incremental_events(self, account_id: int, calendar_id: str,
+                                  events: List[ParsedEvent], failed_event_ids: set[str]) -> None:
+        """Keep failed events of an incremental sync for the next sync of the calendar.
+        
+        The sync token already moved past these changes, so without this they
+        would never be fetched, and processed, again.
+        
+        Args:
+            account_id: Source account ID
+            calendar_id: Source calendar ID
+            events: Events fetched for the sync pass
+            failed_event_ids: IDs of the events that weren't processed successfully
+        """
+        state = self._incremental_state.get((account_id, calendar_id))
+        if state is None:
+            return
+        for event in events:
+            if event['id'] in failed_event_ids:
+                state.retry[event['id']] = event
+        logger.info(f"Retrying {len(failed_event_ids)} failed events of calendar {calendar_id} on its next incremental sync")
+    
+    def _calculate_busy_block_keys(self, account_id: int, calendar_id: str,
+                                   calendar_events: List[Union[CalendarEvent, ValidationError]]
+                                   ) -> List[Dict[int, BusyBlockKey]]:
+        """Calculate the busy blocks each event needs, once per sync pass.
+        
+        Args:
+            account_id: Source account ID
+            calendar_id: Source calendar ID
+            calendar_events: Source events as returned by _build_calendar_events
             
-            logger.info(f"Found {len(events)} events in calendar {calendar_id} from {start_date.date()} to {end_date.date()}")
+        Returns:
+            For every event, in order: busy block keys by id() of the sync flow
+            (empty for events that failed validation)
+        """
+        flows = self._flows_for_source(account_id, calendar_id)
+        return [
+            {id(flow): flow.busy_block_key(event) for flow in flows} if isinstance(event, CalendarEvent) else {}
+            for event in calendar_events
+        ]
+    
+    def _prefetch_target_calendars(self, busy_block_keys: List[Dict[int, BusyBlockKey]],
+                                   snapshots: Optional[Dict[Tuple[int, str], _TargetCalendarSnapshot]] = None
+                                   ) -> Dict[Tuple[int, str], _TargetCalendarSnapshot]:
+        """Fetch the target calendars of a source calendar's flows for in-memory busy block lookups.
+        
+        Each target calendar is fetched once, over a window covering every busy block
+        the events could need plus the margin used to find covering blocks. Snapshots
+        already fetched for a wide enough window are reused.
+        
+        Args:
+            busy_block_keys: Busy block keys of the source events, from _calculate_busy_block_keys
+            snapshots: Snapshots from earlier calendars of the same sync pass (updated in place)
             
-            # Process each event
-            for event_data in events:
-                try:
-                    # Convert to CalendarEvent model
-                    event = CalendarEvent(
-                        id=event_data['id'],
-                        calendar_id=calendar_id,
-                        account_id=account_id,
-                        title=event_data['title'],
-                        description=event_data.get('description', ''),
-                        start_time=event_data['start_time'],
-                        end_time=event_data['end_time'],
-                        all_day=event_data.get('all_day', False),
-                        participants=event_data.get('participants', []),
-                        participant_count=event_data.get('participant_count', 0),
-                        status=event_data.get('status', 'unknown'),
-                        creator=event_data.get('creator', ''),
-                        organizer=event_data.get('organizer', ''),
-                        transparency=event_data.get('transparency', 'opaque')
-                    )
-                    
-                    # Process event through sync flows
-                    event_results = self.process_event(event, sync_type)
-                    result.results.extend(event_results)
-                    
-                    if event_results:
-                        result.events_processed += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error processing event {event_data.get('id', 'unknown')}: {e}")
-                    result.results.append(EventProcessingResult(
-                        flow_name='unknown',
-                        event_id=event_data.get('id', 'unknown'),
-                        event_title=event_data.get('title', 'unknown'),
-                        sync_type=sync_type,
-                        success=False,
-                        action='error',
-                        error=str(e),
-                        reason=None
-                    ))
-            
-            logger.info(f"Processed {result.events_processed} events from calendar {calendar_id}")
+        Returns:
+            Snapshots by (target account ID, target calendar ID); targets that
+            could not be fetched are left out so lookups fall back to the API
+        """
+        if snapshots is None:
+            snapshots = {}
+        
+        # Window of busy blocks needed per target calendar, as epoch minutes since
+        # all-day events have naive times and timed events aware ones
+        windows: Dict[Tuple[int, str], Tuple[int, int]] = {}
+        for event_keys in busy_block_keys:
+            for key in event_keys.values():
+                target = (key.target_account_id, key.target_calendar_id)
+                start = _to_epoch_minute(key.start_time) - COVERING_SEARCH_MARGIN_MINUTES
+                end = _to_epoch_minute(key.end_time) + COVERING_SEARCH_MARGIN_MINUTES
+                window = windows.get(target)
+                windows[target] = (start, end) if window is None else (min(window[0], start), max(window[1], end))
+        
+        for target, window in windows.items():
+            snapshot = snapshots.get(target)
+            if snapshot is not None and snapshot.covers(window):
+                continue
             
-        except Exception as e:
-            logger.error(f"Error syncing calendar {calendar_id}: {e}")
-            result.error = str(e)
-            self.stats['errors'] += 1
+            target_account_id, target_calendar_id = target
+            try:
+                target_client = self.account_manager.get_client(target_account_id)
+                target_events = target_client.get_events(
+                    calendar_id=target_calendar_id,
+                    start_time=datetime.fromtimestamp(window[0] * 60, timezone.utc),
+                    end_time=datetime.fromtimestamp(window[1] * 60, timezone.utc),
+                    fields=FIND_EVENTS_FIELDS
+                )
+                snapshots[target] = _TargetCalendarSnapshot(target_events, window)
+            except Exception as e:
+                logger.warning(f"Could not prefetch target calendar {target_calendar_id}, searching per event: {e}")
+                snapshots.pop(target, None)
         
-        return result
+        return snapshots
+    
+    def _build_calendar_events(self, events: Sequence[Mapping[str, Any]], calendar_id: str,
+                               account_id: int) -> List[Union[CalendarEvent, ValidationError]]:
+        """Convert parsed API events into CalendarEvent models.
+        
+        The whole list is validated in one call. If any event is invalid, falls back
+        to per-event validation so a single bad event doesn't fail the whole calendar.
+        
+        Args:
+            events: Parsed events returned by GoogleCalendarClient.get_events
+            calendar_id: Calendar ID the events belong to
+            account_id: Account ID the events belong to
+            
+        Returns:
+            List aligned with events containing a CalendarEvent or the validation error
+        """
+        event_dicts = [
+            {**event_data, 'calendar_id': calendar_id, 'account_id': account_id}
+            for event_data in events
+        ]
+        
+        try:
+            return list(_CALENDAR_EVENT_LIST_ADAPTER.validate_python(event_dicts))
+        except ValidationError:
+            pass
+        
+        calendar_events: List[Union[CalendarEvent, ValidationError]] = []
+        for event_dict in event_dicts:
+            try:
+                calendar_events.append(CalendarEvent.model_validate(event_dict))
+            except ValidationError as e:
+                calendar_events.append(e)
+        
+        return calendar_events
+    
+    def _criteria_mask(self, calendar_events: List[Union[CalendarEvent, ValidationError]]) -> List[bool]:
+        """Evaluate sync criteria for a whole batch of events in one pass.
+        
+        Args:
+            calendar_events: Events as returned by _build_calendar_events
+            
+        Returns:
+            List aligned with calendar_events, True where the event meets sync criteria
+        """
+        event_meets_criteria = self._event_meets_criteria
+        return [isinstance(event, CalendarEvent) and event_meets_criteria(event) for event in calendar_events]
     
     def sync_all_source_calendars(self, start_date: datetime, end_date: datetime,
-                                 sync_type: str = "polling") -> CompleteSyncResult:
+                                 sync_type: str = "polling", incremental: bool = False) -> CompleteSyncResult:
         """Sync all source calendars from configured sync flows.
         
         Args:
             start_date: Start date for sync range
             end_date: End date for sync range
             sync_type: Type of sync operation
+            incremental: Only process events changed since the previous incremental sync
+            
+        Returns:
+            Complete sync results
+        """
+        # Get unique source calendars from all sync flows
+        source_calendars: set[Tuple[int, str]] = set()
+        for flow in self.config.sync_flows:
+            source_calendars.add((flow.source_account_id, flow.source_calendar_id))
+        
+        return self.sync_source_calendars(source_calendars, start_date, end_date, sync_type, incremental)
+    
+    def sync_source_calendars(self, source_calendars: set[Tuple[int, str]], start_date: datetime,
+                              end_date: datetime, sync_type: str = "polling",
+                              incremental: bool = False) -> CompleteSyncResult:
+        """Sync the given source calendars concurrently.
+        
+        Args:
+            source_calendars: (account ID, calendar ID) of each source calendar to sync
+            start_date: Start date for sync range
+            end_date: End date for sync range
+            sync_type: Type of sync operation
+            incremental: Only process events changed since the previous incremental sync
             
         Returns:
             Complete sync results
@@ -498,39 +1182,36 @@ class CalendarSyncEngine:
             sync_start_time=None
         )
         
-        # Get unique source calendars from all sync flows
-        source_calendars: set[Tuple[int, str]] = set()
-        for flow in self.config.sync_flows:
-            source_calendars.add((flow.source_account_id, flow.source_calendar_id))
-        
         logger.info(f"Starting sync of {len(source_calendars)} source calendars from {start_date.date()} to {end_date.date()}")
         
-        # Sync each unique source calendar
-        for account_id, calendar_id in source_calendars:
-            try:
-                calendar_result = self.sync_calendar_events(
-                    calendar_id, account_id, start_date, end_date, sync_type
-                )
-                
-                sync_results.calendar_results.append(calendar_result)
-                sync_results.calendars_synced += 1
-                sync_results.total_events_found += calendar_result.events_found
-                sync_results.total_events_processed += calendar_result.events_processed
+        if not source_calendars:
+            return sync_results
+        
+        # Sync source calendars concurrently; calendars writing to a shared target stay in one
+        # worker so each sees the busy blocks the other created
+        groups = self._group_by_shared_targets(source_calendars)
+        with ThreadPoolExecutor(max_workers=min(len(groups), MAX_SYNC_WORKERS)) as executor:
+            futures: Dict[Future[List[Tuple[CalendarSyncResult, bool]]], List[Tuple[int, str]]] = {
+                executor.submit(self._sync_calendar_group, group, start_date, end_date, sync_type, incremental): group
+                for group in groups
+            }
+            for future in as_completed(futures):
+                try:
+                    calendar_results = future.result()
+                except Exception as e:
+                    # _sync_calendar_group reports per-calendar errors itself; this is a last resort
+                    logger.error(f"Error syncing calendars {futures[future]}: {e}")
+                    calendar_results = [
+                        (self._failed_calendar_result(calendar_id, account_id, start_date, end_date, sync_type, e), False)
+                        for account_id, calendar_id in futures[future]
+                    ]
                 
-            except Exception as e:
-                logger.error(f"Error syncing calendar {calendar_id} for account {account_id}: {e}")
-                error_result = CalendarSyncResult(
-                    calendar_id=calendar_id,
-                    account_id=account_id,
-                    start_date=start_date.isoformat(),
-                    end_date=end_date.isoformat(),
-                    sync_type=sync_type,
-                    events_found=0,
-                    events_processed=0,
-                    results=[],
-                    error=str(e)
-                )
-                sync_results.calendar_results.append(error_result)
+                for calendar_result, completed in calendar_results:
+                    sync_results.calendar_results.append(calendar_result)
+                    if completed:
+                        sync_results.calendars_synced += 1
+                        sync_results.total_events_found += calendar_result.events_found
+                        sync_results.total_events_processed += calendar_result.events_processed
         
         logger.info(f"Completed sync: {sync_results.calendars_synced} calendars, "
                    f"{sync_results.total_events_found} events found, "
@@ -538,17 +1219,93 @@ class CalendarSyncEngine:
         
         return sync_results
     
+    def _group_by_shared_targets(self, source_calendars: set[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """Group source calendars whose sync flows write to a common target calendar.
+        
+        Args:
+            source_calendars: (account ID, calendar ID) of each source calendar
+            
+        Returns:
+            Groups of source calendars that must be synced one after another
+        """
+        groups: List[Tuple[set[Tuple[int, str]], List[Tuple[int, str]]]] = []
+        for source in source_calendars:
+            targets = {
+                (flow.target_account_id, flow.target_calendar_id)
+                for flow in self.config.sync_flows
+                if (flow.source_account_id, flow.source_calendar_id) == source
+            }
+            sources = [source]
+            for group in [group for group in groups if group[0] & targets]:
+                groups.remove(group)
+                targets |= group[0]
+                sources = group[1] + sources
+            groups.append((targets, sources))
+        
+        return [sources for _, sources in groups]
+    
+    def _sync_calendar_group(self, calendars: List[Tuple[int, str]], start_date: datetime,
+                             end_date: datetime, sync_type: str,
+                             incremental: bool = False) -> List[Tuple[CalendarSyncResult, bool]]:
+        """Sync a group of source calendars one after another.
+        
+        Args:
+            calendars: (account ID, calendar ID) of each source calendar
+            start_date: Start date for sync range
+            end_date: End date for sync range
+            sync_type: Type of sync operation
+            incremental: Only process events changed since the previous incremental sync
+            
+        Returns:
+            One (sync result, completed) pair per calendar; completed is False if the sync raised
+        """
+        results: List[Tuple[CalendarSyncResult, bool]] = []
+        
+        # The calendars share target calendars, so each target is fetched once for the group
+        existing_blocks_cache: Dict[Tuple[int, str], _TargetCalendarSnapshot] = {}
+        # The shared snapshots stay valid only while no other pass writes to the targets
+        group_calendars = [
+            calendar for account_id, calendar_id in calendars
+            for calendar in self._calendars_of_source(account_id, calendar_id)
+        ]
+        with self._calendar_locks_held(group_calendars):
+            for account_id, calendar_id in calendars:
+                try:
+                    results.append((self.sync_calendar_events(
+                        calendar_id, account_id, start_date, end_date, sync_type, incremental, existing_blocks_cache
+                    ), True))
+                except Exception as e:
+                    logger.error(f"Error syncing calendar {calendar_id} for account {account_id}: {e}")
+                    results.append((self._failed_calendar_result(calendar_id, account_id, start_date, end_date, sync_type, e), False))
+        return results
+    
+    def _failed_calendar_result(self, calendar_id: str, account_id: int, start_date: datetime,
+                                end_date: datetime, sync_type: str, error: Exception) -> CalendarSyncResult:
+        """Build the result reported for a calendar whose sync raised."""
+        return CalendarSyncResult(
+            calendar_id=calendar_id,
+            account_id=account_id,
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            sync_type=sync_type,
+            events_found=0,
+            events_processed=0,
+            results=[],
+            error=str(error)
+        )
+    
     def get_stats(self) -> SyncEngineStats:
         """Get sync engine statistics.
         
         Returns:
             Statistics
         """
+        stats = self.stats
         return SyncEngineStats(
-            events_processed=self.stats['events_processed'],
-            busy_blocks_created=self.stats['busy_blocks_created'],
-            busy_blocks_deleted=self.stats['busy_blocks_deleted'],
-            errors=self.stats['errors'],
+            events_processed=stats['events_processed'],
+            busy_blocks_created=stats['busy_blocks_created'],
+            busy_blocks_deleted=stats['busy_blocks_deleted'],
+            errors=stats['errors'],
             accounts=len(self.config.accounts),
             sync_flows=len(self.config.sync_flows),
             last_updated=datetime.now().isoformat()
@@ -556,10 +1313,9 @@ class CalendarSyncEngine:
     
     def reset_stats(self) -> None:
         """Reset sync engine statistics."""
-        self.stats = {
-            'events_processed': 0,
-            'busy_blocks_created': 0,
-            'busy_blocks_deleted': 0,
-            'errors': 0
-        }
+        with self._stats_lock:
+            self._events_processed = 0
+            self._busy_blocks_created = 0
+            self._busy_blocks_deleted = 0
+            self._errors = 0
         logger.info("Reset sync engine statistics") 
\ No newline at end of file
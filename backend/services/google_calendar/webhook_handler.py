@@ -5,26 +5,75 @@ This module handles incoming Google Calendar webhook notifications,
 validates them, and processes calendar events through the sync engine.
 """
 
+import asyncio
 import logging
+import sys
+import threading
+import time
 import uuid
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 
 from backend.models.calendar import (
     MultiAccountConfig,
+    SyncFlow,
+    EventProcessingResult,
     WebhookProcessingResult,
     MonitoredCalendar,
     CalendarSyncResult,
     WebhookHeaders,
     WebhookValidationResult,
-    ChannelSubscriptionResult
+    ChannelSubscriptionResult,
+    WEBHOOK_RESOURCE_STATES
 )
+from backend.models.google_account import GoogleAccount
 from backend.services.google_calendar.sync_engine import CalendarSyncEngine
 from backend.services.google_calendar.account_manager import AccountManager
 from backend.services.google_calendar.client import GoogleCalendarError
 
 logger = logging.getLogger(__name__)
 
+# Payload fields every webhook notification must carry, non-empty
+WEBHOOK_REQUIRED_FIELDS = ('resourceId', 'channelId', 'resourceState')
+
+# How long notified calendars are collected before the batch is synced, for
+# handlers that opt in to batching (the webhook API route does)
+WEBHOOK_DEBOUNCE_SECONDS = 30.0
+
+# How long repeated notifications for the same unmonitored calendar are rejected without logging
+UNKNOWN_CALENDAR_LOG_INTERVAL_SECONDS = 60.0
+
+# Maximum number of unmonitored calendar IDs remembered for log suppression
+UNKNOWN_CALENDAR_CACHE_SIZE = 1024
+
+# A 'sync' notification for a calendar synced more recently than this is skipped
+SYNC_NOTIFICATION_REFETCH_SECONDS = 300.0
+
+# Webhook syncs cover yesterday through the end of the seventh day from today,
+# as offsets from the start of today
+WEBHOOK_LOOKBACK = timedelta(days=1)
+WEBHOOK_LOOKAHEAD_END = timedelta(days=8) - timedelta(microseconds=1)
+
+# Last webhook timestamp as (epoch second, ISO string), formatted once per second
+_timestamp_cache: Tuple[int, str] = (0, '')
+
+
+def _now_iso() -> str:
+    """Get the current local time in ISO format, to the second.
+    
+    Returns:
+        ISO timestamp, re-formatted only when the second changes
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now).isoformat())
+        _timestamp_cache = cached
+    return cached[1]
+
 
 class WebhookHandlerError(Exception):
     """Exception raised when webhook handling fails."""
@@ -34,22 +83,69 @@ class WebhookHandlerError(Exception):
 class GoogleCalendarWebhookHandler:
     """Handles Google Calendar webhook notifications and processes events."""
     
-    def __init__(self, config: MultiAccountConfig, account_manager: AccountManager, sync_engine: CalendarSyncEngine) -> None:
+    __slots__ = (
+        'config',
+        'account_manager',
+        'sync_engine',
+        'debounce_seconds',
+        '_pending',
+        '_flush_timer',
+        '_lock',
+        'calendar_to_account',
+        '_monitored_calendars',
+        '_monitored_source',
+        '_monitored_counts',
+        '_state_handlers',
+        '_unknown_calendars',
+        '_last_synced',
+    )
+    
+    def __init__(self, config: MultiAccountConfig, account_manager: AccountManager, sync_engine: CalendarSyncEngine,
+                 debounce_seconds: float = 0) -> None:
         """Initialize webhook handler.
         
         Args:
             config: Multi-account configuration
             account_manager: Account manager for accessing Google Calendar clients
             sync_engine: Sync engine for processing events
+            debounce_seconds: Delay before a notified calendar is synced, batching notifications
+                (e.g. WEBHOOK_DEBOUNCE_SECONDS); 0 syncs during handle_webhook. Call close()
+                on shutdown when batching, so queued calendars are still synced
         """
         self.config = config
         self.account_manager = account_manager
         self.sync_engine = sync_engine
+        self.debounce_seconds = debounce_seconds
         
-        # Build calendar to account mapping for faster lookups
-        self.calendar_to_account: Dict[str, int] = {}
+        # Calendars waiting for the next batch of webhook syncs, as an ordered set of
+        # (calendar_id, account_id); the timer flushes the batch
+        self._pending: Dict[Tuple[str, int], None] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        
+        # Build calendar to account mapping for faster lookups; read-only after construction
+        calendar_to_account: Dict[str, int] = {}
         for flow in config.sync_flows:
-            self.calendar_to_account[flow.source_calendar_id] = flow.source_account_id
+            calendar_to_account[sys.intern(flow.source_calendar_id)] = flow.source_account_id
+        self.calendar_to_account: Mapping[str, int] = MappingProxyType(calendar_to_account)
+        
+        # Monitored calendar list, rebuilt whenever sync_flows or accounts is replaced or resized
+        self._monitored_calendars: List[MonitoredCalendar] = []
+        self._monitored_source: Optional[Tuple[Sequence[SyncFlow], Sequence[GoogleAccount]]] = None
+        self._monitored_counts = (0, 0)
+        
+        # Monotonic time each unmonitored calendar was last logged, least recent first
+        self._unknown_calendars: OrderedDict[str, float] = OrderedDict()
+        
+        # Monotonic time of each calendar's last successful webhook sync
+        self._last_synced: Dict[str, float] = {}
+        
+        # Notification handlers by resource state; other states are rejected
+        self._state_handlers: Dict[str, Callable[[str, int, str], WebhookProcessingResult]] = {
+            'sync': self._handle_sync,
+            'update': self._handle_sync_or_update,
+            'exists': self._handle_exists
+        }
         
         logger.info(f"Initialized webhook handler for {len(config.sync_flows)} sync flows")
     
@@ -62,85 +158,174 @@ class GoogleCalendarWebhookHandler:
         Returns:
             Processing result
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
         
         try:
+            # Reject notifications for unmonitored calendars with one dict lookup,
+            # before validating or logging anything
+            calendar_id = webhook_data.get('resourceId', '')
+            if calendar_id and calendar_id not in self.calendar_to_account:
+                self._log_unknown_calendar(calendar_id)
+                return self._fail(timestamp, f'No account found for calendar {calendar_id}')
+            
             # Validate webhook data
             if not self._validate_webhook_data(webhook_data):
-                return WebhookProcessingResult(
-                    success=False,
-                    webhook_type='google_calendar',
-                    timestamp=timestamp,
-                    processed_events=0,
-                    results=[],
-                    error='Invalid webhook data format'
-                )
+                return self._fail(timestamp, 'Invalid webhook data format')
             
             # Extract calendar information
-            calendar_id = webhook_data.get('resourceId', '')
             channel_id = webhook_data.get('channelId', '')
             resource_state = webhook_data.get('resourceState', '')
             
-            logger.info(f"Processing webhook for calendar {calendar_id}, channel {channel_id}, state {resource_state}")
+            logger.info("Processing webhook for calendar %s, channel %s, state %s", calendar_id, channel_id, resource_state)
             
             # Find the account for this calendar
             account_id = self._find_account_for_calendar(calendar_id)
             if account_id is None:
-                return WebhookProcessingResult(
-                    success=False,
-                    webhook_type='google_calendar',
-                    timestamp=timestamp,
-                    processed_events=0,
-                    results=[],
-                    error=f'No account found for calendar {calendar_id}'
-                )
+                return self._fail(timestamp, f'No account found for calendar {calendar_id}')
             
-            # Process based on resource state
-            if resource_state in ['sync', 'update']:
-                # Fetch and process recent events
-                events_result = self._fetch_and_process_recent_events(calendar_id, account_id)
-                return WebhookProcessingResult(
-                    success=True,
-                    webhook_type='google_calendar',
-                    timestamp=timestamp,
-                    processed_events=events_result.events_processed,
-                    results=events_result.results,
-                    error=events_result.error
-                )
+            # Dispatch on resource state
+            handler = self._state_handlers.get(resource_state)
+            if handler is not None:
+                return handler(calendar_id, account_id, timestamp)
             
-            elif resource_state == 'exists':
-                # Initial sync notification - can be ignored or used for status
-                logger.info(f"Received 'exists' notification for calendar {calendar_id}")
-                return WebhookProcessingResult(
-                    success=True,
-                    webhook_type='google_calendar',
-                    timestamp=timestamp,
-                    processed_events=0,
-                    results=[],
-                    error=None
-                )
-            
-            else:
-                logger.warning(f"Unknown resource state: {resource_state}")
-                return WebhookProcessingResult(
-                    success=False,
-                    webhook_type='google_calendar',
-                    timestamp=timestamp,
-                    processed_events=0,
-                    results=[],
-                    error=f'Unknown resource state: {resource_state}'
-                )
+            logger.warning(f"Unknown resource state: {resource_state}")
+            return self._fail(timestamp, f'Unknown resource state: {resource_state}')
             
         except Exception as e:
             logger.error(f"Error handling webhook: {e}")
-            return WebhookProcessingResult(
-                success=False,
-                webhook_type='google_calendar',
-                timestamp=timestamp,
-                processed_events=0,
-                results=[],
-                error=str(e)
-            )
+            return self._fail(timestamp, str(e))
+    
+    def _log_unknown_calendar(self, calendar_id: str) -> None:
+        """Log a notification for an unmonitored calendar, at most once per interval.
+        
+        Keeps probes or stale channels that repeatedly notify about the same
+        calendar from flooding the log.
+        
+        Args:
+            calendar_id: Unmonitored calendar ID from the notification
+        """
+        now = time.monotonic()
+        with self._lock:
+            last_logged = self._unknown_calendars.get(calendar_id)
+            if last_logged is not None and now - last_logged < UNKNOWN_CALENDAR_LOG_INTERVAL_SECONDS:
+                return
+            self._unknown_calendars[calendar_id] = now
+            self._unknown_calendars.move_to_end(calendar_id)
+            if len(self._unknown_calendars) > UNKNOWN_CALENDAR_CACHE_SIZE:
+                self._unknown_calendars.popitem(last=False)
+        
+        logger.warning(f"Rejected webhook for unmonitored calendar {calendar_id}")
+    
+    @staticmethod
+    def _result(success: bool, timestamp: str, processed_events: int,
+                results: List[EventProcessingResult], error: Optional[str]) -> WebhookProcessingResult:
+        """Build a webhook processing result.
+        
+        Fields come from the handler and the sync engine's own results, so
+        pydantic validation is skipped.
+        
+        Args:
+            success: Whether the notification was processed
+            timestamp: Processing timestamp
+            processed_events: Number of events processed
+            results: Individual event processing results
+            error: Error message, if any
+            
+        Returns:
+            Processing result
+        """
+        return WebhookProcessingResult.model_construct(
+            success=success,
+            webhook_type='google_calendar',
+            timestamp=timestamp,
+            processed_events=processed_events,
+            results=results,
+            error=error
+        )
+    
+    @classmethod
+    def _fail(cls, timestamp: str, error: str) -> WebhookProcessingResult:
+        """Build the result of a rejected or failed notification.
+        
+        Args:
+            timestamp: Processing timestamp
+            error: Why the notification was not processed
+            
+        Returns:
+            Unsuccessful processing result with no events
+        """
+        return cls._result(False, timestamp, 0, [], error)
+    
+    async def handle_webhook_async(self, webhook_data: Dict[str, Any]) -> WebhookProcessingResult:
+        """Handle a webhook notification without blocking the event loop.
+        
+        Runs handle_webhook in a worker thread, so inline syncs (debounce_seconds=0)
+        and lock waits never stall other requests served by the loop.
+        
+        Args:
+            webhook_data: Webhook payload from Google Calendar
+            
+        Returns:
+            Processing result
+        """
+        return await asyncio.to_thread(self.handle_webhook, webhook_data)
+    
+    def _handle_sync(self, calendar_id: str, account_id: int, timestamp: str) -> WebhookProcessingResult:
+        """Handle a 'sync' notification, skipping calendars that were just synced.
+        
+        Google sends 'sync' when a channel starts watching a calendar; it carries
+        no change, so a calendar synced moments ago has nothing new to fetch.
+        'update' notifications are never skipped, since each one signals a change.
+        
+        Args:
+            calendar_id: Notified calendar ID
+            account_id: Account ID for the calendar
+            timestamp: Processing timestamp for the result
+            
+        Returns:
+            Processing result
+        """
+        last_synced = self._last_synced.get(calendar_id)
+        if last_synced is not None and time.monotonic() - last_synced < SYNC_NOTIFICATION_REFETCH_SECONDS:
+            logger.info(f"Skipping 'sync' notification for recently synced calendar {calendar_id}")
+            return self._result(True, timestamp, 0, [], None)
+        
+        return self._handle_sync_or_update(calendar_id, account_id, timestamp)
+    
+    def _handle_sync_or_update(self, calendar_id: str, account_id: int, timestamp: str) -> WebhookProcessingResult:
+        """Handle a 'sync' or 'update' notification by syncing the calendar.
+        
+        Args:
+            calendar_id: Notified calendar ID
+            account_id: Account ID for the calendar
+            timestamp: Processing timestamp for the result
+            
+        Returns:
+            Processing result; empty when the sync is deferred to the next batch
+        """
+        if self.debounce_seconds > 0:
+            # Coalesce bursts of notifications into one deferred sync
+            self._schedule_sync(calendar_id, account_id)
+            return self._result(True, timestamp, 0, [], None)
+        
+        # Fetch and process recent events
+        events_result = self._fetch_and_process_recent_events(calendar_id, account_id)
+        return self._result(True, timestamp, events_result.events_processed, events_result.results, events_result.error)
+    
+    def _handle_exists(self, calendar_id: str, account_id: int, timestamp: str) -> WebhookProcessingResult:
+        """Handle an 'exists' notification, which needs no sync.
+        
+        Args:
+            calendar_id: Notified calendar ID
+            account_id: Account ID for the calendar
+            timestamp: Processing timestamp for the result
+            
+        Returns:
+            Empty successful processing result
+        """
+        # Initial sync notification - can be ignored or used for status
+        logger.info(f"Received 'exists' notification for calendar {calendar_id}")
+        return self._result(True, timestamp, 0, [], None)
     
     def _validate_webhook_data(self, webhook_data: Dict[str, Any]) -> bool:
         """Validate webhook data format.
@@ -151,10 +336,8 @@ class GoogleCalendarWebhookHandler:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ['resourceId', 'channelId', 'resourceState']
-        
-        for field in required_fields:
-            if field not in webhook_data or not webhook_data[field]:
+        for field in WEBHOOK_REQUIRED_FIELDS:
+            if not webhook_data.get(field):
                 logger.warning(f"Missing required webhook field: {field}")
                 return False
         
@@ -171,6 +354,103 @@ class GoogleCalendarWebhookHandler:
         """
         return self.calendar_to_account.get(calendar_id)
     
+    def _schedule_sync(self, calendar_id: str, account_id: int) -> None:
+        """Queue a calendar for the next batch of webhook syncs.
+        
+        Google often sends several notifications for one change within seconds.
+        The first queued calendar starts a flush after debounce_seconds; every
+        notification until then only adds its calendar to the batch, so each
+        notified calendar is synced once per batch.
+        
+        Args:
+            calendar_id: Calendar ID to sync
+            account_id: Account ID for the calendar
+        """
+        with self._lock:
+            self._pending[(calendar_id, account_id)] = None
+            if self._flush_timer is None:
+                self._start_flush_timer()
+    
+    def _start_flush_timer(self) -> None:
+        """Start the timer of the next batch flush; the caller holds the lock."""
+        self._flush_timer = threading.Timer(self.debounce_seconds, self._flush_pending_syncs)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _flush_pending_syncs(self) -> None:
+        """Sync every calendar queued since the last flush; called on the timer thread.
+        
+        The flush timer stays set until the sync finishes, so notifications arriving
+        meanwhile wait for the next batch instead of starting an overlapping flush.
+        """
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        
+        try:
+            self._sync_pending(pending)
+        finally:
+            with self._lock:
+                self._flush_timer = None
+                # Once closed, close() syncs whatever is still queued
+                if self._pending and self.debounce_seconds > 0:
+                    self._start_flush_timer()
+    
+    def close(self) -> None:
+        """Stop batching notifications and sync every calendar still queued.
+        
+        Waits for a flush already in progress. Notifications handled afterwards
+        are synced during handle_webhook.
+        """
+        with self._lock:
+            self.debounce_seconds = 0
+            flush_timer = self._flush_timer
+            if flush_timer is not None:
+                flush_timer.cancel()
+        
+        if flush_timer is not None and flush_timer is not threading.current_thread():
+            flush_timer.join()
+        
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._flush_timer = None
+        if pending:
+            self._sync_pending(pending)
+    
+    def _sync_pending(self, pending: List[Tuple[str, int]]) -> None:
+        """Sync a drained batch of notified calendars.
+        
+        Args:
+            pending: (calendar_id, account_id) of each queued calendar
+        """
+        # The engine syncs the calendars concurrently, within its worker limit
+        start_time, end_time = self._recent_events_window()
+        try:
+            result = self.sync_engine.sync_source_calendars(
+                {(account_id, calendar_id) for calendar_id, account_id in pending},
+                start_date=start_time,
+                end_date=end_time,
+                sync_type="webhook"
+            )
+            self._mark_synced(
+                calendar_result.calendar_id for calendar_result in result.calendar_results
+                if calendar_result.error is None
+            )
+            logger.info(f"Flushed {len(pending)} queued webhook sync(s), {result.total_events_processed} events processed")
+        except Exception as e:
+            logger.error(f"Error in deferred webhook sync of {len(pending)} calendar(s): {e}")
+    
+    @staticmethod
+    def _recent_events_window() -> Tuple[datetime, datetime]:
+        """Get the date range synced for a notified calendar.
+        
+        Returns:
+            Start of yesterday and end of the seventh day from today
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - WEBHOOK_LOOKBACK, today + WEBHOOK_LOOKAHEAD_END
+    
     def _fetch_and_process_recent_events(self, calendar_id: str, account_id: int) -> CalendarSyncResult:
         """Fetch and process recent events from a calendar.
         
@@ -183,22 +463,30 @@ class GoogleCalendarWebhookHandler:
         """
         
         # Get recent events (last 24 hours to next 7 days)
-        now = datetime.now()
-        start_time = now.replace(hour=0, minute=0, second=0, microsecond=0)  # Start of today
-        end_time = start_time.replace(hour=23, minute=59, second=59, microsecond=999999)  # End of today
-        
-        # Extend range to catch events that might be modified
-        start_time = start_time - timedelta(days=1)
-        end_time = end_time + timedelta(days=7)
+        start_time, end_time = self._recent_events_window()
         
         # Use sync engine to fetch and process events
-        return self.sync_engine.sync_calendar_events(
+        result = self.sync_engine.sync_calendar_events(
             calendar_id=calendar_id,
             account_id=account_id,
             start_date=start_time,
             end_date=end_time,
             sync_type="webhook"
         )
+        if result.error is None:
+            self._mark_synced([calendar_id])
+        return result
+    
+    def _mark_synced(self, calendar_ids: Iterable[str]) -> None:
+        """Record that calendars were just synced successfully.
+        
+        Args:
+            calendar_ids: IDs of the synced calendars
+        """
+        now = time.monotonic()
+        with self._lock:
+            for calendar_id in calendar_ids:
+                self._last_synced[calendar_id] = now
     
     def get_monitored_calendars(self) -> List[MonitoredCalendar]:
         """Get list of calendars being monitored by webhooks.
@@ -206,19 +494,29 @@ class GoogleCalendarWebhookHandler:
         Returns:
             List of monitored calendar information
         """
-        monitored: List[MonitoredCalendar] = []
-        
-        for flow in self.config.sync_flows:
-            account = self.config.get_account_by_id(flow.source_account_id)
-            if account:
-                monitored.append(MonitoredCalendar(
-                    calendar_id=flow.source_calendar_id,
-                    account_id=flow.source_account_id,
-                    account_email=account.email,
-                    flow_name=flow.name
-                ))
-        
-        return monitored
+        flows = self.config.sync_flows
+        accounts = self.config.accounts
+        source = self._monitored_source
+        if (source is None or source[0] is not flows or source[1] is not accounts
+                or self._monitored_counts != (len(flows), len(accounts))):
+            monitored: List[MonitoredCalendar] = []
+            
+            for flow in flows:
+                account = self.config.get_account_by_id(flow.source_account_id)
+                if account:
+                    monitored.append(MonitoredCalendar(
+                        calendar_id=flow.source_calendar_id,
+                        account_id=flow.source_account_id,
+                        account_email=account.email,
+                        flow_name=flow.name
+                    ))
+            
+            self._monitored_calendars = monitored
+            self._monitored_source = (flows, accounts)
+            self._monitored_counts = (len(flows), len(accounts))
+        
+        # Copy, so callers can't modify the cached list
+        return list(self._monitored_calendars)
     
     def validate_webhook_signature(self, headers: Dict[str, str], webhook_data: Optional[Dict[str, Any]] = None) -> WebhookValidationResult:
         """Validate webhook headers and data from Google Calendar.
@@ -267,8 +565,7 @@ class GoogleCalendarWebhookHandler:
                 )
             
             # Validate resource state is valid
-            valid_states = ['sync', 'exists', 'not_exists']
-            if webhook_headers.x_goog_resource_state not in valid_states:
+            if webhook_headers.x_goog_resource_state not in WEBHOOK_RESOURCE_STATES:
                 return WebhookValidationResult(
                     is_valid=False,
                     reason=f"Invalid resource state: {webhook_headers.x_goog_resource_state}",
@@ -288,7 +585,7 @@ class GoogleCalendarWebhookHandler:
                     resource_state=None
                 )
             
-            logger.debug(f"Webhook validation successful for channel {webhook_headers.x_goog_channel_id}")
+            logger.debug("Webhook validation successful for channel %s", webhook_headers.x_goog_channel_id)
             
             return WebhookValidationResult(
                 is_valid=True,
@@ -381,6 +678,69 @@ class GoogleCalendarWebhookHandler:
                 error=str(e)
             )
     
+    def create_webhook_subscriptions(self, calendars: List[MonitoredCalendar], callback_url: str,
+                                     channel_token: Optional[str] = None) -> List[ChannelSubscriptionResult]:
+        """Create webhook subscriptions for several calendars.
+        
+        Channels are created with one batch request per account, instead of one
+        round trip per calendar.
+        
+        Args:
+            calendars: Calendars to subscribe to
+            callback_url: URL to receive webhook notifications
+            channel_token: Optional verification token for the channels
+            
+        Returns:
+            Subscription result for every calendar, in order
+        """
+        results: List[Optional[ChannelSubscriptionResult]] = [None] * len(calendars)
+        
+        # Batch requests are authorized as one account, so group calendars by account
+        indexes_by_account: Dict[int, List[int]] = {}
+        for index, calendar_info in enumerate(calendars):
+            indexes_by_account.setdefault(calendar_info.account_id, []).append(index)
+        
+        for account_id, indexes in indexes_by_account.items():
+            channels = [
+                {
+                    'calendar_id': calendars[index].calendar_id,
+                    'webhook_url': callback_url,
+                    'channel_id': f"cal-sync-{uuid.uuid4().hex[:16]}",
+                    'channel_token': channel_token
+                }
+                for index in indexes
+            ]
+            
+            try:
+                client = self.account_manager.get_client(account_id)
+                channel_results = client.batch_create_push_notification_channels(channels)
+            except Exception as e:
+                logger.error(f"Error creating webhook subscriptions for account {account_id}: {e}")
+                channel_results = [e] * len(channels)
+            
+            for index, channel, channel_result in zip(indexes, channels, channel_results):
+                if isinstance(channel_result, Exception):
+                    results[index] = ChannelSubscriptionResult(
+                        success=False,
+                        channel_id="",
+                        calendar_id=channel['calendar_id'],
+                        resource_id=None,
+                        expiration=None,
+                        error=str(channel_result)
+                    )
+                else:
+                    results[index] = ChannelSubscriptionResult(
+                        success=True,
+                        channel_id=channel_result['channel_id'],
+                        calendar_id=channel['calendar_id'],
+                        resource_id=channel_result.get('resource_id'),
+                        expiration=channel_result.get('expiration'),
+                        error=None
+                    )
+        
+        logger.info(f"Created {sum(1 for r in results if r and r.success)} of {len(calendars)} webhook subscriptions")
+        return [result for result in results if result is not None]
+    
     def delete_webhook_subscription(self, channel_id: str, resource_id: str, account_id: Optional[int] = None) -> ChannelSubscriptionResult:
         """Delete a webhook subscription.
         
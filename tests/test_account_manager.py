@@ -0,0 +1,364 @@
+"""
+Test AccountManager client handling and multi-account helpers.
+
+This module tests AccountManager with GoogleCalendarClient mocked out,
+so no real Google API calls are made.
+"""
+# type: ignore
+
+import gc
+import json
+import os
+import pytest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator
+from unittest.mock import MagicMock, patch
+
+from backend.models.google_account import GoogleAccount
+from backend.models.calendar import SyncFlow, MultiAccountConfig
+from backend.services.google_calendar import client as client_module
+from backend.services.google_calendar.account_manager import AccountManager, AccountManagerError
+
+
+def make_account(account_id: int) -> GoogleAccount:
+    """Build a test account with unique credentials."""
+    return GoogleAccount(
+        account_id=account_id,
+        email=f"user{account_id}@example.com",
+        client_id=f"client_id_{account_id}",
+        client_secret=f"client_secret_{account_id}",
+        refresh_token=f"refresh_token_{account_id}"
+    )
+
+
+@pytest.fixture
+def config() -> MultiAccountConfig:
+    """Test configuration with three accounts."""
+    return MultiAccountConfig(
+        accounts=[make_account(1), make_account(2), make_account(3)],
+        sync_flows=[
+            SyncFlow(
+                name="Test Flow",
+                source_account_id=1,
+                source_calendar_id="source@example.com",
+                target_account_id=2,
+                target_calendar_id="target@example.com",
+                start_offset=-15,
+                end_offset=15
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def clients() -> Dict[str, MagicMock]:
+    """Mock clients keyed by refresh token."""
+    return {}
+
+
+@pytest.fixture
+def mock_client_class(clients: Dict[str, MagicMock]) -> Iterator[MagicMock]:
+    """Patch GoogleCalendarClient so each account gets its own mock client."""
+    def create_client(client_id: str, client_secret: str, refresh_token: str, **kwargs) -> MagicMock:
+        client = MagicMock()
+        client.test_connection.return_value = True
+        client.list_calendars.return_value = [{'id': f"calendar_{refresh_token}", 'summary': 'Primary'}]
+        clients[refresh_token] = client
+        return client
+
+    with patch(
+        'backend.services.google_calendar.account_manager.GoogleCalendarClient',
+        side_effect=create_client
+    ) as mock_class:
+        yield mock_class
+
+
+def test_test_all_accounts_reports_each_account(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that test_all_accounts returns one result per configured account."""
+    account_manager = AccountManager(config)
+    account_manager.get_client(2).test_connection.return_value = False
+
+    results = account_manager.test_all_accounts()
+
+    assert results == {1: True, 2: False, 3: True}
+
+
+def test_list_all_calendars_keeps_order_and_isolates_failures(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that a failing account gets an empty list without affecting the others."""
+    account_manager = AccountManager(config)
+    account_manager.get_client(2).list_calendars.side_effect = RuntimeError("boom")
+
+    all_calendars = account_manager.list_all_calendars()
+
+    assert list(all_calendars) == [1, 2, 3]
+    assert all_calendars[2] == []
+    assert all_calendars[1][0]['account_email'] == "user1@example.com"
+    assert all_calendars[3][0]['account_id'] == 3
+
+
+def test_get_client_does_not_call_api_unless_verified(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that get_client only tests the connection when verify=True."""
+    account_manager = AccountManager(config)
+
+    client = account_manager.get_client(1)
+    client.test_connection.assert_not_called()
+
+    verified_client = account_manager.get_client(2, verify=True)
+    verified_client.test_connection.assert_called_once()
+
+    assert account_manager.get_client(1) is client
+
+
+def test_reload_config_keeps_clients_with_unchanged_credentials(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that reload_config only evicts clients whose credentials changed."""
+    account_manager = AccountManager(config)
+    client_1 = account_manager.get_client(1)
+    client_2 = account_manager.get_client(2)
+
+    changed_account = make_account(2)
+    changed_account.refresh_token = "new_refresh_token"
+    account_manager.reload_config(
+        config.model_copy(update={'accounts': [make_account(1), changed_account, make_account(3)]})
+    )
+
+    assert account_manager.get_client(1) is client_1
+    assert account_manager.get_client(2) is not client_2
+
+
+def test_account_summary_is_cached_briefly(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that repeated summaries within the TTL reuse the first result."""
+    account_manager = AccountManager(config)
+
+    first = account_manager.get_account_summary()
+    calls_after_first = clients["refresh_token_1"].list_calendars.call_count
+    second = account_manager.get_account_summary()
+
+    assert second == first
+    assert clients["refresh_token_1"].list_calendars.call_count == calls_after_first
+
+    # Clearing an account's client also drops its cached summary
+    account_manager.clear_client_cache(1)
+    account_manager.get_account_summary()
+
+    assert clients["refresh_token_1"].list_calendars.called
+    assert clients["refresh_token_2"].list_calendars.call_count == 1
+
+
+def test_cached_account_summary_reports_current_client_state(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock
+) -> None:
+    """Test that a summary reused within the TTL still says whether the client is cached now."""
+    account_manager = AccountManager(config)
+
+    with patch.object(AccountManager, 'list_calendars_for_account', side_effect=AccountManagerError("offline")):
+        first = account_manager.get_account_summary()
+    account_manager.get_client(1)
+    second = account_manager.get_account_summary()
+
+    assert [summary['client_cached'] for summary in first] == [False, False, False]
+    assert [summary['client_cached'] for summary in second] == [True, False, False]
+    assert [summary['connection_ok'] for summary in second] == [False, False, False]
+
+
+def test_concurrent_get_client_creates_one_client(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    clients: Dict[str, MagicMock]
+) -> None:
+    """Test that racing get_client calls for one account share a single client."""
+    account_manager = AccountManager(config)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: account_manager.get_client(1), range(16)))
+
+    assert mock_client_class.call_count == 1
+    assert all(client is results[0] for client in results)
+
+
+def test_duplicate_account_ids_are_rejected(config: MultiAccountConfig) -> None:
+    """Test that duplicate account IDs fail validation."""
+    duplicate_config = MultiAccountConfig.model_construct(
+        accounts=[make_account(1), make_account(2), make_account(2)],
+        sync_flows=config.sync_flows
+    )
+
+    with pytest.raises(AccountManagerError, match="Duplicate account ID: 2"):
+        AccountManager(duplicate_config)
+
+
+def test_missing_credentials_are_rejected(config: MultiAccountConfig) -> None:
+    """Test that blank credentials fail validation."""
+    account = make_account(2)
+    account.client_secret = "   "
+    invalid_config = MultiAccountConfig.model_construct(
+        accounts=[make_account(1), account],
+        sync_flows=config.sync_flows
+    )
+
+    with pytest.raises(AccountManagerError, match="Account 2 missing client_secret"):
+        AccountManager(invalid_config)
+
+
+def test_token_cache_round_trips_through_disk(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    tmp_path
+) -> None:
+    """Test that access tokens saved by one manager are reused by the next one."""
+    token_cache_path = str(tmp_path / "tokens" / "gcal_tokens.json")
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0) + timedelta(minutes=30)
+
+    with patch.dict(client_module._TOKEN_CACHE, {("client_id_1", "refresh_token_1"): ("access_token_1", expiry)}, clear=True):
+        AccountManager(config, token_cache_path=token_cache_path)._save_token_cache()
+
+    assert os.stat(token_cache_path).st_mode & 0o777 == 0o600
+    with open(token_cache_path) as f:
+        assert "refresh_token_1" not in f.read()
+
+    with patch.dict(client_module._TOKEN_CACHE, {}, clear=True):
+        account_manager = AccountManager(config, token_cache_path=token_cache_path)
+        account_manager.get_client(1)
+        account_manager.get_client(2)
+
+    first_call, second_call = mock_client_class.call_args_list
+    assert first_call.kwargs['access_token'] == "access_token_1"
+    assert first_call.kwargs['token_expiry'] == expiry
+    assert second_call.kwargs['access_token'] is None
+
+
+@pytest.mark.parametrize("contents", ['[]', '{"1": []}', '{"1": {"expiry": 5}}', '"tokens"'])
+def test_malformed_token_cache_is_ignored(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    tmp_path,
+    contents: str
+) -> None:
+    """Test that a token cache holding valid JSON of the wrong shape doesn't break initialization."""
+    token_cache_path = tmp_path / "gcal_tokens.json"
+    token_cache_path.write_text(contents)
+
+    account_manager = AccountManager(config, token_cache_path=str(token_cache_path))
+
+    assert account_manager._persisted_tokens == {}
+
+
+def test_concurrent_token_cache_saves_leave_one_valid_file(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock,
+    tmp_path
+) -> None:
+    """Test that overlapping saves don't clash over a temp file, and managers can still be collected."""
+    token_cache_path = tmp_path / "gcal_tokens.json"
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=30)
+    account_manager = AccountManager(config, token_cache_path=str(token_cache_path))
+
+    with patch.dict(client_module._TOKEN_CACHE, {("client_id_1", "refresh_token_1"): ("access_token_1", expiry)}, clear=True):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(AccountManager._save_token_cache, [account_manager] * 50))
+
+    assert [path.name for path in tmp_path.iterdir()] == ["gcal_tokens.json"]
+    assert list(json.loads(token_cache_path.read_text())) == ["1"]
+
+    manager_ref = weakref.ref(account_manager)
+    del account_manager
+    gc.collect()
+    assert manager_ref() is None
+
+
+def test_list_calendars_for_account_adds_account_info(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock
+) -> None:
+    """Test that listed calendars carry their account, and unknown accounts are reported as such."""
+    account_manager = AccountManager(config)
+
+    assert account_manager.list_calendars_for_account(1) == [{
+        'id': "calendar_refresh_token_1", 'summary': 'Primary',
+        'account_id': 1, 'account_email': "user1@example.com"
+    }]
+    with pytest.raises(AccountManagerError, match="^Account 99 not found$"):
+        account_manager.list_calendars_for_account(99)
+
+
+def test_concurrent_get_client_failures_reach_every_caller(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock
+) -> None:
+    """Test that callers waiting on a failed client creation see the error too."""
+    account_manager = AccountManager(config)
+    mock_client_class.side_effect = RuntimeError("cannot build client")
+
+    def get_client_error(_: int) -> str:
+        try:
+            account_manager.get_client(1)
+        except AccountManagerError as e:
+            return str(e)
+        return ""
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(get_client_error, range(8)))
+
+    assert all("cannot build client" in error for error in errors)
+    assert account_manager._inflight == {}
+
+
+def test_client_cache_evicts_least_recently_used(
+    config: MultiAccountConfig,
+    mock_client_class: MagicMock
+) -> None:
+    """Test that the client cache keeps at most max_clients clients."""
+    account_manager = AccountManager(config, max_clients=2)
+    client_1 = account_manager.get_client(1)
+    client_2 = account_manager.get_client(2)
+
+    # Touch account 1 so account 2 becomes the least recently used
+    account_manager.get_client(1)
+    account_manager.get_client(3)
+
+    assert list(account_manager._clients) == [1, 3]
+    assert account_manager.get_client(1) is client_1
+    client_2.close.assert_called_once()
+    client_1.close.assert_not_called()
+
+
+def test_config_account_index_tracks_account_changes(config: MultiAccountConfig) -> None:
+    """Test that config account lookups see replaced, appended and in-place replaced accounts."""
+    assert config.get_account_by_id(3).email == "user3@example.com"
+
+    copied_config = config.model_copy(update={'accounts': [make_account(1), make_account(4)]})
+    assert copied_config.get_account_by_id(3) is None
+    assert copied_config.get_account_by_id(4).email == "user4@example.com"
+
+    config.accounts.append(make_account(5))
+    assert config.get_account_by_id(5).email == "user5@example.com"
+
+    config.accounts[0] = make_account(6)
+    assert config.get_account_by_id(1) is None
+    assert config.get_account_by_id(6).email == "user6@example.com"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""
+Test AsyncGoogleCalendarClient against a mocked HTTP transport.
+
+No real Google API calls are made: requests are answered by httpx.MockTransport
+and the client starts with a valid access token.
+"""
+# type: ignore
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from typing import Callable, List
+from unittest.mock import patch
+import httpx
+
+from backend.services.google_calendar import client as client_module
+from backend.services.google_calendar.async_client import AsyncGoogleCalendarClient
+from backend.services.google_calendar.client import GoogleCalendarError
+
+
+def make_client(handler: Callable[[httpx.Request], httpx.Response]) -> AsyncGoogleCalendarClient:
+    """Build a client with a fresh access token whose requests go to handler."""
+    return AsyncGoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        access_token="access_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=30)
+    )
+
+
+def test_get_events_for_many_calendars_concurrently() -> None:
+    """Test that gathered get_events calls follow pagination per calendar."""
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        calendar_id = request.url.path.split('/')[-2]
+        if 'pageToken' not in request.url.params:
+            return httpx.Response(200, json={
+                'items': [{'id': f"{calendar_id}_1", 'start': {'date': '2024-01-15'}, 'end': {'date': '2024-01-16'}}],
+                'nextPageToken': 'page_2'
+            })
+        return httpx.Response(200, json={
+            'items': [{'id': f"{calendar_id}_2", 'start': {'dateTime': '2024-01-15T10:00:00Z'},
+                       'end': {'dateTime': '2024-01-15T11:00:00Z'}}]
+        })
+
+    async def run() -> list:
+        client = make_client(handler)
+        results = await asyncio.gather(*[
+            client.get_events(calendar_id, datetime(2024, 1, 15), datetime(2024, 1, 20))
+            for calendar_id in ("cal_a", "cal_b")
+        ])
+        await client._http_client.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert [[event['id'] for event in events] for events in results] == [["cal_a_1", "cal_a_2"], ["cal_b_1", "cal_b_2"]]
+    assert results[1][1]['start_time'].hour == 10
+    assert all(request.headers['Authorization'] == "Bearer access_token" for request in requests)
+    assert requests[0].url.params['timeMin'] == "2024-01-15T00:00:00Z"
+
+
+def test_delete_event_maps_not_found_and_errors() -> None:
+    """Test that 404 means already deleted and other client errors raise."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        event_id = request.url.path.split('/')[-1]
+        return httpx.Response({'deleted': 204, 'missing': 404}.get(event_id, 403))
+
+    async def run() -> None:
+        client = make_client(handler)
+        assert await client.delete_event("calendar@example.com", "deleted") is True
+        assert await client.delete_event("calendar@example.com", "missing") is False
+        with pytest.raises(GoogleCalendarError):
+            await client.delete_event("calendar@example.com", "forbidden")
+        await client._http_client.aclose()
+
+    asyncio.run(run())
+
+
+def test_transient_errors_are_retried() -> None:
+    """Test that server errors are retried before the request succeeds."""
+    responses = [httpx.Response(503), httpx.Response(200, json={'items': [{'id': 'primary'}]})]
+
+    async def run() -> list:
+        client = make_client(lambda request: responses.pop(0))
+        calendars = await client.list_calendars()
+        await client._http_client.aclose()
+        return calendars
+
+    async def no_sleep(seconds: float) -> None:
+        pass
+
+    with patch.object(AsyncGoogleCalendarClient._request.retry, 'sleep', no_sleep):
+        calendars = asyncio.run(run())
+
+    assert calendars == [{'id': 'primary', 'summary': 'Unknown', 'access_role': 'unknown', 'primary': False}]
+    assert responses == []
+
+
+def test_expiring_token_is_refreshed_without_a_background_timer() -> None:
+    """Test that a token close to expiry is refreshed on demand, and no refresh timer is started."""
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={'items': []})
+
+    def fake_refresh(credentials, request) -> None:
+        credentials.token = "new_access_token"
+        credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    async def run() -> AsyncGoogleCalendarClient:
+        client = AsyncGoogleCalendarClient(
+            "client_id", "client_secret", "expiring_refresh_token",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            access_token="old_access_token",
+            token_expiry=datetime.utcnow() + timedelta(minutes=2)
+        )
+        await client.list_calendars()
+        await client.list_calendars()
+        await client._http_client.aclose()
+        return client
+
+    with patch.object(client_module.Credentials, 'refresh', autospec=True, side_effect=fake_refresh) as mock_refresh, \
+            patch.dict(client_module._TOKEN_CACHE, {}, clear=True):
+        client = asyncio.run(run())
+
+    assert mock_refresh.call_count == 1
+    assert [request.headers['Authorization'] for request in requests] == ["Bearer new_access_token"] * 2
+    assert client._token._refresh_timer is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
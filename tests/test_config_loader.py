@@ -0,0 +1,150 @@
+"""
+Test loading multi-account configuration from environment variables.
+
+Environment variables are set with monkeypatch, so the real environment
+of the test process is left untouched.
+"""
+# type: ignore
+
+import os
+import pytest
+from typing import Dict
+
+from backend.services.google_calendar.config_loader import (
+    ConfigurationError,
+    get_configuration_summary,
+    invalidate_config_cache,
+    load_google_accounts_from_env,
+    load_multi_account_config,
+    load_sync_flows_from_env,
+)
+
+
+def account_env(account_id: int) -> Dict[str, str]:
+    """Build the environment variables for one Google account."""
+    prefix = f"GOOGLE_ACCOUNT_{account_id}_"
+    return {
+        prefix + "EMAIL": f" user{account_id}@example.com ",
+        prefix + "CLIENT_ID": f"client_id_{account_id}",
+        prefix + "CLIENT_SECRET": f"client_secret_{account_id}",
+        prefix + "REFRESH_TOKEN": f"refresh_token_{account_id}",
+    }
+
+
+def flow_env(flow_id: int) -> Dict[str, str]:
+    """Build the environment variables for one sync flow."""
+    prefix = f"SYNC_FLOW_{flow_id}_"
+    return {
+        prefix + "NAME": f"Flow {flow_id}",
+        prefix + "SOURCE_ACCOUNT_ID": "1",
+        prefix + "SOURCE_CALENDAR_ID": f"source_{flow_id}@example.com",
+        prefix + "TARGET_ACCOUNT_ID": "2",
+        prefix + "TARGET_CALENDAR_ID": f"target_{flow_id}@example.com",
+        prefix + "START_OFFSET": " -15 ",
+        prefix + "END_OFFSET": "15",
+    }
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch) -> Dict[str, str]:
+    """Replace configuration environment variables with two accounts and two flows."""
+    for key in list(os.environ):
+        if key.startswith(("GOOGLE_ACCOUNT_", "SYNC_FLOW_", "SYNC_INTERVAL_MINUTES")):
+            monkeypatch.delenv(key)
+
+    variables = {**account_env(1), **account_env(2), **flow_env(1), **flow_env(2)}
+    for key, value in variables.items():
+        monkeypatch.setenv(key, value)
+    invalidate_config_cache()
+    return variables
+
+
+def test_load_accounts_and_flows(env: Dict[str, str]) -> None:
+    """Test that accounts and flows are loaded in order with stripped values."""
+    accounts = load_google_accounts_from_env()
+    flows = load_sync_flows_from_env()
+
+    assert [account.account_id for account in accounts] == [1, 2]
+    assert accounts[0].email == "user1@example.com"
+    assert [flow.name for flow in flows] == ["Flow 1", "Flow 2"]
+    assert flows[0].start_offset == -15
+    assert flows[1].target_account_id == 2
+
+
+def test_numbering_gap_ends_the_account_list(env: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that accounts after a gap in the numbering, or with zero-padded numbers, are ignored."""
+    for key, value in account_env(4).items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("GOOGLE_ACCOUNT_03_EMAIL", "padded@example.com")
+
+    accounts = load_google_accounts_from_env()
+
+    assert [account.account_id for account in accounts] == [1, 2]
+
+
+def test_missing_account_value_is_reported(env: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that blank account variables are named in the error."""
+    monkeypatch.setenv("GOOGLE_ACCOUNT_2_CLIENT_SECRET", "   ")
+
+    with pytest.raises(ConfigurationError, match="GOOGLE_ACCOUNT_2_CLIENT_SECRET"):
+        load_google_accounts_from_env()
+
+
+def test_invalid_flow_number_names_the_variable(env: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a non-numeric flow value is reported with its variable name."""
+    monkeypatch.setenv("SYNC_FLOW_2_END_OFFSET", "soon")
+
+    with pytest.raises(ConfigurationError, match="SYNC_FLOW_2_END_OFFSET='soon'"):
+        load_sync_flows_from_env()
+
+
+def test_multi_account_config_is_cached_until_env_changes(
+    env: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the parsed configuration is reused until a configuration variable changes."""
+    config = load_multi_account_config()
+    assert load_multi_account_config().accounts is config.accounts
+    assert isinstance(config.accounts, tuple) and isinstance(config.sync_flows, tuple)
+
+    monkeypatch.setenv("SYNC_INTERVAL_MINUTES", "30")
+    reloaded = load_multi_account_config()
+    assert reloaded.accounts is not config.accounts
+    assert reloaded.sync_interval_minutes == 30
+
+    invalidate_config_cache()
+    assert load_multi_account_config().accounts is not reloaded.accounts
+
+
+def test_changing_a_loaded_config_does_not_change_the_cache(env: Dict[str, str]) -> None:
+    """Test that each caller gets its own configuration, e.g. for a scheduler changing its interval."""
+    config = load_multi_account_config()
+    config.sync_interval_minutes = 5
+
+    assert load_multi_account_config().sync_interval_minutes == 60
+
+
+def test_configuration_summary(env: Dict[str, str]) -> None:
+    """Test that the summary lists every account and flow and validates them."""
+    summary = get_configuration_summary()
+
+    assert [account["account_id"] for account in summary["accounts"]] == [1, 2]
+    assert summary["sync_flows"][1]["source_calendar_id"] == "source_2@example.com"
+    assert summary["polling_settings"] == {"sync_interval_minutes": "60"}
+    assert summary["validation_status"] == "valid"
+
+
+def test_configuration_summary_of_invalid_config(env: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an invalid configuration is still summarized, with the reason it is invalid."""
+    monkeypatch.setenv("SYNC_FLOW_2_TARGET_ACCOUNT_ID", "7")
+
+    summary = get_configuration_summary()
+
+    assert len(summary["accounts"]) == 2
+    assert summary["sync_flows"][1]["target_account_id"] == "7"
+    assert summary["validation_status"].startswith("invalid: Environment validation failed:")
+    assert "7" in summary["validation_status"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
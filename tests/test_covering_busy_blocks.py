@@ -12,7 +12,7 @@ from unittest.mock import MagicMock
 from typing import Tuple
 
 from backend.models.google_account import GoogleAccount
-from backend.models.calendar import CalendarEvent, SyncFlow, MultiAccountConfig
+from backend.models.calendar import BusyBlock, CalendarEvent, SyncFlow, MultiAccountConfig
 from backend.services.google_calendar.sync_engine import CalendarSyncEngine
 from backend.services.google_calendar.account_manager import AccountManager
 
@@ -317,5 +317,22 @@ def test_different_title_events_do_not_prevent_creation(
     mock_client.create_event.assert_called_once()  # type: ignore
 
 
+def test_busy_block_key_matches_busy_block(
+    config: MultiAccountConfig,
+    test_event: CalendarEvent
+) -> None:
+    """Test that the lightweight busy block key matches the full BusyBlock timing."""
+    flow = config.sync_flows[0]
+    
+    key = flow.busy_block_key(test_event)
+    busy_block = BusyBlock.from_event_and_flow(test_event, flow)
+    
+    assert key.target_account_id == busy_block.target_account_id
+    assert key.target_calendar_id == busy_block.target_calendar_id
+    assert key.start_time == busy_block.start_time
+    assert key.end_time == busy_block.end_time
+    assert key.title == busy_block.title
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"]) 
\ No newline at end of file
@@ -0,0 +1,486 @@
+"""
+Test GoogleCalendarClient internals that do not need the Google API.
+
+This module tests credential handling and batch request handling with the
+token endpoint and the Calendar service mocked out.
+"""
+# type: ignore
+
+import json
+import pytest
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock, patch
+import httplib2
+from googleapiclient.errors import HttpError
+
+from backend.services.google_calendar import client as client_module
+from backend.services.google_calendar.client import GoogleCalendarClient, GoogleCalendarError
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache() -> Iterator[None]:
+    """Start every test with an empty process-wide token cache."""
+    client_module._TOKEN_CACHE.clear()
+    yield
+    client_module._TOKEN_CACHE.clear()
+
+
+def fake_refresh(credentials, request) -> None:
+    """Stand-in for Credentials.refresh that issues a one hour token."""
+    credentials.token = "access_token"
+    credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+
+def test_recreated_client_reuses_cached_access_token() -> None:
+    """Test that a new client for the same credentials does not refresh again."""
+    with patch.object(client_module.Credentials, 'refresh', autospec=True, side_effect=fake_refresh) as mock_refresh:
+        first = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+        first._get_credentials()
+
+        second = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+        credentials = second._get_credentials()
+
+    assert mock_refresh.call_count == 1
+    assert credentials.token == "access_token"
+
+
+def test_token_cache_is_keyed_by_credentials() -> None:
+    """Test that clients with different refresh tokens do not share access tokens."""
+    with patch.object(client_module.Credentials, 'refresh', autospec=True, side_effect=fake_refresh) as mock_refresh:
+        GoogleCalendarClient("client_id", "client_secret", "refresh_token_1")._get_credentials()
+        GoogleCalendarClient("client_id", "client_secret", "refresh_token_2")._get_credentials()
+
+    assert mock_refresh.call_count == 2
+
+
+def test_token_is_refreshed_before_it_expires() -> None:
+    """Test that a token close to expiry is refreshed proactively, and only once."""
+    client = GoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        access_token="old_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=2)
+    )
+
+    with patch.object(client_module.Credentials, 'refresh', autospec=True, side_effect=fake_refresh) as mock_refresh:
+        credentials = client._get_credentials()
+        client._get_credentials()
+
+    assert mock_refresh.call_count == 1
+    assert credentials.token == "access_token"
+
+
+def test_valid_token_is_not_refreshed() -> None:
+    """Test that a token far from expiry is used as is."""
+    client = GoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        access_token="current_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=30)
+    )
+
+    with patch.object(client_module.Credentials, 'refresh', autospec=True) as mock_refresh:
+        credentials = client._get_credentials()
+
+    mock_refresh.assert_not_called()
+    assert credentials.token == "current_token"
+
+
+def test_token_is_refreshed_in_the_background() -> None:
+    """Test that the refresh timer renews the token without a foreground call."""
+    client = GoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        access_token="current_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=30)
+    )
+
+    with patch.object(client_module.Credentials, 'refresh', autospec=True, side_effect=fake_refresh) as mock_refresh:
+        client._get_credentials()
+        first_timer = client._token._refresh_timer
+        assert first_timer is not None and first_timer.is_alive()
+
+        # Run the timer callback directly instead of waiting for it
+        client_module._background_refresh(weakref.ref(client._token))
+        assert mock_refresh.call_count == 1
+        assert client._get_credentials().token == "access_token"
+        assert first_timer.finished.is_set()
+
+        # A closed client stops refreshing in the background
+        client.close()
+        client_module._background_refresh(weakref.ref(client._token))
+        assert mock_refresh.call_count == 1
+        assert client._token._refresh_timer is None
+
+
+def test_service_is_reused_per_thread() -> None:
+    """Test that each thread builds one service and reuses it across calls."""
+    client = GoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        access_token="current_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=30)
+    )
+
+    with patch.object(client_module, 'build_from_document', side_effect=lambda *args, **kwargs: object()) as mock_build:
+        main_service = client._get_service()
+        assert client._get_service() is main_service
+
+        other_services = []
+        thread = threading.Thread(target=lambda: other_services.append(client._get_service()))
+        thread.start()
+        thread.join()
+
+    assert other_services[0] is not main_service
+    assert mock_build.call_count == 2
+
+
+def test_services_share_one_loaded_discovery_document() -> None:
+    """Test that services for different clients are built from one cached document, without sharing its parse."""
+    clients = [
+        GoogleCalendarClient(
+            "client_id", "client_secret", f"refresh_token_{i}",
+            access_token="current_token",
+            token_expiry=datetime.utcnow() + timedelta(minutes=30)
+        )
+        for i in range(2)
+    ]
+
+    with patch.object(client_module, 'get_static_doc', wraps=client_module.get_static_doc) as mock_get_static_doc:
+        client_module._calendar_discovery_document.cache_clear()
+        services = [client._get_service() for client in clients]
+
+    assert mock_get_static_doc.call_count == 1
+    assert isinstance(client_module._calendar_discovery_document(), str)
+    assert services[0] is not services[1]
+    assert services[0]._resourceDesc is not services[1]._resourceDesc
+    assert services[0].events().list(calendarId="primary").uri.startswith("https://www.googleapis.com/calendar/v3/")
+
+
+def test_orjson_response_model_matches_stock_decoding() -> None:
+    """Test that the orjson response model decodes bodies like googleapiclient's JsonModel."""
+    pytest.importorskip("orjson")
+    model = client_module._OrjsonModel()
+
+    assert model.deserialize(b'{"items": [{"id": "event_1"}], "nextPageToken": null}') == {
+        'items': [{'id': 'event_1'}], 'nextPageToken': None
+    }
+    assert model.deserialize(b'not json') == 'not json'
+    assert client_module._RESPONSE_MODEL is not None
+
+
+def test_service_build_never_fetches_discovery_document() -> None:
+    """Test that the fallback service build uses the bundled discovery document only."""
+    client = GoogleCalendarClient(
+        "client_id", "client_secret", "refresh_token",
+        access_token="current_token",
+        token_expiry=datetime.utcnow() + timedelta(minutes=30)
+    )
+
+    with patch.object(client_module, '_calendar_discovery_document', return_value=None), \
+            patch.object(client_module, 'build') as mock_build:
+        client._get_service()
+
+    assert mock_build.call_args.kwargs['static_discovery'] is True
+    assert mock_build.call_args.kwargs['cache_discovery'] is False
+
+
+def test_query_times_are_formatted_as_utc() -> None:
+    """Test RFC3339 formatting of naive (UTC) and timezone-aware datetimes."""
+    assert client_module._to_rfc3339_utc(datetime(2024, 1, 15, 9, 30, 15, 500)) == "2024-01-15T09:30:15Z"
+    assert client_module._to_rfc3339_utc(
+        datetime(2024, 1, 15, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    ) == "2024-01-15T09:30:00Z"
+
+
+def test_comparison_times_are_utc_epoch_minutes() -> None:
+    """Test minute truncation and UTC conversion used for busy block matching."""
+    expected = int(datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc).timestamp()) // 60
+    assert client_module._to_epoch_minute(datetime(2024, 1, 15, 9, 30, 59)) == expected
+    assert client_module._to_epoch_minute(
+        datetime(2024, 1, 15, 4, 30, 5, tzinfo=timezone(timedelta(hours=-5)))
+    ) == expected
+
+
+def test_parse_event_handles_timed_and_all_day_events() -> None:
+    """Test parsing of 'Z' and offset datetimes, all-day dates and missing fields."""
+    timed = client_module._parse_event({
+        'id': 'timed',
+        'summary': 'Meeting',
+        'start': {'dateTime': '2024-01-15T10:00:00Z'},
+        'end': {'dateTime': '2024-01-15T13:00:00+02:00'},
+        'attendees': [{'email': 'a@example.com'}, {}],
+        'organizer': {'email': 'o@example.com'}
+    })
+    assert timed['start_time'] == datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    assert timed['end_time'] == datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc)
+    assert timed['all_day'] is False
+    assert timed['participants'] == ['a@example.com', '']
+    assert timed['participant_count'] == 2
+    assert timed['organizer'] == 'o@example.com'
+    assert timed['creator'] == ''
+    assert timed['status'] == 'unknown'
+    assert timed['transparency'] == 'opaque'
+
+    all_day = client_module._parse_event({'id': 'all_day', 'start': {'date': '2024-01-15'}, 'end': {'date': '2024-01-16'}})
+    assert all_day['start_time'] == datetime(2024, 1, 15)
+    assert all_day['all_day'] is True
+    assert all_day['participants'] == []
+
+
+def test_find_events_queries_a_narrow_window() -> None:
+    """Test that exact-match lookups fetch only events around the requested times."""
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    start_time = datetime(2024, 1, 15, 9, 45)
+    end_time = datetime(2024, 1, 15, 11, 15)
+    matching = {'id': 'busy', 'title': 'busy', 'start_time': start_time, 'end_time': end_time}
+    other = {'id': 'other', 'title': 'Busy', 'start_time': start_time, 'end_time': datetime(2024, 1, 15, 12, 0)}
+
+    with patch.object(client, 'get_events', return_value=[matching, other]) as mock_get_events:
+        result = client.find_events_by_time_and_title("calendar", start_time, end_time, "Busy")
+
+    assert result == [matching]
+    mock_get_events.assert_called_once_with(
+        "calendar",
+        start_time - timedelta(minutes=1),
+        end_time + timedelta(minutes=1),
+        fields=client_module.FIND_EVENTS_FIELDS
+    )
+
+
+def test_find_events_sees_changes_made_outside_the_client() -> None:
+    """Test that lookups are not cached, so a busy block deleted elsewhere is not reported as existing."""
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    start_time = datetime(2024, 1, 15, 9, 45)
+    end_time = datetime(2024, 1, 15, 11, 15)
+    busy_block = {'id': 'busy', 'title': 'Busy', 'start_time': start_time, 'end_time': end_time}
+
+    with patch.object(client, 'get_events', side_effect=[[busy_block], []]) as mock_get_events:
+        assert client.find_events_by_time_and_title("calendar", start_time, end_time, "Busy") == [busy_block]
+        assert client.find_events_by_time_and_title("calendar", start_time, end_time, "Busy") == []
+
+    assert mock_get_events.call_count == 2
+
+
+def test_get_events_follows_pagination_with_field_mask() -> None:
+    """Test that get_events fetches every page and requests only parsed fields."""
+    pages = {
+        None: {'items': [{'id': 'event_1', 'start': {'date': '2024-01-15'}, 'end': {'date': '2024-01-16'}}],
+               'nextPageToken': 'page_2'},
+        'page_2': {'items': [{'id': 'event_2', 'start': {'date': '2024-01-16'}, 'end': {'date': '2024-01-17'}}]},
+    }
+    service = MagicMock()
+    service.events.return_value.list.side_effect = lambda **kwargs: MagicMock(
+        execute=MagicMock(return_value=pages[kwargs['pageToken']])
+    )
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    client._get_service = lambda: service
+
+    events = client.get_events("calendar", datetime(2024, 1, 15), datetime(2024, 1, 20))
+
+    assert [event['id'] for event in events] == ['event_1', 'event_2']
+    for call in service.events.return_value.list.call_args_list:
+        assert call.kwargs['fields'] == client_module.EVENT_LIST_FIELDS
+
+
+def test_incremental_sync_uses_stored_token_and_recovers_from_expiry() -> None:
+    """Test full listing, incremental follow-up and full re-listing after 410 Gone."""
+    responses = [
+        {'items': [{'id': 'event_1', 'start': {'date': '2024-01-15'}, 'end': {'date': '2024-01-16'}}],
+         'nextSyncToken': 'token_1'},
+        {'items': [{'id': 'event_1', 'status': 'cancelled'}], 'nextSyncToken': 'token_2'},
+        HttpError(httplib2.Response({'status': 410}), b'gone'),
+        {'items': [], 'nextSyncToken': 'token_3'},
+    ]
+
+    def execute() -> Dict[str, Any]:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    service = MagicMock()
+    service.events.return_value.list.return_value.execute.side_effect = execute
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    client._get_service = lambda: service
+
+    events, cancelled, sync_token, listed_all = client.get_events_incremental("calendar", datetime(2024, 1, 1))
+    assert [event['id'] for event in events] == ['event_1']
+    assert (cancelled, sync_token, listed_all) == ([], 'token_1', True)
+
+    events, cancelled, sync_token, listed_all = client.get_events_incremental("calendar")
+    assert (events, cancelled, sync_token, listed_all) == ([], ['event_1'], 'token_2', False)
+
+    # The expired token falls back to a full listing, and says so
+    assert client.get_events_incremental("calendar") == ([], [], 'token_3', True)
+
+    list_calls = [call.kwargs for call in service.events.return_value.list.call_args_list]
+    assert list_calls[0]['timeMin'] == "2024-01-01T00:00:00Z" and 'syncToken' not in list_calls[0]
+    assert list_calls[1]['syncToken'] == 'token_1' and 'timeMin' not in list_calls[1]
+    assert list_calls[2]['syncToken'] == 'token_2'
+    assert 'syncToken' not in list_calls[3]
+
+
+def test_api_errors_are_wrapped_with_their_cause() -> None:
+    """Test that client methods raise GoogleCalendarError chained to the original error."""
+    forbidden = HttpError(httplib2.Response({'status': 403}), b'forbidden')
+    service = MagicMock()
+    service.events.return_value.delete.return_value.execute.side_effect = forbidden
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    client._get_service = lambda: service
+
+    with pytest.raises(GoogleCalendarError, match="Failed to delete event") as exc_info:
+        client.delete_event("calendar", "event_1")
+    assert exc_info.value.__cause__ is forbidden
+
+    service.events.return_value.delete.return_value.execute.side_effect = HttpError(
+        httplib2.Response({'status': 404}), b'not found'
+    )
+    assert client.delete_event("calendar", "event_1") is False
+
+    # Errors that already are GoogleCalendarError pass through unchanged
+    auth_error = GoogleCalendarError("Authentication failed: invalid_grant")
+    client._get_service = MagicMock(side_effect=auth_error)
+    with pytest.raises(GoogleCalendarError) as exc_info:
+        client.list_calendars()
+    assert exc_info.value is auth_error
+
+
+def test_transient_errors_are_retried() -> None:
+    """Test that server errors are retried while client errors fail immediately."""
+    server_error = HttpError(httplib2.Response({'status': 503}), b'unavailable')
+    not_found = HttpError(httplib2.Response({'status': 404}), b'not found')
+
+    request = MagicMock()
+    request.execute.side_effect = [server_error, {'id': 'ok'}]
+    with patch.object(client_module._execute_request.retry, 'sleep', lambda seconds: None):
+        assert client_module._execute_request(request) == {'id': 'ok'}
+    assert request.execute.call_count == 2
+
+    request = MagicMock()
+    request.execute.side_effect = not_found
+    with pytest.raises(HttpError):
+        client_module._execute_request(request)
+    assert request.execute.call_count == 1
+
+
+def test_only_rate_limit_forbidden_errors_are_retried() -> None:
+    """Test that 403 is retried for rate limiting but not for missing permissions."""
+    def forbidden(reason: str) -> HttpError:
+        content = json.dumps({'error': {'code': 403, 'errors': [{'reason': reason}]}}).encode()
+        return HttpError(httplib2.Response({'status': 403}), content)
+
+    assert client_module._is_transient_error(forbidden('rateLimitExceeded'))
+    assert client_module._is_transient_error(forbidden('userRateLimitExceeded'))
+    assert not client_module._is_transient_error(forbidden('forbidden'))
+    assert client_module._is_transient_error(HttpError(httplib2.Response({'status': 429}), b''))
+    assert not client_module._is_transient_error(HttpError(httplib2.Response({'status': 410}), b'gone'))
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each request from a lookup table."""
+
+    def __init__(self, callback, outcomes: Dict[str, Any], batches: List["FakeBatch"]) -> None:
+        self.callback = callback
+        self.outcomes = outcomes
+        self.requests: List[Any] = []
+        batches.append(self)
+
+    def add(self, request, request_id=None) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self.requests:
+            outcome = self.outcomes[request]
+            if isinstance(outcome, Exception):
+                self.callback(request_id, None, outcome)
+            else:
+                self.callback(request_id, outcome, None)
+
+
+def make_batch_client(outcomes: Dict[str, Any], batches: List[FakeBatch]) -> GoogleCalendarClient:
+    """Build a client whose service executes batches through FakeBatch."""
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback, outcomes, batches)
+    service.events.return_value.delete.side_effect = lambda calendarId, eventId: eventId
+    service.channels.return_value.stop.side_effect = lambda body: body['id']
+    service.events.return_value.watch.side_effect = lambda calendarId, body: body['id']
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    client._get_service = lambda: service
+    return client
+
+
+def test_batch_delete_events_reports_each_result() -> None:
+    """Test that batch deletes map success, 404 and other errors per event."""
+    outcomes = {
+        'deleted': {},
+        'missing': HttpError(httplib2.Response({'status': 404}), b'not found'),
+        'forbidden': HttpError(httplib2.Response({'status': 403}), b'forbidden'),
+    }
+    client = make_batch_client(outcomes, [])
+
+    results = client.batch_delete_events([
+        ('calendar', 'deleted'), ('calendar', 'missing'), ('calendar', 'forbidden')
+    ])
+
+    assert results[0] is True
+    assert results[1] is False
+    assert isinstance(results[2], GoogleCalendarError)
+
+
+def test_batches_are_split_at_the_api_limit() -> None:
+    """Test that more than 50 requests are sent as several batches, preserving order."""
+    event_ids = [f"event_{i}" for i in range(120)]
+    batches: List[FakeBatch] = []
+    client = make_batch_client({event_id: {} for event_id in event_ids}, batches)
+
+    results = client.batch_delete_events([('calendar', event_id) for event_id in event_ids])
+
+    assert [len(batch.requests) for batch in batches] == [50, 50, 20]
+    assert results == [True] * 120
+
+
+def test_push_notification_channels_are_batched() -> None:
+    """Test batch channel creation and stopping, including per-channel failures."""
+    outcomes = {
+        'channel_1': {'id': 'channel_1', 'resourceId': 'resource_1', 'expiration': '1700000000000'},
+        'channel_2': HttpError(httplib2.Response({'status': 400}), b'bad request'),
+        'expired': HttpError(httplib2.Response({'status': 404}), b'not found'),
+    }
+    batches: List[FakeBatch] = []
+    client = make_batch_client(outcomes, batches)
+
+    created = client.batch_create_push_notification_channels([
+        {'calendar_id': 'calendar_1', 'webhook_url': 'https://example.com/hook', 'channel_id': 'channel_1'},
+        {'calendar_id': 'calendar_2', 'webhook_url': 'https://example.com/hook', 'channel_id': 'channel_2'},
+    ])
+    stopped = client.batch_stop_push_notification_channels([('channel_1', 'resource_1'), ('expired', 'resource_2')])
+
+    assert created[0]['resource_id'] == 'resource_1'
+    assert created[0]['calendar_id'] == 'calendar_1'
+    assert isinstance(created[1], GoogleCalendarError)
+    assert stopped == [True, False]
+    assert len(batches) == 2
+
+
+def test_batch_get_events_keeps_paginated_failures_per_range() -> None:
+    """Test that a failing page fetch for one long range does not fail the whole batch."""
+    client = GoogleCalendarClient("client_id", "client_secret", "refresh_token")
+    client._get_service = MagicMock()
+    client._execute_batch = lambda batch_requests: [
+        ({'items': [{'id': 'event_1', 'start': {'date': '2024-01-15'}, 'end': {'date': '2024-01-16'}}]}, None),
+        ({'items': [], 'nextPageToken': 'page_2'}, None),
+    ]
+    page_error = GoogleCalendarError("Failed to get events: unavailable")
+    client.get_events = MagicMock(side_effect=page_error)
+    start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    end = start + timedelta(days=30)
+
+    results = client.batch_get_events([('calendar_1', start, end), ('calendar_2', start, end)])
+
+    assert [event['id'] for event in results[0]] == ['event_1']
+    assert results[1] is page_error
+    client.get_events.assert_called_once_with('calendar_2', start, end)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+"""
+Test CalendarPollingScheduler run bookkeeping.
+
+The sync engine and account manager are mocked, so no real Google API
+calls are made.
+"""
+# type: ignore
+
+import asyncio
+import pytest
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from backend.models.google_account import GoogleAccount
+from backend.models.calendar import SyncFlow, MultiAccountConfig
+from backend.services.google_calendar.polling_scheduler import JOB_HISTORY_SIZE, CalendarPollingScheduler
+
+
+@pytest.fixture
+def config() -> MultiAccountConfig:
+    """Test configuration."""
+    return MultiAccountConfig(
+        accounts=[
+            GoogleAccount(
+                account_id=1,
+                email="test@example.com",
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+                refresh_token="test_refresh_token"
+            )
+        ],
+        sync_flows=[
+            SyncFlow(
+                name="Test Flow",
+                source_account_id=1,
+                source_calendar_id="source@example.com",
+                target_account_id=1,
+                target_calendar_id="target@example.com",
+                start_offset=-15,
+                end_offset=15
+            )
+        ],
+        sync_interval_minutes=15
+    )
+
+
+@pytest.fixture
+def scheduler(config: MultiAccountConfig) -> CalendarPollingScheduler:
+    """Scheduler with a mocked sync engine."""
+    return CalendarPollingScheduler(config, MagicMock(), MagicMock())
+
+
+def test_periodic_sync_updates_stats(scheduler: CalendarPollingScheduler) -> None:
+    """Test that successful and failed runs are counted and reported."""
+    asyncio.run(scheduler._run_periodic_sync())
+    scheduler.sync_engine.sync_all_source_calendars.side_effect = RuntimeError("boom")
+    asyncio.run(scheduler._run_periodic_sync())
+
+    stats = scheduler.get_schedule_info().stats
+    assert stats.total_runs == 2
+    assert stats.successful_runs == 1
+    assert stats.failed_runs == 1
+    assert stats.last_run_success is False
+    assert stats.last_run_error == "boom"
+    assert scheduler.stats['total_runs'] == 2
+    assert scheduler.stats['last_run_error'] == "boom"
+
+    history = scheduler.get_job_history()
+    assert [entry.success for entry in history] == [True, False]
+    assert history[-1].error == "boom"
+
+    scheduler.reset_stats()
+    assert scheduler.get_schedule_info().stats.total_runs == 0
+    assert scheduler.stats['total_runs'] == 0
+    assert scheduler.get_job_history() == []
+
+
+def test_periodic_sync_runs_off_the_event_loop_thread(scheduler: CalendarPollingScheduler) -> None:
+    """Test that the blocking sync runs in a worker thread, not on the event loop."""
+    sync_threads = []
+    scheduler.sync_engine.sync_all_source_calendars.side_effect = (
+        lambda **kwargs: sync_threads.append(threading.current_thread()) or MagicMock()
+    )
+
+    asyncio.run(scheduler._run_periodic_sync())
+
+    assert sync_threads and sync_threads[0] is not threading.main_thread()
+    assert scheduler.sync_engine.sync_all_source_calendars.call_args.kwargs['incremental'] is True
+    assert scheduler.get_schedule_info().stats.successful_runs == 1
+
+
+def test_job_history_is_bounded(scheduler: CalendarPollingScheduler) -> None:
+    """Test that only the most recent runs are kept in the job history."""
+    for _ in range(JOB_HISTORY_SIZE + 5):
+        asyncio.run(scheduler._run_periodic_sync())
+
+    assert len(scheduler.get_job_history()) == JOB_HISTORY_SIZE
+    assert scheduler.get_schedule_info().stats.total_runs == JOB_HISTORY_SIZE + 5
+
+
+def test_failed_manual_sync_returns_empty_result(scheduler: CalendarPollingScheduler) -> None:
+    """Test that a failed manual sync reports its date range with no results."""
+    scheduler.sync_engine.sync_all_source_calendars.side_effect = RuntimeError("boom")
+
+    result = scheduler.run_manual_sync(days_back=1, days_forward=3)
+
+    assert result.sync_type == "manual"
+    assert result.calendars_synced == 0
+    assert result.calendar_results == []
+    assert result.sync_duration_seconds is not None
+    start_date = datetime.fromisoformat(result.start_date)
+    end_date = datetime.fromisoformat(result.end_date)
+    assert end_date - start_date == timedelta(days=4)
+    assert result.sync_start_time == (start_date + timedelta(days=1)).isoformat()
+
+
+def test_periodic_sync_skips_while_previous_run_is_in_flight(scheduler: CalendarPollingScheduler) -> None:
+    """Test that an overlapping run returns without syncing or counting a run."""
+    async def run_while_locked() -> None:
+        async with scheduler._run_lock:
+            await scheduler._run_periodic_sync()
+
+    asyncio.run(run_while_locked())
+
+    scheduler.sync_engine.sync_all_source_calendars.assert_not_called()
+    assert scheduler.get_schedule_info().stats.total_runs == 0
+
+
+def test_next_run_time_reports_periodic_job(scheduler: CalendarPollingScheduler) -> None:
+    """Test that a running scheduler reports when the periodic job runs next."""
+    async def start_and_stop() -> None:
+        scheduler.start()
+        try:
+            next_run = scheduler.get_next_run_time()
+            assert next_run is not None
+            assert next_run.minute % 15 == 0 and next_run.second == 0
+            assert scheduler.get_schedule_info().next_run_time == next_run.isoformat()
+        finally:
+            scheduler.stop()
+
+    asyncio.run(start_and_stop())
+
+    assert scheduler.get_next_run_time() is None
+
+
+def test_update_schedule_reschedules_running_job(scheduler: CalendarPollingScheduler) -> None:
+    """Test that changing the interval keeps the scheduler and its job, with a new trigger."""
+    async def start_update_and_stop() -> None:
+        scheduler.start()
+        try:
+            apscheduler = scheduler.scheduler
+            old_trigger = scheduler._periodic_trigger()
+            scheduler.update_schedule(7)
+            assert scheduler._periodic_trigger() is not old_trigger
+            assert scheduler.scheduler is apscheduler
+            assert len(apscheduler.get_jobs()) == 1
+            assert scheduler.get_next_run_time().minute % 7 == 0
+        finally:
+            scheduler.stop()
+
+    asyncio.run(start_update_and_stop())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
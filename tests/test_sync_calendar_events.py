@@ -0,0 +1,563 @@
+"""
+Test bulk calendar sync logic.
+
+This module tests how sync_calendar_events turns a page of parsed API events
+into CalendarEvent models and pushes them through the sync flows.
+"""
+# type: ignore
+
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from typing import Any, Dict, Tuple
+
+from backend.models.google_account import GoogleAccount
+from backend.models.calendar import SyncFlow, MultiAccountConfig
+from backend.services.google_calendar.client import FIND_EVENTS_FIELDS, GoogleCalendarError
+from backend.services.google_calendar.sync_engine import CalendarSyncEngine
+from backend.services.google_calendar.account_manager import AccountManager, AccountManagerError
+
+
+@pytest.fixture
+def mock_account_manager() -> Tuple[MagicMock, MagicMock]:
+    """Mock account manager for testing."""
+    account_manager = MagicMock(spec=AccountManager)
+    mock_client = MagicMock()
+    mock_client.find_events_by_time_and_title.return_value = []
+    mock_client.get_events.return_value = []
+    mock_client.batch_create_events.side_effect = lambda calendar_id, events: [
+        {'id': f"created_{index}", **event} for index, event in enumerate(events)
+    ]
+    account_manager.get_client.return_value = mock_client
+    return account_manager, mock_client
+
+
+@pytest.fixture
+def config() -> MultiAccountConfig:
+    """Test configuration."""
+    return MultiAccountConfig(
+        accounts=[
+            GoogleAccount(
+                account_id=1,
+                email="test@example.com",
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+                refresh_token="test_refresh_token"
+            )
+        ],
+        sync_flows=[
+            SyncFlow(
+                name="Test Flow",
+                source_account_id=1,
+                source_calendar_id="source@example.com",
+                target_account_id=1,
+                target_calendar_id="target@example.com",
+                start_offset=-15,
+                end_offset=15
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def sync_engine(config: MultiAccountConfig, mock_account_manager: Tuple[MagicMock, MagicMock]) -> CalendarSyncEngine:
+    """Test sync engine."""
+    account_manager, _ = mock_account_manager
+    return CalendarSyncEngine(config, account_manager)
+
+
+def make_event_data(event_id: str, hour: int, **overrides: Any) -> Dict[str, Any]:
+    """Build a parsed event dict as returned by GoogleCalendarClient.get_events."""
+    event_data: Dict[str, Any] = {
+        'id': event_id,
+        'title': f"Meeting {event_id}",
+        'description': '',
+        'start_time': datetime(2024, 1, 15, hour, 0),
+        'end_time': datetime(2024, 1, 15, hour + 1, 0),
+        'all_day': False,
+        'participants': ['a@example.com', 'b@example.com'],
+        'participant_count': 2,
+        'status': 'confirmed',
+        'creator': '',
+        'organizer': '',
+        'transparency': 'opaque'
+    }
+    event_data.update(overrides)
+    return event_data
+
+
+def test_sync_calendar_events_processes_all_events(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that every valid event in the page is processed."""
+    _, mock_client = mock_account_manager
+    source_events = [make_event_data('event_1', 10), make_event_data('event_2', 13)]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else []
+    )
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    assert result.error is None
+    assert result.events_found == 2
+    assert result.events_processed == 2
+    assert [r.action for r in result.results] == ['created', 'created']
+
+
+def test_invalid_event_does_not_fail_whole_page(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that one invalid event is reported without dropping the rest of the page."""
+    _, mock_client = mock_account_manager
+    invalid_event = make_event_data('broken', 12)
+    del invalid_event['start_time']
+    source_events = [make_event_data('event_1', 10), invalid_event]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else []
+    )
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    assert result.events_found == 2
+    assert result.events_processed == 1
+    assert result.results[0].action == 'created'
+    assert result.results[1].action == 'error'
+    assert result.results[1].event_id == 'broken'
+
+
+def test_flow_lookup_follows_config_changes(sync_engine: CalendarSyncEngine, config: MultiAccountConfig) -> None:
+    """Test that applicable flows are found by source calendar, including flows added later."""
+    event = sync_engine._build_calendar_events([make_event_data('event_1', 10)], "source@example.com", 1)[0]
+    other_event = sync_engine._build_calendar_events([make_event_data('event_2', 10)], "other@example.com", 1)[0]
+
+    assert [flow.name for flow in sync_engine._find_applicable_flows(event)] == ["Test Flow"]
+    assert sync_engine._find_applicable_flows(other_event) == []
+
+    config.sync_flows.append(config.sync_flows[0].model_copy(update={'name': "Second Flow"}))
+
+    assert [flow.name for flow in sync_engine._find_applicable_flows(event)] == ["Test Flow", "Second Flow"]
+
+
+def test_bulk_sync_checks_busy_blocks_against_one_target_fetch(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that existing busy blocks are found in a single prefetch of the target calendar."""
+    _, mock_client = mock_account_manager
+    source_events = [make_event_data('event_1', 10), make_event_data('event_2', 13)]
+    existing_block = make_event_data(
+        'block_1', 9,
+        title="busy",
+        start_time=datetime(2024, 1, 15, 9, 45),
+        end_time=datetime(2024, 1, 15, 11, 15)
+    )
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else [existing_block]
+    )
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    assert [r.action for r in result.results] == ['existed', 'created']
+    target_calls = [
+        call for call in mock_client.get_events.call_args_list
+        if call.kwargs.get('calendar_id') == "target@example.com"
+    ]
+    assert len(target_calls) == 1
+    assert target_calls[0].kwargs['fields'] == FIND_EVENTS_FIELDS
+    mock_client.find_events_by_time_and_title.assert_not_called()
+    assert len(mock_client.batch_create_events.call_args.args[1]) == 1
+
+def test_sync_all_groups_calendars_sharing_a_target(
+    sync_engine: CalendarSyncEngine,
+    config: MultiAccountConfig,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that all source calendars are synced, serially and sharing fetches where they share a target calendar."""
+    _, mock_client = mock_account_manager
+    flow = config.sync_flows[0]
+    config.sync_flows.append(flow.model_copy(update={'name': "Shared Target", 'source_calendar_id': "work@example.com"}))
+    config.sync_flows.append(flow.model_copy(update={
+        'name': "Other Target", 'source_calendar_id': "home@example.com", 'target_calendar_id': "other@example.com"
+    }))
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        [make_event_data(f"{calendar_id}_event", 10)] if calendar_id != "target@example.com" else []
+    )
+
+    groups = sync_engine._group_by_shared_targets({(1, "source@example.com"), (1, "work@example.com"), (1, "home@example.com")})
+    assert sorted(sorted(group) for group in groups) == [
+        [(1, "home@example.com")],
+        [(1, "source@example.com"), (1, "work@example.com")]
+    ]
+
+    result = sync_engine.sync_all_source_calendars(datetime(2024, 1, 14), datetime(2024, 1, 20))
+
+    assert result.calendars_synced == 3
+    assert result.total_events_processed == 3
+    assert sorted(r.calendar_id for r in result.calendar_results) == [
+        "home@example.com", "source@example.com", "work@example.com"
+    ]
+    # The shared target calendar is fetched once, and the block created for the first
+    # calendar's event covers the identical event of the second
+    target_calls = [
+        call for call in mock_client.get_events.call_args_list
+        if call.kwargs.get('calendar_id') == "target@example.com"
+    ]
+    assert len(target_calls) == 1
+    actions = [r.action for calendar_result in result.calendar_results for r in calendar_result.results]
+    assert sorted(actions) == ['created', 'created', 'existed']
+    assert sync_engine.get_stats().busy_blocks_created == 2
+
+def test_sync_source_calendars_syncs_only_the_given_calendars(
+    sync_engine: CalendarSyncEngine,
+    config: MultiAccountConfig,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that a partial sync leaves the other source calendars alone."""
+    _, mock_client = mock_account_manager
+    config.sync_flows.append(config.sync_flows[0].model_copy(update={'source_calendar_id': "work@example.com"}))
+
+    result = sync_engine.sync_source_calendars(
+        {(1, "work@example.com")}, datetime(2024, 1, 14), datetime(2024, 1, 20), sync_type="webhook"
+    )
+
+    assert result.calendars_synced == 1
+    assert result.sync_type == "webhook"
+    assert [r.calendar_id for r in result.calendar_results] == ["work@example.com"]
+    fetched = {call.args[0] if call.args else call.kwargs['calendar_id'] for call in mock_client.get_events.call_args_list}
+    assert "source@example.com" not in fetched
+
+
+def test_bulk_sync_deletes_busy_blocks_in_one_batch(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that busy blocks of cancelled events are deleted together once the page is processed."""
+    _, mock_client = mock_account_manager
+    source_events = [
+        make_event_data('event_1', 10, status='cancelled'),
+        make_event_data('event_2', 13, status='cancelled')
+    ]
+    existing_blocks = [
+        make_event_data(f'block_{hour}', hour, title="Busy",
+                        start_time=datetime(2024, 1, 15, hour - 1, 45),
+                        end_time=datetime(2024, 1, 15, hour + 1, 15))
+        for hour in (10, 13)
+    ]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else existing_blocks
+    )
+    mock_client.batch_delete_events.return_value = [True, False]
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    mock_client.batch_delete_events.assert_called_once_with([
+        ("target@example.com", 'block_10'),
+        ("target@example.com", 'block_13')
+    ])
+    mock_client.delete_event.assert_not_called()
+    assert [r.action for r in result.results] == ['deleted', 'delete_attempted']
+    assert sync_engine.get_stats().busy_blocks_deleted == 1
+
+def test_bulk_sync_creates_busy_blocks_in_one_batch(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that busy blocks are created together once the page is processed, with failures reported."""
+    _, mock_client = mock_account_manager
+    source_events = [make_event_data('event_1', 10), make_event_data('event_2', 13)]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else []
+    )
+    mock_client.batch_create_events.side_effect = lambda calendar_id, events: [
+        {'id': 'created_1'}, GoogleCalendarError("quota exceeded")
+    ]
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    mock_client.create_event.assert_not_called()
+    calendar_id, events = mock_client.batch_create_events.call_args.args
+    assert calendar_id == "target@example.com"
+    assert [event['start_time'] for event in events] == [datetime(2024, 1, 15, 9, 45), datetime(2024, 1, 15, 12, 45)]
+    assert [(r.action, r.success) for r in result.results] == [('created', True), ('error', False)]
+    assert result.results[1].error == "quota exceeded"
+    stats = sync_engine.get_stats()
+    assert (stats.busy_blocks_created, stats.errors) == (1, 1)
+
+def test_bulk_sync_queues_one_create_per_busy_block_without_a_snapshot(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that events sharing a busy block queue it once when the target calendar prefetch fails."""
+    _, mock_client = mock_account_manager
+
+    def get_events(calendar_id, *args, **kwargs):
+        if calendar_id == "source@example.com":
+            return [make_event_data('event_1', 10), make_event_data('event_2', 10, title="Same time")]
+        raise GoogleCalendarError("target unavailable")
+
+    mock_client.get_events.side_effect = get_events
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    assert [r.action for r in result.results] == ['created', 'existed']
+    mock_client.batch_create_events.assert_called_once()
+    assert len(mock_client.batch_create_events.call_args.args[1]) == 1
+
+
+def test_bulk_sync_calculates_each_busy_block_once(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that busy block keys computed for the prefetch are reused when processing events."""
+    _, mock_client = mock_account_manager
+    source_events = [make_event_data('event_1', 10), make_event_data('event_2', 13, status='cancelled')]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else []
+    )
+
+    with patch.object(SyncFlow, 'busy_block_key', autospec=True, side_effect=SyncFlow.busy_block_key) as busy_block_key:
+        result = sync_engine.sync_calendar_events(
+            "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+        )
+
+    assert [r.action for r in result.results] == ['created', 'delete_attempted']
+    assert busy_block_key.call_count == 2
+
+def test_calendar_without_flows_is_not_processed(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that events of a calendar no flow reads are counted but not turned into models."""
+    _, mock_client = mock_account_manager
+    mock_client.get_events.return_value = [make_event_data('event_1', 10)]
+
+    with patch.object(sync_engine, '_build_calendar_events') as build_calendar_events:
+        result = sync_engine.sync_calendar_events(
+            "other@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+        )
+
+    build_calendar_events.assert_not_called()
+    assert result.error is None
+    assert result.events_found == 1
+    assert result.events_processed == 0
+    assert result.results == []
+
+def test_incremental_sync_processes_changes_and_events_entering_the_range(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that incremental syncs process changed, deleted and newly in-range events only."""
+    _, mock_client = mock_account_manager
+    later_event = make_event_data('event_2', 10, start_time=datetime(2024, 1, 24, 10), end_time=datetime(2024, 1, 24, 11))
+    mock_client.get_events_incremental.side_effect = [
+        ([make_event_data('event_1', 10), later_event], [], 'token_1', True),
+        ([], ['event_1'], 'token_2', False),
+        ([], [], 'token_3', False),
+    ]
+
+    first = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20), incremental=True
+    )
+    second = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20), incremental=True
+    )
+    third = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 20), datetime(2024, 1, 27), incremental=True
+    )
+
+    assert [(r.event_id, r.action) for r in first.results] == [('event_1', 'created')]
+    assert [(r.event_id, r.action) for r in second.results] == [('event_1', 'delete_attempted')]
+    assert [(r.event_id, r.action) for r in third.results] == [('event_2', 'created')]
+    full_listings = [call.kwargs['full_listing'] for call in mock_client.get_events_incremental.call_args_list]
+    assert full_listings == [True, False, False]
+
+
+def test_incremental_sync_retries_events_that_failed(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that an event whose busy block failed is processed again by the next incremental sync."""
+    _, mock_client = mock_account_manager
+    mock_client.get_events_incremental.side_effect = [
+        ([make_event_data('event_1', 10)], [], 'token_1', True),
+        ([], [], 'token_2', False),
+        ([], [], 'token_3', False),
+    ]
+    mock_client.batch_create_events.side_effect = [
+        [GoogleCalendarError("quota exceeded")],
+        [{'id': 'created_1'}],
+    ]
+
+    results = [
+        sync_engine.sync_calendar_events(
+            "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20), incremental=True
+        )
+        for _ in range(3)
+    ]
+
+    assert [(r.event_id, r.action) for r in results[0].results] == [('event_1', 'error')]
+    assert [(r.event_id, r.action) for r in results[1].results] == [('event_1', 'created')]
+    assert results[2].results == []
+
+
+def test_incremental_full_listing_deletes_events_missing_from_it(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that known events absent from a full listing (e.g. after an expired token) count as deleted."""
+    _, mock_client = mock_account_manager
+    mock_client.get_events_incremental.side_effect = [
+        ([make_event_data('event_1', 10), make_event_data('event_2', 13)], [], 'token_1', True),
+        ([make_event_data('event_1', 10)], [], 'token_2', True),
+    ]
+
+    sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20), incremental=True
+    )
+    second = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20), incremental=True
+    )
+
+    assert [(r.event_id, r.action) for r in second.results] == [('event_1', 'created'), ('event_2', 'delete_attempted')]
+
+
+def test_skipped_event_does_not_need_the_target_client(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that a failing target account doesn't turn events skipped without writes into errors."""
+    account_manager, _ = mock_account_manager
+    account_manager.get_client.side_effect = AccountManagerError("Authentication failed")
+    event = sync_engine._build_calendar_events(
+        [make_event_data('solo', 10, status='cancelled', participants=[], participant_count=0)],
+        "source@example.com", 1
+    )[0]
+
+    results = sync_engine.process_event(event)
+
+    assert [(r.action, r.success) for r in results] == [('skipped', True)]
+    assert sync_engine.get_stats().errors == 0
+    account_manager.get_client.assert_not_called()
+
+
+def test_criteria_mask_follows_event_criteria(sync_engine: CalendarSyncEngine) -> None:
+    """Test that the batch criteria check gives the per-event answer, with invalid events excluded."""
+    invalid_event = make_event_data('broken', 12)
+    del invalid_event['start_time']
+    calendar_events = sync_engine._build_calendar_events([
+        make_event_data('busy', 10),
+        make_event_data('tentative', 11, status='tentative'),
+        make_event_data('free', 13, transparency='transparent'),
+        make_event_data('solo', 14, participants=['a@example.com'], participant_count=1),
+        invalid_event
+    ], "source@example.com", 1)
+
+    assert sync_engine._criteria_mask(calendar_events) == [True, False, False, False, False]
+    with patch.object(CalendarSyncEngine, '_event_meets_criteria', return_value=True):
+        assert sync_engine._criteria_mask(calendar_events) == [True, True, True, True, False]
+
+
+def test_stats_survive_concurrent_updates_and_reset(sync_engine: CalendarSyncEngine) -> None:
+    """Test that counters updated from worker threads add up, and start from zero after a reset."""
+    # A cancelled single-participant event is skipped without any API calls
+    event = sync_engine._build_calendar_events(
+        [make_event_data('solo', 10, status='cancelled', participants=[], participant_count=0)],
+        "source@example.com", 1
+    )[0]
+    assert sync_engine.get_stats().events_processed == 0
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: sync_engine.process_event(event), range(1000)))
+
+    assert sync_engine.get_stats().events_processed == 1000
+    assert sync_engine.stats['events_processed'] == 1000
+
+    sync_engine.reset_stats()
+    stats = sync_engine.get_stats()
+    assert (stats.errors, stats.events_processed, stats.busy_blocks_created) == (0, 0, 0)
+
+
+def test_prefetch_handles_all_day_and_timed_events_together(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that naive all-day and timezone-aware timed events share one target prefetch."""
+    _, mock_client = mock_account_manager
+    source_events = [
+        make_event_data('all_day', 0, all_day=True, start_time=datetime(2024, 1, 15), end_time=datetime(2024, 1, 16)),
+        make_event_data('timed', 10, start_time=datetime(2024, 1, 17, 10, tzinfo=timezone.utc),
+                        end_time=datetime(2024, 1, 17, 11, tzinfo=timezone.utc))
+    ]
+    mock_client.get_events.side_effect = lambda calendar_id, *args, **kwargs: (
+        source_events if calendar_id == "source@example.com" else []
+    )
+
+    result = sync_engine.sync_calendar_events(
+        "source@example.com", 1, datetime(2024, 1, 14), datetime(2024, 1, 20)
+    )
+
+    assert result.error is None
+    assert [r.action for r in result.results] == ['created', 'created']
+    target_call = mock_client.get_events.call_args_list[-1]
+    assert target_call.kwargs['start_time'] == datetime(2024, 1, 14, 20, tzinfo=timezone.utc)
+    assert target_call.kwargs['end_time'] == datetime(2024, 1, 17, 15, 15, tzinfo=timezone.utc)
+
+
+def test_concurrent_passes_on_one_calendar_create_one_busy_block(
+    sync_engine: CalendarSyncEngine,
+    mock_account_manager: Tuple[MagicMock, MagicMock]
+) -> None:
+    """Test that sync passes started from different threads don't both create the same block."""
+    _, mock_client = mock_account_manager
+    target_events = []
+    target_lock = threading.Lock()
+
+    def get_events(calendar_id, *args, **kwargs):
+        if calendar_id == "source@example.com":
+            return [make_event_data('event_1', 10)]
+        with target_lock:
+            return list(target_events)
+
+    def batch_create_events(calendar_id, events):
+        # Slow writes widen the window in which an unguarded second pass sees no block
+        time.sleep(0.05)
+        created = [{'id': f"created_{len(target_events) + index}", **event} for index, event in enumerate(events)]
+        with target_lock:
+            target_events.extend(created)
+        return created
+
+    mock_client.get_events.side_effect = get_events
+    mock_client.batch_create_events.side_effect = batch_create_events
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(sync_engine.sync_calendar_events, "source@example.com", 1,
+                            datetime(2024, 1, 14), datetime(2024, 1, 20)),
+            executor.submit(sync_engine.sync_source_calendars, {(1, "source@example.com")},
+                            datetime(2024, 1, 14), datetime(2024, 1, 20))
+        ]
+        for future in futures:
+            future.result()
+
+    assert len(target_events) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
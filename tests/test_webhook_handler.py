@@ -0,0 +1,298 @@
+"""
+Test GoogleCalendarWebhookHandler notification handling.
+
+The sync engine and account manager are mocked, so no real Google API
+calls are made.
+"""
+# type: ignore
+
+import asyncio
+import pytest
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+from backend.models.google_account import GoogleAccount
+from backend.models.calendar import SyncFlow, MultiAccountConfig
+from backend.services.google_calendar.webhook_handler import GoogleCalendarWebhookHandler, _now_iso
+
+
+@pytest.fixture
+def config() -> MultiAccountConfig:
+    """Test configuration with one flow."""
+    return MultiAccountConfig(
+        accounts=[
+            GoogleAccount(
+                account_id=1,
+                email="test@example.com",
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+                refresh_token="test_refresh_token"
+            )
+        ],
+        sync_flows=[
+            SyncFlow(
+                name="Test Flow",
+                source_account_id=1,
+                source_calendar_id="source@example.com",
+                target_account_id=1,
+                target_calendar_id="target@example.com",
+                start_offset=-15,
+                end_offset=15
+            )
+        ]
+    )
+
+
+def make_webhook_data(calendar_id: str = "source@example.com", resource_state: str = "update") -> Dict[str, Any]:
+    """Build a webhook payload as posted to the webhook endpoint."""
+    return {
+        'resourceId': calendar_id,
+        'channelId': "test-channel",
+        'resourceState': resource_state
+    }
+
+
+def test_inline_sync_returns_processed_events(config: MultiAccountConfig) -> None:
+    """Test that without debouncing the calendar is synced during handle_webhook."""
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.return_value.events_processed = 3
+    sync_engine.sync_calendar_events.return_value.error = None
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    result = handler.handle_webhook(make_webhook_data())
+
+    assert result.success is True
+    assert result.processed_events == 3
+    sync_engine.sync_calendar_events.assert_called_once()
+    sync_kwargs = sync_engine.sync_calendar_events.call_args.kwargs
+    assert sync_kwargs['sync_type'] == "webhook"
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    assert sync_kwargs['start_date'] == today - timedelta(days=1)
+    assert sync_kwargs['end_date'] == today.replace(hour=23, minute=59, second=59, microsecond=999999) + timedelta(days=7)
+
+
+def test_notification_burst_is_coalesced_into_one_sync(config: MultiAccountConfig) -> None:
+    """Test that rapid notifications for one calendar result in a single deferred sync."""
+    synced = threading.Event()
+    sync_engine = MagicMock()
+    sync_engine.sync_source_calendars.side_effect = lambda *args, **kwargs: synced.set() or MagicMock()
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0.2)
+
+    results = [handler.handle_webhook(make_webhook_data()) for _ in range(5)]
+
+    assert all(result.success and result.processed_events == 0 for result in results)
+    sync_engine.sync_source_calendars.assert_not_called()
+
+    flush_timer = handler._flush_timer
+    assert synced.wait(timeout=5)
+    flush_timer.join(timeout=5)
+    sync_engine.sync_source_calendars.assert_called_once()
+    assert sync_engine.sync_source_calendars.call_args.args[0] == {(1, "source@example.com")}
+    sync_engine.sync_calendar_events.assert_not_called()
+    assert handler._pending == {} and handler._flush_timer is None
+
+
+def test_batch_syncs_each_notified_calendar_once(config: MultiAccountConfig) -> None:
+    """Test that one flush syncs every calendar notified during the batch window, once each."""
+    config.sync_flows.append(config.sync_flows[0].model_copy(update={'source_calendar_id': "other@example.com"}))
+    sync_engine = MagicMock()
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=60)
+
+    for calendar_id in ["source@example.com", "other@example.com", "source@example.com"]:
+        handler.handle_webhook(make_webhook_data(calendar_id))
+    handler._flush_timer.cancel()
+    handler._flush_pending_syncs()
+
+    sync_engine.sync_source_calendars.assert_called_once()
+    calendars = sync_engine.sync_source_calendars.call_args.args[0]
+    assert calendars == {(1, "source@example.com"), (1, "other@example.com")}
+    assert sync_engine.sync_source_calendars.call_args.kwargs['sync_type'] == "webhook"
+    assert handler._flush_timer is None
+
+
+def test_async_handling_runs_off_the_event_loop_thread(config: MultiAccountConfig) -> None:
+    """Test that an inline sync started from the event loop runs in a worker thread."""
+    sync_threads = []
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.side_effect = (
+        lambda **kwargs: sync_threads.append(threading.current_thread())
+        or MagicMock(events_processed=0, results=[], error=None)
+    )
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    result = asyncio.run(handler.handle_webhook_async(make_webhook_data()))
+
+    assert result.success is True
+    assert sync_threads and sync_threads[0] is not threading.main_thread()
+
+
+def test_monitored_calendars_are_cached_until_flows_change(config: MultiAccountConfig) -> None:
+    """Test that monitored calendars are built once and rebuilt when flows are added."""
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), MagicMock())
+
+    first = handler.get_monitored_calendars()
+    assert [calendar.calendar_id for calendar in first] == ["source@example.com"]
+    assert first[0].account_email == "test@example.com"
+    assert handler.get_monitored_calendars()[0] is first[0]
+
+    config.sync_flows.append(config.sync_flows[0].model_copy(update={'source_calendar_id': "other@example.com"}))
+    monitored = handler.get_monitored_calendars()
+    assert [calendar.calendar_id for calendar in monitored] == ["source@example.com", "other@example.com"]
+
+
+def test_unknown_calendar_is_rejected_before_validation(config: MultiAccountConfig) -> None:
+    """Test that notifications for unmonitored calendars fail fast, even when incomplete."""
+    sync_engine = MagicMock()
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    result = handler.handle_webhook({'resourceId': "unknown@example.com"})
+
+    assert result.success is False
+    assert result.error == "No account found for calendar unknown@example.com"
+    assert handler.handle_webhook({'invalid': "data"}).error == "Invalid webhook data format"
+    sync_engine.sync_calendar_events.assert_not_called()
+
+    # The calendar mapping is read-only, so calendars can't be added behind the handler's back
+    with pytest.raises(TypeError):
+        handler.calendar_to_account["unknown@example.com"] = 1
+
+
+def test_result_timestamps_are_formatted_to_the_second(config: MultiAccountConfig) -> None:
+    """Test that result timestamps are valid second-precision ISO strings."""
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), MagicMock())
+
+    result = handler.handle_webhook(make_webhook_data(resource_state="exists"))
+
+    timestamp = datetime.fromisoformat(result.timestamp)
+    assert timestamp.microsecond == 0
+    assert abs((datetime.now() - timestamp).total_seconds()) < 5
+
+    with patch('backend.services.google_calendar.webhook_handler.time.time', return_value=1700000000.5):
+        assert _now_iso() is _now_iso()
+        assert _now_iso() == datetime.fromtimestamp(1700000000).isoformat()
+
+
+def test_resource_states_are_dispatched(config: MultiAccountConfig) -> None:
+    """Test that 'exists' needs no sync and unknown states are rejected."""
+    sync_engine = MagicMock()
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    exists_result = handler.handle_webhook(make_webhook_data(resource_state="exists"))
+    unknown_result = handler.handle_webhook(make_webhook_data(resource_state="not_exists"))
+
+    assert exists_result.success is True and exists_result.processed_events == 0
+    assert unknown_result.success is False
+    assert unknown_result.error == "Unknown resource state: not_exists"
+    sync_engine.sync_calendar_events.assert_not_called()
+
+
+def test_unknown_calendar_is_logged_once_per_interval(
+    config: MultiAccountConfig,
+    caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that repeated notifications for an unmonitored calendar are logged only once."""
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), MagicMock())
+
+    with caplog.at_level("WARNING"):
+        for _ in range(3):
+            result = handler.handle_webhook(make_webhook_data("unknown@example.com"))
+        handler.handle_webhook(make_webhook_data("other-unknown@example.com"))
+
+    assert result.error == "No account found for calendar unknown@example.com"
+    rejected = [record.getMessage() for record in caplog.records if "unmonitored calendar" in record.getMessage()]
+    assert rejected == [
+        "Rejected webhook for unmonitored calendar unknown@example.com",
+        "Rejected webhook for unmonitored calendar other-unknown@example.com"
+    ]
+
+
+def test_sync_notification_for_recently_synced_calendar_is_skipped(config: MultiAccountConfig) -> None:
+    """Test that a repeated 'sync' is skipped after a successful sync, while 'update' always syncs."""
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.return_value = MagicMock(events_processed=0, results=[], error=None)
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    handler.handle_webhook(make_webhook_data(resource_state="sync"))
+    skipped = handler.handle_webhook(make_webhook_data(resource_state="sync"))
+    handler.handle_webhook(make_webhook_data(resource_state="update"))
+
+    assert skipped.success is True and skipped.processed_events == 0
+    assert sync_engine.sync_calendar_events.call_count == 2
+
+
+def test_sync_notification_after_failed_sync_is_not_skipped(config: MultiAccountConfig) -> None:
+    """Test that only successful syncs let later 'sync' notifications be skipped."""
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.return_value = MagicMock(events_processed=0, results=[], error="boom")
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=0)
+
+    handler.handle_webhook(make_webhook_data(resource_state="sync"))
+    handler.handle_webhook(make_webhook_data(resource_state="sync"))
+
+    assert sync_engine.sync_calendar_events.call_count == 2
+
+
+def test_notification_during_flush_waits_for_the_next_batch(config: MultiAccountConfig) -> None:
+    """Test that a notification arriving mid-flush re-arms the timer instead of flushing concurrently."""
+    sync_engine = MagicMock()
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=60)
+
+    timers_during_sync = []
+
+    def notify_during_sync(*args, **kwargs):
+        handler.handle_webhook(make_webhook_data())
+        timers_during_sync.append(handler._flush_timer)
+        return MagicMock()
+
+    sync_engine.sync_source_calendars.side_effect = notify_during_sync
+    handler.handle_webhook(make_webhook_data())
+    first_timer = handler._flush_timer
+    first_timer.cancel()
+    handler._flush_pending_syncs()
+
+    # Still flushing, so the notification did not start a second timer
+    assert timers_during_sync == [first_timer]
+    next_timer = handler._flush_timer
+    assert next_timer is not None and next_timer is not first_timer
+    assert handler._pending == {("source@example.com", 1): None}
+    next_timer.cancel()
+
+
+
+def test_notifications_are_synced_inline_by_default(config: MultiAccountConfig) -> None:
+    """Test that batching is opt-in, so handle_webhook reports the sync it ran."""
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.return_value = MagicMock(events_processed=2, results=[], error="boom")
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine)
+
+    result = handler.handle_webhook(make_webhook_data())
+
+    assert (result.processed_events, result.error) == (2, "boom")
+    assert handler._flush_timer is None
+
+
+def test_close_syncs_queued_calendars(config: MultiAccountConfig) -> None:
+    """Test that closing cancels the batch timer and syncs what is queued, once."""
+    sync_engine = MagicMock()
+    sync_engine.sync_calendar_events.return_value = MagicMock(events_processed=0, results=[], error=None)
+    handler = GoogleCalendarWebhookHandler(config, MagicMock(), sync_engine, debounce_seconds=60)
+    handler.handle_webhook(make_webhook_data())
+    flush_timer = handler._flush_timer
+
+    handler.close()
+
+    assert flush_timer.finished.is_set() and not flush_timer.is_alive()
+    sync_engine.sync_source_calendars.assert_called_once()
+    assert sync_engine.sync_source_calendars.call_args.args[0] == {(1, "source@example.com")}
+    assert handler._pending == {} and handler._flush_timer is None
+
+    # Later notifications are synced right away
+    handler.handle_webhook(make_webhook_data(resource_state="update"))
+    sync_engine.sync_calendar_events.assert_called_once()
+    assert handler._flush_timer is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])